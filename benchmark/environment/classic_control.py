@@ -0,0 +1,65 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the vectorized classic control environments against the Gym environments in one process.
+"""
+
+#pylint: disable=W0212
+import argparse
+import time
+import numpy as np
+from mindspore_rl.environment import GymEnvironment, CartPoleEnvironment
+
+parser = argparse.ArgumentParser(description='Vectorized classic control environments benchmark')
+parser.add_argument('--num_envs', type=int, nargs='+', default=[16, 256, 4096], help='numbers of environments.')
+parser.add_argument('--steps', type=int, default=200, help='number of timed steps.')
+options, _ = parser.parse_known_args()
+
+
+def bench_gym(num_envs):
+    """Measure the environment steps per second of the Gym CartPole stepped one by one."""
+    envs = [GymEnvironment({'name': 'CartPole-v0', 'seed': 42, 'auto_reset': True}, i) for i in range(num_envs)]
+    for env in envs:
+        env._reset()
+    actions = np.random.randint(0, 2, (options.steps, num_envs)).astype(np.int32)
+    start = time.time()
+    for step_actions in actions:
+        for env, action in zip(envs, step_actions):
+            env._step(action)
+    return options.steps * num_envs / (time.time() - start)
+
+
+def bench_vectorized(num_envs):
+    """Measure the environment steps per second of the vectorized CartPole."""
+    env = CartPoleEnvironment(environment_num=num_envs)
+    env._reset()
+    actions = np.random.randint(0, 2, (options.steps, num_envs)).astype(np.int32)
+    start = time.time()
+    for step_actions in actions:
+        env._step(step_actions)
+    return options.steps * num_envs / (time.time() - start)
+
+
+def main():
+    """Benchmark entry."""
+    for num_envs in options.num_envs:
+        gym_speed = bench_gym(num_envs)
+        vectorized_speed = bench_vectorized(num_envs)
+        print(f"{num_envs:>5} envs: gym {gym_speed:12.0f} steps/s, vectorized {vectorized_speed:12.0f} steps/s, "
+              f"speedup {vectorized_speed / gym_speed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
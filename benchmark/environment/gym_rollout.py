@@ -0,0 +1,97 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the PyFunc calls saved by the multi-step rollout of GymEnvironment.
+"""
+
+#pylint: disable=W0212
+import argparse
+import time
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore import context, Tensor
+from mindspore_rl.environment import GymEnvironment
+
+parser = argparse.ArgumentParser(description='GymEnvironment rollout benchmark')
+parser.add_argument('--env', type=str, default='CartPole-v0', help='name of the gym environment.')
+parser.add_argument('--steps', type=int, default=1000, help='steps per rollout.')
+parser.add_argument('--rollouts', type=int, default=10, help='number of timed rollouts.')
+parser.add_argument('--device_target', type=str, default='CPU', choices=['Ascend', 'CPU', 'GPU'],
+                    help='Choose a device to run the benchmark(Default: CPU).')
+options, _ = parser.parse_known_args()
+
+LAYER_SIZES = [4, 64, 2]
+
+
+class StepLoopNet(nn.Cell):
+    """Step the environment once per PyFunc call with the same MLP policy in the graph."""
+
+    def __init__(self, env, steps):
+        super().__init__()
+        self.env = env
+        self.steps = steps
+        self.policy = nn.SequentialCell([nn.Dense(LAYER_SIZES[0], LAYER_SIZES[1], activation='tanh'),
+                                         nn.Dense(LAYER_SIZES[1], LAYER_SIZES[2])])
+        self.argmax = ms.ops.Argmax()
+        self.expand_dims = ms.ops.ExpandDims()
+
+    def construct(self, state):
+        total = 0.
+        i = 0
+        while i < self.steps:
+            action = self.argmax(self.policy(self.expand_dims(state, 0)))[0]
+            state, reward, _ = self.env.step(action)
+            total += reward[0]
+            i += 1
+        return total
+
+
+class RolloutNet(nn.Cell):
+    """Run all the steps in one PyFunc call."""
+
+    def __init__(self, env):
+        super().__init__()
+        self.env = env
+
+    def construct(self, policy_params):
+        return self.env.rollout(policy_params)[2].sum()
+
+
+def main():
+    """Benchmark entry."""
+    context.set_context(mode=context.GRAPH_MODE, device_target=options.device_target)
+    params = {'name': options.env, 'seed': 42, 'auto_reset': True}
+    step_env = GymEnvironment(params)
+    rollout_env = GymEnvironment(dict(params, rollout_steps=options.steps,
+                                      rollout_policy={'layer_sizes': LAYER_SIZES}))
+    step_net = StepLoopNet(step_env, options.steps)
+    rollout_net = RolloutNet(rollout_env)
+    policy_params = Tensor(np.random.randn(rollout_env._rollout_policy.num_params).astype(np.float32))
+    state = step_env.reset()
+
+    results = {}
+    for name, run in [('step', lambda: step_net(state)), ('rollout', lambda: rollout_net(policy_params))]:
+        run()
+        start = time.time()
+        for _ in range(options.rollouts):
+            run().asnumpy()
+        results[name] = (time.time() - start) * 1e3 / options.rollouts
+        print(f"{name:>8}: {results[name]:.3f} ms per {options.steps} steps")
+    print(f"rollout speedup {results['step'] / results['rollout']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
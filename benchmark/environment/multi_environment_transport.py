@@ -0,0 +1,78 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the queue and shared memory transports of MultiEnvironmentWrapper.
+"""
+
+#pylint: disable=W0212
+import argparse
+import time
+import numpy as np
+from mindspore_rl.environment import MultiEnvironmentWrapper, Space
+
+parser = argparse.ArgumentParser(description='MultiEnvironmentWrapper transport benchmark')
+parser.add_argument('--num_envs', type=int, nargs='+', default=[8, 32, 128], help='numbers of environments.')
+parser.add_argument('--num_proc', type=int, default=4, help='number of environment processes.')
+parser.add_argument('--obs_dim', type=int, default=17, help='dimension of the observations.')
+parser.add_argument('--steps', type=int, default=1000, help='number of timed steps.')
+options, _ = parser.parse_known_args()
+
+
+class ConstantEnvironment:
+    """The environment whose step costs nothing, so that only the transport is measured."""
+
+    def __init__(self, obs_dim):
+        self.observation_space = Space((obs_dim,), np.float32)
+        self.action_space = Space((6,), np.float32)
+        self.reward_space = Space((1,), np.float32)
+        self.done_space = Space((1,), np.bool_, low=0, high=2)
+        self.config = {}
+        self._obs = np.zeros((obs_dim,), np.float32)
+
+    def _reset(self):
+        return self._obs
+
+    def _step(self, action):
+        return self._obs + action[0], np.float32(1), np.bool_(False)
+
+
+def bench(num_envs, transport):
+    """Measure the mean step time of the wrapper."""
+    wrapper = MultiEnvironmentWrapper([ConstantEnvironment(options.obs_dim) for _ in range(num_envs)],
+                                      options.num_proc, transport)
+    actions = np.random.randn(num_envs, 6).astype(np.float32)
+    wrapper._reset()
+    for _ in range(10):
+        wrapper._step(actions)
+    start = time.time()
+    for _ in range(options.steps):
+        wrapper._step(actions)
+    step_time = (time.time() - start) * 1e6 / options.steps
+    for env_proc in wrapper.mpe_env_procs:
+        env_proc.terminate()
+    return step_time
+
+
+def main():
+    """Benchmark entry."""
+    for num_envs in options.num_envs:
+        queue_time = bench(num_envs, 'queue')
+        shared_time = bench(num_envs, 'shared_memory')
+        print(f"{num_envs:>4} envs: queue {queue_time:8.1f} us, shared_memory {shared_time:8.1f} us, "
+              f"speedup {queue_time / shared_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the iterations per second of the tree-parallel MCTS against the number of threads on Tic-Tac-Toe.
+"""
+
+import argparse
+import time
+import mindspore as ms
+from mindspore import GRAPH_MODE, context
+from mindspore import Tensor
+from mindspore_rl.environment import TicTacToeEnvironment
+from mindspore_rl.utils.mcts import MCTS, VanillaFunc
+from mindspore_rl.utils.mcts.mcts import VANILLA, COMMON, TIC_TAC_TOE
+
+parser = argparse.ArgumentParser(description='Tree-parallel MCTS benchmark')
+parser.add_argument('--num_threads', type=int, nargs='+', default=[1, 2, 4, 8], help='numbers of threads.')
+parser.add_argument('--iterations', type=int, default=100000, help='number of iterations of each search.')
+parser.add_argument('--repeats', type=int, default=5, help='number of timed searches.')
+parser.add_argument('--uct', type=float, default=2.0, help='the UCT constant.')
+options, _ = parser.parse_known_args()
+
+
+def bench(num_threads):
+    """Measure the iterations per second of searching the empty board by the threads."""
+    env = TicTacToeEnvironment(None)
+    mcts = MCTS(env, COMMON, VANILLA, -1, options.iterations, env.observation_space.shape, VanillaFunc(env),
+                TIC_TAC_TOE, num_threads)
+    uct = Tensor(options.uct, ms.float32)
+    # The first search compiles the graph.
+    mcts.mcts_parallel_search(uct)
+    start = time.time()
+    for _ in range(options.repeats):
+        action = mcts.mcts_parallel_search(uct)
+    elapsed = time.time() - start
+    return options.iterations * options.repeats / elapsed, int(action.asnumpy()[0])
+
+
+def main():
+    context.set_context(mode=GRAPH_MODE, device_target="CPU")
+    base = None
+    for num_threads in options.num_threads:
+        rate, action = bench(num_threads)
+        base = base or rate
+        print(f"threads {num_threads:3d}: {rate:12.0f} iterations/s, speedup {rate / base:5.2f}x, "
+              f"best action {action}")
+
+
+if __name__ == "__main__":
+    main()
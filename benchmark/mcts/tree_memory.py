@@ -0,0 +1,66 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the nodes created per second and the bytes per node of the MCTS tree on Tic-Tac-Toe.
+"""
+
+import argparse
+import time
+import mindspore as ms
+from mindspore import GRAPH_MODE, context
+from mindspore import Tensor
+from mindspore_rl.environment import TicTacToeEnvironment
+from mindspore_rl.utils.mcts import MCTS, VanillaFunc
+from mindspore_rl.utils.mcts.mcts import VANILLA, COMMON, TIC_TAC_TOE
+
+parser = argparse.ArgumentParser(description='MCTS tree memory benchmark')
+parser.add_argument('--iterations', type=int, nargs='+', default=[10000, 100000, 1000000],
+                    help='numbers of iterations of each search.')
+parser.add_argument('--num_threads', type=int, default=1, help='number of threads.')
+parser.add_argument('--uct', type=float, default=2.0, help='the UCT constant.')
+options, _ = parser.parse_known_args()
+
+
+def bench(iterations):
+    """Measure the nodes per second and the bytes per node of searching the empty board."""
+    env = TicTacToeEnvironment(None)
+    env.reset()
+    mcts = MCTS(env, COMMON, VANILLA, -1, iterations, env.observation_space.shape, VanillaFunc(env),
+                TIC_TAC_TOE, options.num_threads)
+    uct = Tensor(options.uct, ms.float32)
+    # Search a throwaway tree first, so that the compilation of the graphs is not timed.
+    tree_handle = mcts.create_tree(uct)
+    mcts.search_tree(tree_handle).asnumpy()
+    mcts.tree_memory(tree_handle).asnumpy()
+    mcts.release_tree(tree_handle)
+    tree_handle = mcts.create_tree(uct)
+    start = time.time()
+    mcts.search_tree(tree_handle).asnumpy()
+    elapsed = time.time() - start
+    num_nodes, num_bytes = mcts.tree_memory(tree_handle).asnumpy().tolist()
+    mcts.release_tree(tree_handle)
+    return num_nodes, num_nodes / elapsed, num_bytes / max(num_nodes, 1)
+
+
+def main():
+    context.set_context(mode=GRAPH_MODE, device_target="CPU")
+    for iterations in options.iterations:
+        num_nodes, rate, bytes_per_node = bench(iterations)
+        print(f"iterations {iterations:8d}: {num_nodes:8d} nodes, {rate:12.0f} nodes/s, "
+              f"{bytes_per_node:6.1f} bytes/node")
+
+
+if __name__ == "__main__":
+    main()
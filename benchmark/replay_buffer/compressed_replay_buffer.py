@@ -0,0 +1,126 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Memory and throughput benchmark of CompressedReplayBuffer against the ReplayBuffer.
+"""
+
+import argparse
+import time
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore import context, Tensor
+from mindspore_rl.core import ReplayBuffer, CompressedReplayBuffer
+
+parser = argparse.ArgumentParser(description='CompressedReplayBuffer benchmark')
+parser.add_argument('--capacity', type=int, default=20000, help='capacity of the replay buffer.')
+parser.add_argument('--samples', type=int, default=1000, help='number of timed samplings.')
+parser.add_argument('--batch_size', type=int, default=64, help='sample size.')
+parser.add_argument('--episode_length', type=int, default=200, help='length of the generated episodes.')
+parser.add_argument('--compression', type=str, default=None, choices=['uint8', 'lz4'],
+                    help='compression of the frames(Default: None).')
+parser.add_argument('--device_target', type=str, default='CPU', choices=['Ascend', 'CPU', 'GPU'],
+                    help='Choose a device to run the benchmark(Default: CPU).')
+options, _ = parser.parse_known_args()
+
+
+class InsertNet(nn.Cell):
+    """Insert one transition."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def construct(self, state, action, reward, next_state):
+        return self.buffer.insert([state, action, reward, next_state])
+
+
+class SampleNet(nn.Cell):
+    """Sample a batch of transitions."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def construct(self):
+        return self.buffer.sample()
+
+
+def transitions(state_shape, state_type, frame_stack, num):
+    """Generate the transitions of episodes, the new state of a step is the state of the next step."""
+    def observation():
+        if frame_stack > 1:
+            return np.random.randint(0, 255, state_shape[1:]).astype(state_type)
+        return np.random.randn(*state_shape).astype(state_type)
+
+    state = None
+    for step in range(num):
+        if step % options.episode_length == 0:
+            state = np.stack([observation()] * frame_stack) if frame_stack > 1 else observation()
+        if frame_stack > 1:
+            next_state = np.concatenate([state[1:], observation()[None]])
+        else:
+            next_state = observation()
+        yield [Tensor(state), Tensor([step % 4], ms.int32), Tensor([1.], ms.float32), Tensor(next_state)]
+        state = next_state
+
+
+def bench(name, buffer, data):
+    """Measure the insert and sample throughput of the buffer."""
+    insert_net = InsertNet(buffer)
+    sample_net = SampleNet(buffer)
+    start = time.time()
+    for transition in data:
+        insert_net(*transition)
+    insert_time = time.time() - start
+
+    sample_net()
+    start = time.time()
+    for _ in range(options.samples):
+        sample_net()
+    sample_time = time.time() - start
+    print(f"{name:>24}: insert {len(data) / insert_time:10.0f} transitions/s, "
+          f"sample {options.samples * options.batch_size / sample_time:10.0f} transitions/s")
+    return buffer
+
+
+def main():
+    """Benchmark entry."""
+    context.set_context(mode=context.GRAPH_MODE, device_target=options.device_target)
+    cases = [('CartPole', (4,), ms.float32, 1),
+             ('HalfCheetah', (17,), ms.float32, 1),
+             ('Atari 4x84x84', (4, 84, 84), ms.uint8, 4)]
+    for name, state_shape, state_type, frame_stack in cases:
+        shapes = [state_shape, (1,), (1,), state_shape]
+        types = [state_type, ms.int32, ms.float32, state_type]
+        np_type = ms.dtype_to_nptype(state_type)
+        data = list(transitions(state_shape, np_type, frame_stack, options.capacity))
+        column_bytes = options.capacity * 8
+        raw_bytes = options.capacity * 2 * np.prod(state_shape) * np.dtype(np_type).itemsize + column_bytes
+
+        print(f"{name}, capacity {options.capacity}")
+        bench('ReplayBuffer', ReplayBuffer(options.batch_size, options.capacity, shapes, types), data)
+        compression = options.compression if frame_stack > 1 else None
+        buffer = bench('CompressedReplayBuffer', CompressedReplayBuffer(
+            options.batch_size, options.capacity, shapes, types, frame_stack=frame_stack,
+            compression=compression), data)
+        nbytes = buffer.nbytes()
+        print(f"{'memory':>24}: {raw_bytes / 1024 ** 2:.1f} MB -> {nbytes / 1024 ** 2:.1f} MB, "
+              f"{raw_bytes / nbytes:.2f}x reduction, observations "
+              f"{(raw_bytes - column_bytes) / (nbytes - column_bytes):.2f}x reduction")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of HostPriorityReplayBuffer against the native PriorityReplayBuffer at several capacities.
+"""
+
+import argparse
+import time
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore import context, Tensor
+from mindspore_rl.core import PriorityReplayBuffer, HostPriorityReplayBuffer
+
+parser = argparse.ArgumentParser(description='HostPriorityReplayBuffer benchmark')
+parser.add_argument('--capacities', type=int, nargs='+', default=[100000, 1000000, 10000000],
+                    help='capacities of the replay buffer.')
+parser.add_argument('--fill', type=int, default=10000, help='number of transitions pushed before timing.')
+parser.add_argument('--steps', type=int, default=1000, help='number of timed push/sample/update steps.')
+parser.add_argument('--batch_size', type=int, default=64, help='sample size.')
+parser.add_argument('--skip_native', action='store_true', help='skip the native PriorityReplayBuffer.')
+parser.add_argument('--device_target', type=str, default='CPU', choices=['Ascend', 'CPU', 'GPU'],
+                    help='Choose a device to run the benchmark(Default: CPU).')
+options, _ = parser.parse_known_args()
+
+
+class PushNet(nn.Cell):
+    """Push one transition."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def construct(self, state, action, reward, next_state):
+        return self.buffer.push(state, action, reward, next_state)
+
+
+class SampleUpdateNet(nn.Cell):
+    """Sample a batch and update the priorities of the batch, as a DQN learner step does."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def construct(self, priorities):
+        indices, weights, _, _, _, _ = self.buffer.sample()
+        self.buffer.update_priorities(indices, priorities)
+        return weights
+
+
+def bench(name, buffer, transition, priorities):
+    """Measure the push and sample/update time of the buffer."""
+    push_net = PushNet(buffer)
+    sample_update_net = SampleUpdateNet(buffer)
+    for _ in range(options.fill):
+        push_net(*transition)
+
+    start = time.time()
+    for _ in range(options.steps):
+        push_net(*transition)
+    push_time = time.time() - start
+
+    sample_update_net(priorities)
+    start = time.time()
+    for _ in range(options.steps):
+        sample_update_net(priorities)
+    sample_update_time = time.time() - start
+    print(f"{name:>26}: push {push_time * 1e6 / options.steps:8.1f} us, "
+          f"sample+update {sample_update_time * 1e6 / options.steps:8.1f} us")
+    buffer.destroy()
+
+
+def main():
+    """Benchmark entry."""
+    context.set_context(mode=context.GRAPH_MODE, device_target=options.device_target)
+    shapes = [(4,), (1,), (1,), (4,)]
+    types = [ms.float32, ms.int32, ms.float32, ms.float32]
+    transition = [Tensor(np.random.randn(4).astype(np.float32)), Tensor([1], ms.int32),
+                  Tensor([1.], ms.float32), Tensor(np.random.randn(4).astype(np.float32))]
+    priorities = Tensor(np.random.rand(options.batch_size).astype(np.float32))
+
+    for capacity in options.capacities:
+        print(f"capacity {capacity}")
+        if not options.skip_native:
+            bench('PriorityReplayBuffer', PriorityReplayBuffer(
+                0.6, 0.4, capacity, options.batch_size, shapes, types, seed0=0, seed1=1), transition, priorities)
+        bench('HostPriorityReplayBuffer', HostPriorityReplayBuffer(
+            0.6, 0.4, capacity, options.batch_size, shapes, types, seed0=0, seed1=1), transition, priorities)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of ReplayBuffer insertion: N single inserts versus one batched insert.
+"""
+
+import argparse
+import time
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore import context, Tensor
+from mindspore_rl.core import ReplayBuffer
+
+parser = argparse.ArgumentParser(description='ReplayBuffer insert_batch benchmark')
+parser.add_argument('--num_envs', type=int, default=30, help='number of transitions inserted per step.')
+parser.add_argument('--steps', type=int, default=1000, help='number of environment steps.')
+parser.add_argument('--capacity', type=int, default=100000, help='capacity of the replay buffer.')
+parser.add_argument('--device_target', type=str, default='CPU', choices=['Ascend', 'CPU', 'GPU'],
+                    help='Choose a device to run the benchmark(Default: CPU).')
+options, _ = parser.parse_known_args()
+
+
+class SingleInsert(nn.Cell):
+    """Insert the transitions of all environments one by one."""
+
+    def __init__(self, buffer, num_envs):
+        super().__init__()
+        self.buffer = buffer
+        self.num_envs = num_envs
+
+    def construct(self, state, action, reward, next_state):
+        i = 0
+        while i < self.num_envs:
+            self.buffer.insert([state[i], action[i], reward[i], next_state[i]])
+            i += 1
+        return self.buffer.count
+
+
+class BatchInsert(nn.Cell):
+    """Insert the transitions of all environments in one call."""
+
+    def __init__(self, buffer, num_envs):
+        super().__init__()
+        self.buffer = buffer
+        self.num_envs = num_envs
+
+    def construct(self, state, action, reward, next_state):
+        self.buffer.insert_batch([state, action, reward, next_state], self.num_envs)
+        return self.buffer.count
+
+
+def run(net, inputs, steps):
+    """Run the insertion net and return the elapsed seconds."""
+    net(*inputs)
+    start = time.time()
+    for _ in range(steps):
+        net(*inputs)
+    return time.time() - start
+
+
+def main():
+    """Benchmark entry."""
+    context.set_context(mode=context.GRAPH_MODE, device_target=options.device_target)
+    shapes = [(17,), (6,), (1,), (17,)]
+    types = [ms.float32, ms.float32, ms.float32, ms.float32]
+    inputs = [Tensor(np.random.randn(options.num_envs, *shape).astype(np.float32)) for shape in shapes]
+
+    single = SingleInsert(ReplayBuffer(64, options.capacity, shapes, types), options.num_envs)
+    batch = BatchInsert(ReplayBuffer(64, options.capacity, shapes, types), options.num_envs)
+    single_time = run(single, inputs, options.steps)
+    batch_time = run(batch, inputs, options.steps)
+
+    transitions = options.num_envs * options.steps
+    print(f"{options.num_envs} single inserts: {single_time * 1e3 / options.steps:.3f} ms/step, "
+          f"{transitions / single_time:.0f} transitions/s")
+    print(f"1 batched insert:   {batch_time * 1e3 / options.steps:.3f} ms/step, "
+          f"{transitions / batch_time:.0f} transitions/s")
+    print(f"speedup: {single_time / batch_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Throughput benchmark of MmapReplayBuffer against the in-memory ReplayBuffer.
+"""
+
+import argparse
+import time
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore import context, Tensor
+from mindspore_rl.core import ReplayBuffer, MmapReplayBuffer
+
+parser = argparse.ArgumentParser(description='MmapReplayBuffer benchmark')
+parser.add_argument('--capacity', type=int, default=1000000, help='capacity of the replay buffer.')
+parser.add_argument('--inserts', type=int, default=20000, help='number of timed insertions.')
+parser.add_argument('--samples', type=int, default=2000, help='number of timed samplings.')
+parser.add_argument('--batch_size', type=int, default=64, help='sample size.')
+parser.add_argument('--hot_size', type=int, default=4096, help='hot window of MmapReplayBuffer.')
+parser.add_argument('--directory', type=str, default=None, help='directory of the memory-mapped files.')
+parser.add_argument('--device_target', type=str, default='CPU', choices=['Ascend', 'CPU', 'GPU'],
+                    help='Choose a device to run the benchmark(Default: CPU).')
+options, _ = parser.parse_known_args()
+
+
+class InsertNet(nn.Cell):
+    """Insert one transition."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def construct(self, state, action, reward, next_state):
+        return self.buffer.insert([state, action, reward, next_state])
+
+
+class SampleNet(nn.Cell):
+    """Sample a batch of transitions."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def construct(self):
+        return self.buffer.sample()
+
+
+def bench(name, buffer, transition):
+    """Measure the insert and sample throughput of the buffer."""
+    insert_net = InsertNet(buffer)
+    sample_net = SampleNet(buffer)
+    insert_net(*transition)
+
+    start = time.time()
+    for _ in range(options.inserts):
+        insert_net(*transition)
+    insert_time = time.time() - start
+
+    sample_net()
+    start = time.time()
+    for _ in range(options.samples):
+        sample_net()
+    sample_time = time.time() - start
+    print(f"{name:>16}: insert {options.inserts / insert_time:10.0f} transitions/s, "
+          f"sample {options.samples * options.batch_size / sample_time:10.0f} transitions/s")
+
+
+def main():
+    """Benchmark entry."""
+    context.set_context(mode=context.GRAPH_MODE, device_target=options.device_target)
+    # The DQN Atari transition with 84x84 gray frames.
+    shapes = [(84, 84), (1,), (1,), (84, 84)]
+    types = [ms.uint8, ms.int32, ms.float32, ms.uint8]
+    transition = [Tensor(np.random.randint(0, 255, shapes[0]).astype(np.uint8)), Tensor([1], ms.int32),
+                  Tensor([1.], ms.float32), Tensor(np.random.randint(0, 255, shapes[3]).astype(np.uint8))]
+    print(f"capacity {options.capacity}, in-memory size "
+          f"{options.capacity * (2 * 84 * 84 + 8) / 1024 ** 3:.2f} GB")
+
+    bench('ReplayBuffer', ReplayBuffer(options.batch_size, options.capacity, shapes, types), transition)
+    mmap_buffer = MmapReplayBuffer(options.batch_size, options.capacity, shapes, types,
+                                   directory=options.directory, hot_size=options.hot_size)
+    bench('MmapReplayBuffer', mmap_buffer, transition)
+    mmap_buffer.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the sampling latency hidden by PrefetchSampler in DQN and SAC style learner loops.
+"""
+
+import argparse
+import time
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore import context, Tensor
+from mindspore.ops import operations as P
+from mindspore_rl.core import MmapReplayBuffer, PrefetchSampler
+from mindspore_rl.network import FullyConnectedNet
+
+parser = argparse.ArgumentParser(description='PrefetchSampler benchmark')
+parser.add_argument('--capacity', type=int, default=1000000, help='capacity of the replay buffer.')
+parser.add_argument('--fill', type=int, default=20000, help='number of transitions inserted before timing.')
+parser.add_argument('--steps', type=int, default=2000, help='number of timed learner steps.')
+parser.add_argument('--prefetch_size', type=int, default=4, help='number of prefetched batches.')
+parser.add_argument('--max_staleness', type=int, default=8, help='maximum insertions after sampling.')
+parser.add_argument('--device_target', type=str, default='CPU', choices=['Ascend', 'CPU', 'GPU'],
+                    help='Choose a device to run the benchmark(Default: CPU).')
+options, _ = parser.parse_known_args()
+
+
+class InsertNet(nn.Cell):
+    """Insert one transition."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def construct(self, state, action, reward, next_state):
+        return self.buffer.insert([state, action, reward, next_state])
+
+
+class SampleNet(nn.Cell):
+    """Sample a batch of transitions by the buffer or the sampler."""
+
+    def __init__(self, sampler):
+        super().__init__()
+        self.sampler = sampler
+
+    def construct(self):
+        return self.sampler.sample()
+
+
+class LearnNet(nn.Cell):
+    """One training step of a critic on the sampled states and actions."""
+
+    def __init__(self, input_dim, hidden_size):
+        super().__init__()
+        critic = FullyConnectedNet(input_dim, hidden_size, 1)
+        self.train_net = nn.TrainOneStepCell(nn.WithLossCell(critic, nn.MSELoss()),
+                                             nn.Adam(critic.trainable_params(), learning_rate=1e-3))
+        self.concat = P.Concat(axis=1)
+        self.cast = P.Cast()
+
+    def construct(self, state, action, reward, next_state):
+        inputs = self.concat((state, self.cast(action, ms.float32), next_state))
+        return self.train_net(inputs, reward)
+
+
+def run(name, buffer, sampler, learn_net, transition):
+    """Run the insert/sample/learn loop, and return the mean sample and step time."""
+    insert_net = InsertNet(buffer)
+    sample_net = SampleNet(sampler)
+    learn_net(*sample_net())
+    sample_time = 0.
+    start = time.time()
+    for _ in range(options.steps):
+        insert_net(*transition)
+        sample_start = time.time()
+        batch = sample_net()
+        sample_time += time.time() - sample_start
+        learn_net(*batch)
+    step_time = time.time() - start
+    print(f"{name:>20}: sample {sample_time * 1e3 / options.steps:.3f} ms, "
+          f"step {step_time * 1e3 / options.steps:.3f} ms")
+    return sample_time, step_time
+
+
+def main():
+    """Benchmark entry."""
+    context.set_context(mode=context.GRAPH_MODE, device_target=options.device_target)
+    # (name, state dim, action dim, batch size, hidden size), the same as the DQN and SAC examples.
+    cases = [('DQN CartPole', 4, 1, 64, 100), ('SAC HalfCheetah', 17, 6, 256, 256)]
+    for name, state_dim, action_dim, batch_size, hidden_size in cases:
+        shapes = [(state_dim,), (action_dim,), (1,), (state_dim,)]
+        types = [ms.float32, ms.float32, ms.float32, ms.float32]
+        transition = [Tensor(np.random.randn(*shape).astype(np.float32)) for shape in shapes]
+        buffer = MmapReplayBuffer(batch_size, options.capacity, shapes, types)
+        insert_net = InsertNet(buffer)
+        for _ in range(options.fill):
+            insert_net(*transition)
+        learn_net = LearnNet(2 * state_dim + action_dim, hidden_size)
+
+        print(f"{name}, batch size {batch_size}")
+        sync_sample, sync_step = run('synchronous', buffer, buffer, learn_net, transition)
+        sampler = PrefetchSampler(buffer, options.prefetch_size, options.max_staleness)
+        prefetch_sample, prefetch_step = run('prefetch', buffer, sampler, learn_net, transition)
+        print(f"{'hidden':>20}: {(1 - prefetch_sample / sync_sample) * 100:.1f}% of sample latency, "
+              f"step speedup {sync_step / prefetch_step:.2f}x, {sampler.stats}")
+        sampler.close()
+        buffer.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the replay buffer snapshot against saving the buffer as a MindSpore checkpoint.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import mindspore as ms
+from mindspore import context, Tensor
+from mindspore.train.serialization import save_checkpoint
+from mindspore_rl.core import ReplayBuffer
+
+parser = argparse.ArgumentParser(description='Replay buffer snapshot benchmark')
+parser.add_argument('--capacity', type=int, default=1000000, help='capacity of the replay buffer.')
+parser.add_argument('--fill', type=float, default=0.5, help='fraction of the buffer filled before saving.')
+parser.add_argument('--state_dim', type=int, default=17, help='dimension of the states.')
+parser.add_argument('--device_target', type=str, default='CPU', choices=['Ascend', 'CPU', 'GPU'],
+                    help='Choose a device to run the benchmark(Default: CPU).')
+options, _ = parser.parse_known_args()
+
+
+def main():
+    """Benchmark entry."""
+    context.set_context(mode=context.PYNATIVE_MODE, device_target=options.device_target)
+    shapes = [(options.state_dim,), (6,), (1,), (options.state_dim,)]
+    types = [ms.float32, ms.float32, ms.float32, ms.float32]
+    buffer = ReplayBuffer(256, options.capacity, shapes, types)
+    count = int(options.capacity * options.fill)
+    # Fill the buffer directly, the insertion is not measured.
+    for column in buffer.buffer:
+        data = np.zeros(column.shape, np.float32)
+        data[:count] = np.random.randn(count, *column.shape[1:])
+        column.set_data(Tensor(data))
+    buffer.count.set_data(Tensor(count, ms.int32))
+
+    directory = tempfile.mkdtemp()
+    start = time.time()
+    save_checkpoint(buffer, os.path.join(directory, 'buffer.ckpt'))
+    ckpt_time = time.time() - start
+    ckpt_size = os.path.getsize(os.path.join(directory, 'buffer.ckpt'))
+
+    start = time.time()
+    writer = buffer.snapshot(os.path.join(directory, 'snapshot'), background=True)
+    blocking_time = time.time() - start
+    writer.join()
+    snapshot_time = time.time() - start
+    snapshot_size = sum(entry.stat().st_size for entry in os.scandir(os.path.join(directory, 'snapshot')))
+
+    start = time.time()
+    ReplayBuffer(256, options.capacity, shapes, types).restore(os.path.join(directory, 'snapshot'))
+    restore_time = time.time() - start
+
+    print(f"checkpoint: {ckpt_time:.3f} s, {ckpt_size / 2 ** 20:.1f} MB")
+    print(f"snapshot: {snapshot_time:.3f} s ({blocking_time:.3f} s blocking), {snapshot_size / 2 ** 20:.1f} MB")
+    print(f"restore: {restore_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
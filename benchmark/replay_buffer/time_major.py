@@ -0,0 +1,79 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Benchmark of the copies saved per PPO episode by reading the replay buffer in time-major layout.
+"""
+
+import argparse
+import time
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore import context
+from mindspore.ops import operations as P
+from mindspore_rl.core import ReplayBuffer
+
+parser = argparse.ArgumentParser(description='Time-major replay buffer elements benchmark')
+parser.add_argument('--duration', type=int, default=1000, help='steps per episode.')
+parser.add_argument('--num_envs', type=int, default=30, help='number of environments.')
+parser.add_argument('--episodes', type=int, default=20, help='number of timed episodes.')
+parser.add_argument('--device_target', type=str, default='CPU', choices=['Ascend', 'CPU', 'GPU'],
+                    help='Choose a device to run the benchmark(Default: CPU).')
+options, _ = parser.parse_known_args()
+
+
+class ReadElementsNet(nn.Cell):
+    """Read the elements as the PPO trainer does, and reduce them as a stand-in for the learner."""
+
+    def __init__(self, buffer, env_major):
+        super().__init__()
+        self.buffer = buffer
+        self.env_major = env_major
+        self.transpose = P.Transpose()
+        self.reduce_sum = P.ReduceSum()
+
+    def construct(self):
+        total = 0.
+        for e in self.buffer.buffer:
+            if self.env_major:
+                e = self.transpose(e, (1, 0, 2))
+            total += self.reduce_sum(e[:, -1])
+        return total
+
+
+def main():
+    """Benchmark entry."""
+    context.set_context(mode=context.GRAPH_MODE, device_target=options.device_target)
+    # The shapes of the PPO HalfCheetah example.
+    dims = [17, 6, 1, 17, 6, 6]
+    shapes = [(options.num_envs, dim) for dim in dims]
+    buffer = ReplayBuffer(1, options.duration, shapes, [ms.float32] * len(dims))
+    copied = options.duration * options.num_envs * sum(dims) * np.dtype(np.float32).itemsize
+
+    results = {}
+    for name, env_major in [('env-major', True), ('time-major', False)]:
+        net = ReadElementsNet(buffer, env_major)
+        net()
+        start = time.time()
+        for _ in range(options.episodes):
+            net().asnumpy()
+        results[name] = (time.time() - start) * 1e3 / options.episodes
+        print(f"{name:>10}: {results[name]:.3f} ms per episode")
+    print(f"time-major saves {copied / 2 ** 20:.2f} MB of transpose copies and "
+          f"{results['env-major'] - results['time-major']:.3f} ms per episode")
+
+
+if __name__ == "__main__":
+    main()
@@ -45,6 +45,16 @@ class DQNTrainer(Trainer):
         trainable_variables = {"policy_net": self.msrl.learner.policy_network}
         return trainable_variables
 
+    def replay_buffers(self):
+        """Replay buffers for saving."""
+        return {"replay_buffer": self.msrl.buffers}
+
+    def _init_or_restore(self, ckpt_path=None):
+        """Skip the initial filling of the replay buffer if it is restored."""
+        super(DQNTrainer, self)._init_or_restore(ckpt_path)
+        if self.restored_buffers:
+            self.inited.set_data(self.true)
+
     @ms_function
     def init_training(self):
         """Initialize training"""
@@ -44,7 +44,7 @@ def train(episode=options.episode):
     context.set_context(mode=context.GRAPH_MODE)
     dqn_session = Session(config.algorithm_config)
     loss_cb = LossCallback()
-    ckpt_cb = CheckpointCallback(50, config.trainer_params['ckpt_path'])
+    ckpt_cb = CheckpointCallback(50, config.trainer_params['ckpt_path'], save_replay_buffer=True)
     eval_cb = EvaluateCallback(10)
     cbs = [loss_cb, ckpt_cb, eval_cb]
     dqn_session.run(class_type=DQNTrainer, episode=episode, params=config.trainer_params, callbacks=cbs)
@@ -177,8 +177,12 @@ class PPOActor(Actor):
         return 0
 
     def get_action(self, phase, params):
-        """Default get_action function"""
-        return
+        """get the action of the collect policy without stepping the environment, which is used by the
+        asynchronous collection"""
+        if phase == 2:
+            return self.collect_policy(params)
+        self.print("Phase is incorrect")
+        return 0
 
 
 class PPOLearner(Learner):
@@ -270,10 +274,10 @@ class PPOLearner(Learner):
 
     def learn(self, experience):
         """prepare for the value (advantage, discounted reward), which is used to calculate
-        the loss"""
+        the loss. The experience is time-major, in shape (duration, num_envs, ...)."""
         state_list, action_list, reward_list, next_state_list, \
             miu_list, sigma_list = experience
-        last_state = next_state_list[:, -1]
+        last_state = next_state_list[-1]
         rewards = self.squeeze(reward_list)
 
         last_value_prediction = self.critic_net(last_state)
@@ -284,11 +288,11 @@ class PPOLearner(Learner):
             """Compute discounter reward"""
             discounted_r = self.zeros_like(rewards)
             iter_num = self.zero_int
-            iter_end = len(rewards[0])
+            iter_end = len(rewards)
             while iter_num < iter_end:
                 i = iter_end - iter_num - 1
-                v_last = self.add(rewards[:, i], self.mul(gamma, v_last))
-                discounted_r[:, i] = self.reshape(v_last, (-1,))
+                v_last = self.add(rewards[i], self.mul(gamma, v_last))
+                discounted_r[i] = self.reshape(v_last, (-1,))
                 iter_num += 1
             return discounted_r
 
@@ -309,12 +313,12 @@ class PPOLearner(Learner):
             advantage = self.zeros_like(delta)
             v_last = self.zeros_like(v_last)
             iter_num = self.zero_int
-            iter_end = len(delta[0])
+            iter_end = len(delta)
             while iter_num < iter_end:
                 i = iter_end - iter_num - 1
-                v_last = self.add(delta[:, i],
+                v_last = self.add(delta[i],
                                   self.mul(weighted_discount, v_last))
-                advantage[:, i] = self.reshape(v_last, (-1,))
+                advantage[i] = self.reshape(v_last, (-1,))
                 iter_num += 1
             return advantage
 
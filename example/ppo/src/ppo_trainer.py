@@ -13,10 +13,11 @@
 # limitations under the License.
 # ============================================================================
 """PPO Trainer"""
+import numpy as np
 import mindspore
 import mindspore.nn as nn
 from mindspore.common.api import ms_function
-from mindspore import Tensor
+from mindspore import Tensor, Parameter, ParameterTuple
 from mindspore.ops import operations as P
 from mindspore_rl.agent.trainer import Trainer
 from mindspore_rl.agent import trainer
@@ -38,6 +39,11 @@ class PPOTrainer(Trainer):
         self.num_eval_episode = params['num_eval_episode']
         super(PPOTrainer, self).__init__(msrl)
 
+        # The asynchronous collection is used if the collect environment returns the first ready environments.
+        self.num_ready = getattr(msrl.collect_environment, 'num_ready', None)
+        if self.num_ready is not None:
+            self._init_async_collection()
+
     def trainable_variables(self):
         """Trainable variables for saving."""
         trainable_variables = {"actor_net": self.msrl.learner.actor_net,
@@ -45,26 +51,91 @@ class PPOTrainer(Trainer):
                                "ppo_optimizer": self.msrl.learner._ppo_net_train.optimizer}
         return trainable_variables
 
+    def _init_async_collection(self):
+        """Create the per environment states of the asynchronous collection."""
+        env = self.msrl.collect_environment
+        num_env = self.msrl.num_collect_env
+        self.num_env = num_env
+        self.pending = ParameterTuple(
+            [Parameter(Tensor(np.zeros((num_env,) + shape), mindspore.float32), name=name, requires_grad=False)
+             for name, shape in [('pending_state', env.observation_space.shape),
+                                 ('pending_action', env.action_space.shape),
+                                 ('pending_miu', env.action_space.shape),
+                                 ('pending_sigma', env.action_space.shape)]])
+        # Whether an environment has an action in flight, and the number of its collected steps.
+        self.has_pending = Parameter(Tensor(np.zeros((num_env,)), mindspore.float32), name='has_pending',
+                                     requires_grad=False)
+        self.env_steps = Parameter(Tensor(np.zeros((num_env,)), mindspore.int32), name='env_steps',
+                                   requires_grad=False)
+        self.zeros_env = Tensor(np.zeros((num_env,)), mindspore.float32)
+        self.zeros_env_int = Tensor(np.zeros((num_env,)), mindspore.int32)
+        self.ones_ready = Tensor(np.ones((self.num_ready,)), mindspore.float32)
+        self.last_step = Tensor(self.duration - 1, mindspore.int32)
+        self.gather = P.Gather()
+        self.gather_nd = P.GatherNd()
+        self.scatter_update = P.ScatterUpdate()
+        self.scatter_nd_update = P.ScatterNdUpdate()
+        self.stack = P.Stack(axis=1)
+        self.minimum = P.Minimum()
+        self.reduce_min = P.ReduceMin()
+        self.reduce_sum = P.ReduceSum()
+        self.reshape = P.Reshape()
+        self.cast = P.Cast()
+
+    def _collect_async(self):
+        """Collect `duration` steps of each environment, and act on the first ready environments while the
+        others keep running. The transitions are written to the buffer at the step of each environment."""
+        training_reward = self.zero
+        self.assign(self.has_pending, self.zeros_env)
+        self.assign(self.env_steps, self.zeros_env_int)
+        self.msrl.collect_environment.reset()
+        while self.less(self.reduce_min(self.env_steps), self.duration):
+            new_state, reward, _, env_id = self.msrl.collect_environment.recv()
+            # The environments just reset have no transition, and the ones finished collecting are dropped.
+            has_pending = self.gather(self.has_pending, env_id, 0)
+            steps = self.gather(self.env_steps, env_id, 0)
+            valid = has_pending * self.cast(self.less(steps, self.duration), mindspore.float32)
+            indices = self.stack((self.minimum(steps, self.last_step), env_id))
+            transition = (self.gather(self.pending[0], env_id, 0), self.gather(self.pending[1], env_id, 0),
+                          reward, new_state,
+                          self.gather(self.pending[2], env_id, 0), self.gather(self.pending[3], env_id, 0))
+            mask = self.reshape(valid, (-1, 1))
+            for column, value in zip(self.msrl.buffers.buffer, transition):
+                old_value = self.gather_nd(column, indices)
+                self.scatter_nd_update(column, indices, value * mask + old_value * (1 - mask))
+            self.scatter_update(self.env_steps, env_id, steps + self.cast(has_pending, mindspore.int32))
+            training_reward += self.reduce_sum(self.reshape(reward, (-1,)) * valid) / self.num_env
+
+            action, miu, sigma = self.msrl.agent_get_action(trainer.COLLECT, new_state)
+            self.msrl.collect_environment.send(action, env_id)
+            for pending, value in zip(self.pending, (new_state, action, miu, sigma)):
+                self.scatter_update(pending, env_id, value)
+            self.scatter_update(self.has_pending, env_id, self.ones_ready)
+        return training_reward
+
     @ms_function
     def train_one_episode(self):
         """the algorithm in one episode"""
         training_loss = self.zero
         training_reward = self.zero
         j = self.zero
-        state = self.msrl.collect_environment.reset()
-
-        while self.less(j, self.duration):
-            reward, new_state, action, miu, sigma = self.msrl.agent_act(
-                trainer.COLLECT, state)
-            self.msrl.replay_buffer_insert(
-                [state, action, reward, new_state, miu, sigma])
-            state = new_state
-            reward = self.reduce_mean(reward)
-            training_reward += reward
-            j += 1
+        if self.num_ready is not None:
+            training_reward = self._collect_async()
+            j = self.zero + self.duration
+        else:
+            state = self.msrl.collect_environment.reset()
+            while self.less(j, self.duration):
+                reward, new_state, action, miu, sigma = self.msrl.agent_act(
+                    trainer.COLLECT, state)
+                self.msrl.replay_buffer_insert(
+                    [state, action, reward, new_state, miu, sigma])
+                state = new_state
+                reward = self.reduce_mean(reward)
+                training_reward += reward
+                j += 1
 
-        replay_buffer_elements = self.msrl.get_replay_buffer_elements(
-            transpose=True, shape=(1, 0, 2))
+        # The elements are in shape (duration, num_envs, ...), which is consumed by the learner directly.
+        replay_buffer_elements = self.msrl.get_replay_buffer_elements(layout='time_major')
         state_list = replay_buffer_elements[0]
         action_list = replay_buffer_elements[1]
         reward_list = replay_buffer_elements[2]
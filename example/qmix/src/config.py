@@ -19,7 +19,7 @@ QMIX config.
 # pylint: disable=E0402
 import mindspore as ms
 from mindspore_rl.environment import StarCraft2Environment
-from mindspore_rl.core.replay_buffer import ReplayBuffer
+from mindspore_rl.core.episode_replay_buffer import EpisodeReplayBuffer
 from .qmix import QMIXActor, QMIXLearner, QMIXPolicy
 
 BATCH_SIZE = 32
@@ -82,13 +82,14 @@ algorithm_config = {
     },
     'replay_buffer': {
         'number': 1,
-        'type': ReplayBuffer,
+        'type': EpisodeReplayBuffer,
         'capacity': 5000,
-        'data_shape': [(121, 5, 96), (121, 120), (121, 5, 1), (121, 5, 11), (121, 1), (121, 1), (121, 1), (121, 5, 64)],
+        'data_shape': [(5, 96), (120,), (5, 1), (5, 11), (1,), (1,), (1,), (5, 64)],
         'data_type': [
             ms.float32, ms.float32, ms.int32, ms.int32,
             ms.float32, ms.bool_, ms.int32, ms.float32
         ],
         'sample_size': BATCH_SIZE,
+        'params': {'max_episode_length': 121},
     }
 }
@@ -61,11 +61,15 @@ class QMIXTrainer(Trainer):
             np.eye(self.num_agent), 0).reshape(self.num_agent, -1), ms.float32)
         self.episode_limit = env_config['episode_limit']
         self.action_dim = action_space.num_values
-        self.observation_dim = (observation_space.shape[-1] + self.num_agent + self.action_dim)
+        self.local_obs_dim = observation_space.shape[-1]
+        self.observation_dim = (self.local_obs_dim + self.num_agent + self.action_dim)
         self.global_obs_dim = env_config['global_observation_dim']
 
         self.reward_dim = reward_space.shape[-1]
         self.done_dim = done_space.shape[-1]
+        self.zero_reward = Tensor(np.zeros((self.reward_dim,)), ms.float32)
+        self.filled = Tensor(np.ones((self.done_dim,)), ms.int32)
+        self.unfilled = Tensor(np.zeros((self.done_dim,)), ms.int32)
 
         self.epsilon_steps = Parameter(
             Tensor(0, ms.int32), requires_grad=False, name='epsilon_steps')
@@ -86,75 +90,58 @@ class QMIXTrainer(Trainer):
         steps = self.zero_int
         total_reward = self.zero_float
         loss = self.zero_float
-        new_state = self.zeros((5, 80), ms.float32)
-        hy = self.zeros((5, 64), ms.float32)
-
-        episode_local_obs = self.zeros(
-            (self.episode_limit + 1, self.num_agent, self.observation_dim), ms.float32)
-        episode_global_obs = self.zeros(
-            (self.episode_limit + 1, self.global_obs_dim), ms.float32)
-        episode_action = self.zeros(
-            (self.episode_limit + 1, self.num_agent, 1), ms.int32)
-        episode_avail_action = self.zeros(
-            (self.episode_limit + 1, self.num_agent, self.action_dim), ms.int32)
-        episode_reward = self.zeros(
-            (self.episode_limit + 1, self.reward_dim), ms.float32)
-        episode_done = self.zeros(
-            (self.episode_limit + 1, self.done_dim), ms.bool_)
-        episode_filled = self.zeros(
-            (self.episode_limit + 1, self.done_dim), ms.int32)
-        episode_hy = self.zeros((self.episode_limit + 1, self.num_agent, 64), ms.float32)
+        new_state = self.zeros((self.num_agent, self.local_obs_dim), ms.float32)
+        hy = self.zeros((self.num_agent, 64), ms.float32)
 
         local_obs, global_obs, avail_action = self.msrl.collect_environment.reset()
         last_onehot_action = self.zeros(
             (self.num_agent, self.action_dim), ms.float32)
         concat_obs = self.concat(
             (local_obs, self.reshape(last_onehot_action, (self.num_agent, -1)), self.agent_id))
-        episode_local_obs[steps] = concat_obs
-        episode_global_obs[steps] = global_obs
-        episode_avail_action[steps] = avail_action
         steps += 1
 
+        # Each step is written into the episode slot of the replay buffer, and hy is the hidden state
+        # before acting on the step.
         while (not done) and (steps < self.episode_limit):
-            new_state, done, reward, action, hy, new_global_obs, avail_action = self.msrl.agent_act(
+            new_state, done, reward, action, new_hy, new_global_obs, new_avail_action = self.msrl.agent_act(
                 trainer.COLLECT, (concat_obs, hy, avail_action, self.epsilon_steps))
-            last_onehot_action = self.onehot(
-                action, self.action_dim, self.one_float, self.zero_float).astype(ms.float32)
-            concat_obs = self.concat((new_state, self.reshape(
-                last_onehot_action, (self.num_agent, -1)), self.agent_id))
-
-            episode_local_obs[steps] = concat_obs
-            episode_global_obs[steps] = new_global_obs
-            episode_hy[steps] = hy
-            episode_action[steps - 1] = action
-            episode_avail_action[steps] = avail_action
-            episode_reward[steps - 1] = reward
             reach_episode_limit = self.expand_dims(
                 self.equal(self.episode_limit, steps), 0)
             if reach_episode_limit:
                 done = self.false
-            episode_done[steps - 1] = done
-            episode_filled[steps - 1] = self.expand_dims(self.one_int, 0)
+            self.msrl.replay_buffer_insert((concat_obs, global_obs, action, avail_action, reward, done,
+                                            self.filled, hy))
+
+            last_onehot_action = self.onehot(
+                action, self.action_dim, self.one_float, self.zero_float).astype(ms.float32)
+            concat_obs = self.concat((new_state, self.reshape(
+                last_onehot_action, (self.num_agent, -1)), self.agent_id))
+            global_obs = new_global_obs
+            avail_action = new_avail_action
+            hy = new_hy
             reward_squeeze = self.squeeze(reward)
             total_reward += reward_squeeze
             steps += 1
 
-        action, hy = self.msrl.agent_get_action(
+        # The last observation is used as the target of the last step, and the observation after it is
+        # the padding for the time dimension of the target network.
+        action, new_hy = self.msrl.agent_get_action(
             trainer.COLLECT, (concat_obs, hy, avail_action, self.epsilon_steps))
+        self.msrl.replay_buffer_insert((concat_obs, global_obs, action, avail_action, self.zero_reward,
+                                        self.false, self.unfilled, hy))
         last_onehot_action = self.onehot(
-            action, self.action_dim, self.one_float, self.zero_float)
+            action, self.action_dim, self.one_float, self.zero_float).astype(ms.float32)
         concat_obs = self.concat((new_state, self.reshape(
             last_onehot_action, (self.num_agent, -1)), self.agent_id))
-        episode_local_obs[steps] = concat_obs
-        episode_hy[steps] = hy
-        episode_action[steps - 1] = action
+        self.msrl.replay_buffer_insert((concat_obs, self.zeros_like(global_obs), self.zeros_like(action),
+                                        self.zeros_like(avail_action), self.zero_reward, self.false,
+                                        self.unfilled, new_hy))
+        self.msrl.buffers.end_episode()
 
-        self.msrl.replay_buffer_insert((episode_local_obs, episode_global_obs, episode_action,
-                                        episode_avail_action, episode_reward, episode_done,
-                                        episode_filled, episode_hy))
         self.epsilon_steps += steps
-        if self.greater_equal(self.msrl.buffers.count, self.batch):
-            loss = self.msrl.agent_learn(self.msrl.replay_buffer_sample())
+        if self.greater_equal(self.msrl.buffers.size(), self.batch):
+            experience = self.msrl.replay_buffer_sample()
+            loss = self.msrl.agent_learn(experience[:-1])
 
         step_info = self.msrl.collect_environment.get_step_info()
 
@@ -44,6 +44,7 @@ class Trainer(nn.Cell):
     def __init__(self, msrl):
         self.msrl = msrl
         self.vars = {}
+        self.restored_buffers = []
 
     def train(self, episodes, callbacks=None, ckpt_path=None):
         """
@@ -58,6 +59,7 @@ class Trainer(nn.Cell):
 
         cb_params = CallbackParam()
         cb_params.episodes_num = episodes
+        cb_params.collect_environment = getattr(self.msrl, 'collect_environment', None)
 
         # Move TimeCallback to the first to exclude the time of other callbacks.
         for item in callbacks:
@@ -72,6 +74,7 @@ class Trainer(nn.Cell):
             cb_params.cur_episode = 0
             if self.vars:
                 cb_params.vars = self.vars
+            cb_params.buffers = self.replay_buffers()
 
             callback_list.begin(cb_params)
 
@@ -155,7 +158,16 @@ class Trainer(nn.Cell):
             self.vars = self.trainable_variables()
             for key, val in self.vars.items():
                 self._load_ckpt(ckpt_path, key, val)
+            for key, buffer in self.replay_buffers().items():
+                self._load_replay_buffer(ckpt_path, key, buffer)
 
+    def _load_replay_buffer(self, ckpt_path, name, buffer):
+        '''Restore the replay buffer if its snapshot exists.'''
+        snapshot_path = ckpt_path + '/' + name
+        if os.path.exists(snapshot_path + '/meta.json'):
+            print("Load replay buffer ", snapshot_path)
+            buffer.restore(snapshot_path)
+            self.restored_buffers.append(name)
 
     def trainable_variables(self):
         """
@@ -163,6 +175,13 @@ class Trainer(nn.Cell):
         """
         raise NotImplementedError("Method trainable_variables should be overridden by subclass.")
 
+    def replay_buffers(self):
+        """
+        The replay buffers for saving to checkpoint, which should support `snapshot` and `restore`,
+        such as ReplayBuffer and HostPriorityReplayBuffer. Default: no replay buffer.
+        """
+        return {}
+
     def load_and_eval(self, ckpt_path=None):
         """
         The interface of the eval function for offline. A checkpoint must be provided.
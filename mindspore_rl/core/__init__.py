@@ -19,7 +19,17 @@ Helper components used to implement RL algorithms.
 
 from mindspore_rl.core.replay_buffer import ReplayBuffer
 from mindspore_rl.core.priority_replay_buffer import PriorityReplayBuffer
+from mindspore_rl.core.host_replay_buffer import HostReplayBuffer
+from mindspore_rl.core.mmap_replay_buffer import MmapReplayBuffer
+from mindspore_rl.core.compressed_replay_buffer import CompressedReplayBuffer
+from mindspore_rl.core.nstep_replay_buffer import NStepReplayBuffer
+from mindspore_rl.core.episode_replay_buffer import EpisodeReplayBuffer
+from mindspore_rl.core.host_priority_replay_buffer import HostPriorityReplayBuffer
+from mindspore_rl.core.prefetch_sampler import PrefetchSampler
+from mindspore_rl.core.shared_replay_buffer import SharedReplayBuffer
 from mindspore_rl.core.msrl import MSRL
 from mindspore_rl.core.session import Session
 
-__all__ = ["MSRL", "Session", "ReplayBuffer", "PriorityReplayBuffer"]
+__all__ = ["MSRL", "Session", "ReplayBuffer", "PriorityReplayBuffer", "HostReplayBuffer", "MmapReplayBuffer",
+           "CompressedReplayBuffer", "NStepReplayBuffer", "EpisodeReplayBuffer",
+           "HostPriorityReplayBuffer", "PrefetchSampler", "SharedReplayBuffer"]
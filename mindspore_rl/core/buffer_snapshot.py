@@ -0,0 +1,131 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+The on-disk snapshot format of the replay buffers.
+
+A snapshot is a directory with a `meta.json` and one `.npy` file per array. Only the valid rows of the
+buffer are written, chunk by chunk, so the snapshot is as compact as the content and no second copy of
+a column is built in memory. The snapshot is written to a temporary directory which replaces the old one
+at the end, so an interrupted writing never corrupts the latest snapshot.
+"""
+
+import json
+import os
+import shutil
+import threading
+import numpy as np
+
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotWriter(threading.Thread):
+    """
+    The background thread which writes a snapshot. The exception raised in the thread is raised again
+    by `join`.
+    """
+
+    def __init__(self, directory, meta, arrays, chunk_size):
+        super().__init__(name='replay_buffer_snapshot', daemon=True)
+        self._args = (directory, meta, arrays, chunk_size)
+        self._error = None
+
+    def run(self):
+        try:
+            _write_snapshot(*self._args)
+        except Exception as e:  # pylint: disable=W0703
+            self._error = e
+
+    def join(self, timeout=None):
+        super().join(timeout)
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
+def save_snapshot(directory, meta, arrays, chunk_size=65536, background=False):
+    """
+    Write a snapshot.
+
+    Args:
+        directory (str): the directory of the snapshot, which is replaced if it exists.
+        meta (dict): the JSON serializable description of the buffer.
+        arrays (dict[str, numpy.ndarray]): the arrays to write, whose first dimension is the rows.
+        chunk_size (int): the number of rows written at a time. Default: 65536.
+        background (bool): write in a background thread. The arrays should not be modified until the
+            writing finishes. Default: False.
+
+    Returns:
+        writer (SnapshotWriter), the started writer if `background` is True, otherwise None.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"The chunk_size of snapshot should be positive, but got {chunk_size}.")
+    meta = dict(meta, version=SNAPSHOT_VERSION, arrays=sorted(arrays))
+    if not background:
+        _write_snapshot(directory, meta, arrays, chunk_size)
+        return None
+    writer = SnapshotWriter(directory, meta, arrays, chunk_size)
+    writer.start()
+    return writer
+
+
+def load_snapshot(directory):
+    """
+    Read a snapshot, the arrays are memory-mapped in read-only mode.
+
+    Args:
+        directory (str): the directory of the snapshot.
+
+    Returns:
+        meta (dict), the description of the buffer.
+        arrays (dict[str, numpy.ndarray]), the memory-mapped arrays.
+    """
+
+    with open(os.path.join(directory, 'meta.json'), 'r') as f:
+        meta = json.load(f)
+    if meta.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"The snapshot version {meta.get('version')} in {directory} is not supported.")
+    arrays = {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode='r') for name in meta['arrays']}
+    return meta, arrays
+
+
+def check_snapshot(meta, buffer_type, **expected):
+    """Check that the snapshot matches with the buffer to restore."""
+    if meta['type'] != buffer_type:
+        raise ValueError(f"The snapshot of {meta['type']} can not be restored into {buffer_type}.")
+    for key, value in expected.items():
+        if meta[key] != value:
+            raise ValueError(f"The {key} of the snapshot is {meta[key]}, but the buffer has {value}.")
+
+
+def _write_snapshot(directory, meta, arrays, chunk_size):
+    """Write the arrays chunk by chunk to a temporary directory, then replace the snapshot directory."""
+    directory = os.path.normpath(directory)
+    temp_directory = directory + '.tmp'
+    if os.path.exists(temp_directory):
+        shutil.rmtree(temp_directory)
+    os.makedirs(temp_directory)
+    for name, array in arrays.items():
+        header = {'descr': np.lib.format.dtype_to_descr(array.dtype), 'fortran_order': False,
+                  'shape': array.shape}
+        with open(os.path.join(temp_directory, name + '.npy'), 'wb') as f:
+            np.lib.format.write_array_header_1_0(f, header)
+            for start in range(0, len(array), chunk_size):
+                np.ascontiguousarray(array[start:start + chunk_size]).tofile(f)
+    with open(os.path.join(temp_directory, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+    os.replace(temp_directory, directory)
@@ -0,0 +1,263 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Implementation of the Replay Buffer with deduplicated and compressed observations.
+"""
+
+import importlib
+import numpy as np
+from mindspore_rl.core.host_replay_buffer import HostReplayBuffer
+
+
+class CompressedReplayBuffer(HostReplayBuffer):
+    """
+    The replay buffer which stores each observation only once. In the transitions like
+    `[state, action, reward, new_state]`, the `new_state` of a transition is the `state` of the next
+    transition in the same episode, so the buffer keeps one copy of it and rebuilds the `(state, new_state)`
+    pair by index when sampling. The `new_state` of the last transition of an episode is kept separately.
+
+    If the observation is stacked by frames (e.g. 4 Atari frames), the buffer only keeps the newest frame of
+    each observation and rebuilds the stacked observation from the previous frames. Besides, the frames can be
+    stored as uint8 or compressed by LZ4.
+
+    It has the same interface as ReplayBuffer, and can be selected by the `type` of `replay_buffer`
+    in the algorithm configuration. The extra arguments can be passed by the `params` of `replay_buffer`.
+
+    Args:
+        batch_size (int): size for sampling from the buffer.
+        capacity (int): the capacity of the buffer.
+        shapes (List[int]): the shape of each tensor in a buffer element.
+        types (List[mindspore.dtype]): the data type of each tensor in a buffer element.
+        state_index (int): the index of state in a buffer element. Default: 0.
+        next_state_index (int): the index of new state in a buffer element. Default: 3.
+        frame_stack (int): the number of frames stacked in the first dimension of the observation.
+            1 means that the observation is not stacked. Default: 1.
+        compression (str): how to store the frames. None means that the frames are stored as it is,
+            'uint8' means that the frames are rounded and clipped to [0, 255] and stored as uint8,
+            'lz4' means that each frame is compressed by LZ4, the `lz4` package is required. Default: None.
+        seed (int): the seed of the random generator used in sampling. Default: None.
+
+    Examples:
+        >>> batch_size = 32
+        >>> capacity = 100000
+        >>> shapes = [(4, 84, 84), (1,), (1,), (4, 84, 84)]
+        >>> types = [ms.uint8, ms.int32, ms.float32, ms.uint8]
+        >>> replaybuffer = CompressedReplayBuffer(batch_size, capacity, shapes, types, frame_stack=4)
+        >>> print(replaybuffer)
+        CompressedReplayBuffer<>
+    """
+
+    def __init__(self, batch_size, capacity, shapes, types, state_index=0, next_state_index=3, frame_stack=1,
+                 compression=None, seed=None):
+        super().__init__(batch_size, capacity, shapes, types)
+        self._state_index = state_index % len(self._shapes)
+        self._next_state_index = next_state_index % len(self._shapes)
+        if self._shapes[self._state_index] != self._shapes[self._next_state_index] or \
+                self._np_types[self._state_index] != self._np_types[self._next_state_index]:
+            raise ValueError("The state and new state in CompressedReplayBuffer should have the same shape and type.")
+        if frame_stack < 1:
+            raise ValueError(f"The frame_stack should be positive, but got {frame_stack}.")
+        if frame_stack > 1 and self._shapes[self._state_index][0] != frame_stack:
+            raise ValueError(f"The first dimension of state should be the frame_stack {frame_stack}, "
+                             f"but got shape {self._shapes[self._state_index]}.")
+        if compression not in (None, 'uint8', 'lz4'):
+            raise ValueError(f"The compression should be one of None, 'uint8' and 'lz4', but got {compression}.")
+
+        self._frame_stack = frame_stack
+        self._compression = compression
+        self._lz4 = importlib.import_module('lz4.frame') if compression == 'lz4' else None
+        self._obs_shape = self._shapes[self._state_index]
+        self._obs_type = self._np_types[self._state_index]
+        self._frame_shape = self._obs_shape[1:] if frame_stack > 1 else self._obs_shape
+
+        # The columns except the observations.
+        self._columns = {}
+        for i, (shape, np_type) in enumerate(zip(self._shapes, self._np_types)):
+            if i not in (self._state_index, self._next_state_index):
+                self._columns[i] = np.zeros((capacity,) + shape, np_type)
+        # The newest frame of the state of each transition.
+        if compression == 'lz4':
+            self._frames = np.empty((capacity,), object)
+        else:
+            frame_type = np.uint8 if compression == 'uint8' else self._obs_type
+            self._frames = np.zeros((capacity,) + self._frame_shape, frame_type)
+        # Whether the new state of a transition is the state of the next transition.
+        self._linked = np.zeros((capacity,), np.bool_)
+        # The distance from the stacked state of a transition to the first state that is stored as a whole.
+        self._start_offset = np.zeros((capacity,), np.int32) if frame_stack > 1 else None
+        # The whole stacked states which can not be rebuilt from the previous frames, keyed by slot.
+        self._start_states = {}
+        # The new states of the last transition of episodes, keyed by slot.
+        self._last_states = {}
+        self._latest_state = None
+        self._latest_new_state = None
+        self._total = 0
+        self._rng = np.random.default_rng(seed)
+
+    def nbytes(self):
+        """
+        Return the number of bytes used to store the elements.
+
+        Returns:
+            nbytes (int), the bytes of the columns, the frames and the separately kept observations.
+        """
+
+        nbytes = sum(column.nbytes for column in self._columns.values())
+        nbytes += self._linked.nbytes
+        if self._start_offset is not None:
+            nbytes += self._start_offset.nbytes
+        if self._compression == 'lz4':
+            nbytes += self._frames.nbytes + sum(len(frame) for frame in self._frames[:self._size()])
+        else:
+            nbytes += self._frames.nbytes
+        for value in list(self._start_states.values()) + list(self._last_states.values()):
+            nbytes += len(value) if isinstance(value, bytes) else value.nbytes
+        return nbytes
+
+    def _insert(self, *exp):
+        state = exp[self._state_index]
+        new_state = exp[self._next_state_index]
+        slot = self._total % self._capacity
+        if self._total >= self._capacity:
+            self._evict(slot)
+
+        start = True
+        if self._total > 0 and self._capacity > 1:
+            prev = (slot - 1) % self._capacity
+            linked = np.array_equal(state, self._latest_new_state)
+            self._linked[prev] = linked
+            if not linked:
+                self._last_states[prev] = self._encode(self._latest_new_state)
+            # The stacked state can be rebuilt only if it is the previous state shifted by one frame.
+            start = not linked or (self._frame_stack > 1 and
+                                   not np.array_equal(state[:-1], self._latest_state[1:]))
+        if self._frame_stack > 1:
+            self._store_frame(slot, state[-1])
+            if start:
+                self._start_states[slot] = self._encode(state)
+                self._start_offset[slot] = 0
+            else:
+                self._start_offset[slot] = self._start_offset[(slot - 1) % self._capacity] + 1
+        else:
+            self._store_frame(slot, state)
+        self._linked[slot] = False
+        for i, column in self._columns.items():
+            column[slot] = exp[i]
+        self._latest_state = np.array(state, self._obs_type)
+        self._latest_new_state = np.array(new_state, self._obs_type)
+        self._total += 1
+
+    def _sample(self):
+        size = self._size()
+        positions = self._rng.integers(0, size, self._batch_size)
+        return self._gather(self._total - size + positions)
+
+    def _get_item(self, index):
+        return [data[0] for data in self._gather(np.array([self._total - self._size() + index]))]
+
+    def _reset(self):
+        self._start_states.clear()
+        self._last_states.clear()
+        self._latest_state = None
+        self._latest_new_state = None
+        self._total = 0
+
+    def _size(self):
+        return min(self._total, self._capacity)
+
+    def _evict(self, slot):
+        """Remove the oldest element in the slot before it is overwritten."""
+        self._last_states.pop(slot, None)
+        if self._frame_stack > 1:
+            # The oldest state is always stored as a whole, so that it never refers to the evicted frames.
+            oldest = (slot + 1) % self._capacity
+            if oldest != slot and self._start_offset[oldest] != 0:
+                element = self._total - self._capacity + 1
+                self._start_states[oldest] = self._encode(self._states(np.array([element]))[0])
+                self._start_offset[oldest] = 0
+            self._start_states.pop(slot, None)
+
+    def _gather(self, elements):
+        """Gather the elements by their index since the last reset."""
+        slots = elements % self._capacity
+        states = self._states(elements)
+        new_states = np.empty_like(states)
+        latest = elements == self._total - 1
+        linked = self._linked[slots] & ~latest
+        new_states[latest] = self._latest_new_state
+        if linked.any():
+            new_states[linked] = self._states(elements[linked] + 1)
+        for i in np.nonzero(~latest & ~linked)[0]:
+            new_states[i] = self._decode(self._last_states[slots[i]], self._obs_shape)
+
+        outputs = []
+        for i in range(len(self._shapes)):
+            if i == self._state_index:
+                outputs.append(states)
+            elif i == self._next_state_index:
+                outputs.append(new_states)
+            else:
+                outputs.append(self._columns[i][slots])
+        return outputs
+
+    def _states(self, elements):
+        """Rebuild the states of the elements."""
+        slots = elements % self._capacity
+        if self._frame_stack == 1:
+            return self._load_frames(slots)
+
+        states = np.empty((len(elements),) + self._obs_shape, self._obs_type)
+        oldest = self._total - self._size()
+        # The distance to the state stored as a whole, which is the oldest one if the start is evicted.
+        distance = np.minimum(self._start_offset[slots], elements - oldest)
+        for position in range(self._frame_stack):
+            offset = self._frame_stack - 1 - position
+            from_frames = offset <= distance
+            if from_frames.any():
+                states[from_frames, position] = self._load_frames((elements[from_frames] - offset) % self._capacity)
+            for i in np.nonzero(~from_frames)[0]:
+                start_slot = (elements[i] - distance[i]) % self._capacity
+                start_state = self._decode(self._start_states[start_slot], self._obs_shape)
+                states[i, position] = start_state[position + distance[i]]
+        return states
+
+    def _store_frame(self, slot, frame):
+        """Store a frame in the slot."""
+        if self._compression == 'lz4':
+            self._frames[slot] = self._encode(frame)
+        elif self._compression == 'uint8':
+            self._frames[slot] = np.clip(np.rint(frame), 0, 255)
+        else:
+            self._frames[slot] = frame
+
+    def _load_frames(self, slots):
+        """Load the frames in the slots."""
+        if self._compression == 'lz4':
+            return np.stack([self._decode(self._frames[slot], self._frame_shape) for slot in slots])
+        return self._frames[slots].astype(self._obs_type, copy=False)
+
+    def _encode(self, data):
+        """Encode the observation to be stored separately."""
+        if self._compression == 'lz4':
+            return self._lz4.compress(np.ascontiguousarray(data, self._obs_type).tobytes())
+        if self._compression == 'uint8':
+            return np.clip(np.rint(data), 0, 255).astype(np.uint8)
+        return np.array(data, self._obs_type)
+
+    def _decode(self, data, shape):
+        """Decode the observation stored separately."""
+        if self._compression == 'lz4':
+            return np.frombuffer(self._lz4.decompress(data), self._obs_type).reshape(shape)
+        return data.astype(self._obs_type, copy=False)
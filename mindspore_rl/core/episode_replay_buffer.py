@@ -0,0 +1,158 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Implementation of the Episode Replay Buffer class for recurrent agents.
+"""
+
+import numpy as np
+import mindspore as ms
+from mindspore.ops import operations as P
+from mindspore_rl.core.host_replay_buffer import HostReplayBuffer
+
+
+class EpisodeReplayBuffer(HostReplayBuffer):
+    """
+    The replay buffer which stores whole episodes for recurrent agents. The steps are inserted one by one into
+    the preallocated slot of the current episode, and `end_episode` makes the episode available for sampling.
+    Each slot has `max_episode_length` steps, the steps after the end of the episode are padded with zeros.
+
+    Sampling outputs `batch_size` sequence windows, each one is `burn_in + seq_len` contiguous steps of an
+    episode, and a padding mask in shape (batch_size, burn_in + seq_len, 1) is appended to the outputs, in which
+    1 stands for a valid step. The first `burn_in` steps of a window are used to warm up the recurrent state,
+    as proposed in `R2D2 <https://openreview.net/forum?id=r1lyTjAqYX>`. The recurrent hidden state can be
+    stored as a column, so that the hidden state of the first step of a window can be used as the initial state.
+    If the window begins before the start of the episode, the steps before the start are padded.
+
+    Args:
+        batch_size (int): the number of windows for sampling from the buffer.
+        capacity (int): the number of episodes of the buffer.
+        shapes (List[int]): the shape of each tensor in a step.
+        types (List[mindspore.dtype]): the data type of each tensor in a step.
+        max_episode_length (int): the maximum number of steps of an episode.
+        seq_len (int): the number of the trained steps of a window. If it is None, the window is the whole
+            episode slot. Default: None.
+        burn_in (int): the number of steps before the trained steps of a window. Default: 0.
+        seed (int): the seed of the random generator used in sampling. Default: None.
+
+    Examples:
+        >>> batch_size = 32
+        >>> capacity = 5000
+        >>> shapes = [(5, 96), (5, 1), (1,), (5, 64)]
+        >>> types = [ms.float32, ms.int32, ms.float32, ms.float32]
+        >>> replaybuffer = EpisodeReplayBuffer(batch_size, capacity, shapes, types, 121, seq_len=40, burn_in=20)
+        >>> print(replaybuffer)
+        EpisodeReplayBuffer<>
+    """
+
+    def __init__(self, batch_size, capacity, shapes, types, max_episode_length, seq_len=None, burn_in=0,
+                 seed=None):
+        super().__init__(batch_size, capacity, shapes, types)
+        if max_episode_length < 1:
+            raise ValueError(f"The max_episode_length should be positive, but got {max_episode_length}.")
+        if seq_len is None:
+            seq_len, burn_in = max_episode_length, 0
+        if seq_len < 1 or burn_in < 0:
+            raise ValueError(f"The seq_len should be positive and the burn_in should not be negative, "
+                             f"but got {seq_len} and {burn_in}.")
+        self._max_episode_length = max_episode_length
+        self._seq_len = seq_len
+        self._burn_in = burn_in
+        self._window = burn_in + seq_len
+
+        self._columns = [np.zeros((capacity, max_episode_length) + shape, np_type)
+                         for shape, np_type in zip(self._shapes, self._np_types)]
+        self._lengths = np.zeros((capacity,), np.int64)
+        # The number of episodes ended since the last reset. The current episode is written in slot
+        # self._total % capacity, and the number of its inserted steps is self._step.
+        self._total = 0
+        self._step = 0
+        self._rng = np.random.default_rng(seed)
+
+        self._output_np_types.append(np.float32)
+        self._sample_types = self._types + [ms.float32]
+        self._sample_shapes = [(batch_size, self._window) + shape for shape in self._shapes]
+        self._sample_shapes.append((batch_size, self._window, 1))
+        self._sample_op = P.PyFunc(self._sample_wrapper, [], [], self._sample_types, self._sample_shapes)
+        item_shapes = [(max_episode_length,) + shape for shape in self._shapes]
+        self._get_item_op = P.PyFunc(self._get_item_wrapper, [ms.int32], [(1,)], self._types + [ms.float32],
+                                     item_shapes + [(max_episode_length, 1)])
+        self._end_episode_op = P.PyFunc(self._end_episode_wrapper, [], [], [ms.bool_], [(1,)])
+
+    def end_episode(self):
+        """
+        End the current episode, the steps inserted since the last call become an episode. If the buffer is
+        full, FIFO strategy will be used to replace the oldest episode.
+
+        Returns:
+             success (Tensor), whether the episode is ended or not. It is False if no step is inserted.
+        """
+
+        return self._end_episode_op()[0]
+
+    def _insert(self, *exp):
+        if self._step >= self._max_episode_length:
+            raise RuntimeError(f"The episode is longer than the max_episode_length {self._max_episode_length}, "
+                               f"end_episode should be called before inserting more steps.")
+        slot = self._total % self._capacity
+        for column, data in zip(self._columns, exp):
+            column[slot, self._step] = data
+        self._step += 1
+
+    def _end_episode(self):
+        """End the current episode."""
+        if self._step == 0:
+            return False
+        slot = self._total % self._capacity
+        for column in self._columns:
+            column[slot, self._step:] = 0
+        self._lengths[slot] = self._step
+        self._total += 1
+        self._step = 0
+        return True
+
+    def _sample(self):
+        size = self._size()
+        episodes = (self._total - size + self._rng.integers(0, size, self._batch_size)) % self._capacity
+        lengths = self._lengths[episodes]
+        starts = self._rng.integers(0, np.maximum(lengths - self._seq_len, 0) + 1) - self._burn_in
+        steps = starts[:, None] + np.arange(self._window)
+        mask = (steps >= 0) & (steps < lengths[:, None])
+        steps = np.clip(steps, 0, self._max_episode_length - 1)
+
+        outputs = []
+        for column in self._columns:
+            data = column[episodes[:, None], steps]
+            data[~mask] = 0
+            outputs.append(data)
+        outputs.append(mask[..., None].astype(np.float32))
+        return outputs
+
+    def _get_item(self, index):
+        slot = (self._total - self._size() + index) % self._capacity
+        mask = np.arange(self._max_episode_length) < self._lengths[slot]
+        return [column[slot] for column in self._columns] + [mask[:, None].astype(np.float32)]
+
+    def _reset(self):
+        self._total = 0
+        self._step = 0
+
+    def _size(self):
+        # The oldest episode is not available once the current episode starts to overwrite its slot.
+        return min(self._total, self._capacity - 1 if self._step > 0 else self._capacity)
+
+    def _end_episode_wrapper(self):
+        """PyFunc entry of end_episode."""
+        with self._lock:
+            return np.array([self._end_episode()], np.bool_)
@@ -0,0 +1,319 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Implementation of the NumPy sum-tree based Priority Replay Buffer class.
+"""
+
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore.common import dtype as mstype
+from mindspore.ops import operations as P
+from mindspore_rl.core.buffer_snapshot import save_snapshot, load_snapshot, check_snapshot
+
+
+class SegmentTree:
+    """
+    The array based binary segment tree, whose leaves are the values of the elements. The node i has the
+    children 2i and 2i + 1, and the root is the node 1. All the operations are vectorized over a batch of
+    indices, and take O(log N) steps.
+
+    Args:
+        capacity (int): the number of leaves.
+        operator (numpy.ufunc): the operator to reduce two children, such as numpy.add or numpy.minimum.
+        neutral (float): the neutral element of the operator, which is the value of the unused leaves.
+    """
+
+    def __init__(self, capacity, operator, neutral):
+        self._leaf_base = 1
+        while self._leaf_base < capacity:
+            self._leaf_base *= 2
+        self._operator = operator
+        self._neutral = neutral
+        self._nodes = np.full((2 * self._leaf_base,), neutral, np.float64)
+
+    @property
+    def root(self):
+        """The reduced value of all the leaves."""
+        return self._nodes[1]
+
+    def get(self, indices):
+        """Get the values of the leaves."""
+        return self._nodes[self._leaf_base + indices]
+
+    def update(self, indices, values):
+        """Set the values of the leaves, and update their ancestors level by level."""
+        nodes = self._leaf_base + np.asarray(indices)
+        self._nodes[nodes] = values
+        nodes = np.unique(nodes // 2)
+        while nodes[0] >= 1:
+            self._nodes[nodes] = self._operator(self._nodes[2 * nodes], self._nodes[2 * nodes + 1])
+            nodes = np.unique(nodes // 2)
+
+    def reset(self):
+        """Set all the leaves to the neutral element."""
+        self._nodes.fill(self._neutral)
+
+
+class SumTree(SegmentTree):
+    """
+    The segment tree whose nodes hold the sum of their children.
+
+    Args:
+        capacity (int): the number of leaves.
+    """
+
+    def __init__(self, capacity):
+        super().__init__(capacity, np.add, 0.)
+
+    def find_prefix_sum(self, masses):
+        """
+        Find the leaves whose prefix sum covers the masses, i.e. the smallest index i for each mass
+        such that sum(values[:i + 1]) > mass.
+        """
+        nodes = np.ones(len(masses), np.int64)
+        masses = np.array(masses, np.float64)
+        while nodes[0] < self._leaf_base:
+            left = self._nodes[2 * nodes]
+            go_right = masses >= left
+            masses -= left * go_right
+            nodes = 2 * nodes + go_right
+        return nodes - self._leaf_base
+
+
+class MinTree(SegmentTree):
+    """
+    The segment tree whose nodes hold the minimum of their children.
+
+    Args:
+        capacity (int): the number of leaves.
+    """
+
+    def __init__(self, capacity):
+        super().__init__(capacity, np.minimum, np.inf)
+
+
+class HostPriorityReplayBuffer(nn.Cell):
+    """
+    The priority replay buffer implemented by NumPy sum-tree and min-tree, which has the same interface as
+    PriorityReplayBuffer but does not depend on the native priority replay buffer kernels. The trees and
+    the transitions live in host memory, and the operations are wrapped by PyFunc, so that it can be used in
+    MindSpore Graph Mode on any backend.
+
+    The sampling is stratified, the total priority is divided into `sample_size` segments and a transition is
+    sampled from each segment. The sampling and the priority updates are vectorized over the batch and take
+    O(log N) steps.
+
+    Args:
+        alpha (float): parameter to control degree of prioritization.
+            0 means the uniform sampling, 1 means priority sampling.
+        beta (float): parameter to control degree of sampling correction.
+            0 means the no correction, 1 means full correction.
+        capacity (int): the capacity of the buffer.
+        sample_size (int): size for sampling from the buffer.
+        shapes (List[int]): the shape of each tensor in a buffer element.
+        types (List[mindspore.dtype]): the data type of each tensor in a buffer element.
+        seed0 (int): Seed0 value for random generating. Default: 0.
+        seed1 (int): Seed1 value for random generating. Default: 0.
+
+    Examples:
+        >>> import mindspore as ms
+        >>> from mindspore_rl.core import HostPriorityReplayBuffer
+        >>> capacity = 10000
+        >>> batch_size = 10
+        >>> alpha, beta = 1., 1.
+        >>> shapes = [(4,), (1,), (1,), (4,)]
+        >>> dtypes = [ms.float32, ms.int32, ms.float32, ms.float32]
+        >>> replaybuffer = HostPriorityReplayBuffer(alpha, beta, capacity, batch_size, shapes, dtypes)
+        >>> print(replaybuffer)
+        HostPriorityReplayBuffer<>
+    """
+
+    def __init__(self, alpha, beta, capacity, sample_size, shapes, dtypes, seed0=0, seed1=0):
+        super(HostPriorityReplayBuffer, self).__init__()
+        if capacity < 1:
+            raise ValueError(f"The capacity of replay buffer should be positive, but got {capacity}.")
+        self._alpha = alpha
+        self._beta = beta
+        self._capacity = capacity
+        self._sample_size = sample_size
+        self._shapes = [tuple(shape) for shape in shapes]
+        self._types = list(dtypes)
+        self._np_types = [mstype.dtype_to_nptype(t) for t in self._types]
+
+        self._columns = [np.zeros((capacity,) + shape, np_type)
+                         for shape, np_type in zip(self._shapes, self._np_types)]
+        self.sum_tree = SumTree(capacity)
+        self.min_tree = MinTree(capacity)
+        self._max_priority = 1.
+        self._total = 0
+        seed = None if seed0 == 0 and seed1 == 0 else [seed0, seed1]
+        self._rng = np.random.default_rng(seed)
+
+        sample_shapes = [(sample_size,), (sample_size,)] + [(sample_size,) + shape for shape in self._shapes]
+        self.push_op = P.PyFunc(self._push, self._types, self._shapes, [ms.bool_], [(1,)])
+        self.sample_op = P.PyFunc(self._sample, [], [], [ms.int64, ms.float32] + self._types, sample_shapes)
+        self.update_op = P.PyFunc(self._update_priorities, [ms.int64, ms.float32],
+                                  [(sample_size,), (sample_size,)], [ms.bool_], [(1,)])
+        self.destroy_op = P.PyFunc(self._destroy, [], [], [ms.bool_], [(1,)])
+
+    def push(self, *transition):
+        """
+        Push a transition to the buffer. If the buffer is full, the oldest one will be removed.
+        The priority of the new transition is the maximum priority so far.
+
+        Args:
+            transition (List[Tensor]): insert a list of tensor which matches with the initialized shapes
+                and dtypes into the buffer.
+
+        Returns:
+            success (Tensor), whether the push is successful or not.
+        """
+
+        return self.push_op(*transition)[0]
+
+    def sample(self):
+        """
+        Samples a batch of transitions from the replay buffer.
+
+        Returns:
+            indices (Tensor), the transition indices in the replay buffer.
+            weights (Tensor), the weight used to correct for sampling bias.
+            transitions (tuple(Tensor)), transitions with variable-length tensors.
+        """
+
+        return self.sample_op()
+
+    def update_priorities(self, indices, priorities):
+        """
+        Update transition prorities.
+
+        Args:
+            indices (Tensor) - transition indices. The caller needs to ensure the validity of the indices.
+            priorities (Tensor) - transition priorities.
+
+        Returns:
+            success (Tensor), whether the update is successful or not.
+        """
+
+        return self.update_op(indices, priorities)[0]
+
+    def destroy(self):
+        r"""
+        Destroy the replay buffer and release the host memory.
+
+        Returns:
+            success (Tensor), whether the destroy is successful or not.
+        """
+
+        return self.destroy_op()[0]
+
+    def snapshot(self, directory, chunk_size=65536, background=False):
+        """
+        Save the transitions and the priorities of the buffer to a snapshot directory. Only the valid
+        rows are written, chunk by chunk.
+
+        Args:
+            directory (str): the directory of the snapshot, which is replaced if it exists.
+            chunk_size (int): the number of rows written at a time. Default: 65536.
+            background (bool): write in a background thread. The transitions are copied before the thread
+                starts, so the buffer can be used during the writing. Default: False.
+
+        Returns:
+            writer (SnapshotWriter), the writer to join if `background` is True, otherwise None.
+        """
+
+        size = self._size()
+        arrays = {'column_%d' % i: column[:size] for i, column in enumerate(self._columns)}
+        if background:
+            arrays = {name: array.copy() for name, array in arrays.items()}
+        # The leaves of the trees hold the priorities to the power of alpha.
+        arrays['priorities'] = self.sum_tree.get(np.arange(size))
+        meta = {'type': 'HostPriorityReplayBuffer', 'capacity': self._capacity, 'shapes': self._shapes,
+                'total': self._total, 'max_priority': self._max_priority}
+        return save_snapshot(directory, meta, arrays, chunk_size, background)
+
+    def restore(self, directory):
+        """
+        Restore the buffer from a snapshot directory, which is memory-mapped and copied into the buffer.
+
+        Args:
+            directory (str): the directory of the snapshot.
+        """
+
+        meta, arrays = load_snapshot(directory)
+        check_snapshot(meta, 'HostPriorityReplayBuffer', capacity=self._capacity,
+                       shapes=[list(shape) for shape in self._shapes])
+        size = min(meta['total'], self._capacity)
+        self._columns = [np.zeros((self._capacity,) + shape, np_type)
+                         for shape, np_type in zip(self._shapes, self._np_types)]
+        for i, column in enumerate(self._columns):
+            column[:size] = arrays['column_%d' % i]
+        self.sum_tree.reset()
+        self.min_tree.reset()
+        if size > 0:
+            self.sum_tree.update(np.arange(size), arrays['priorities'])
+            self.min_tree.update(np.arange(size), arrays['priorities'])
+        self._total = meta['total']
+        self._max_priority = meta['max_priority']
+
+    def _size(self):
+        """The number of transitions in the buffer."""
+        return min(self._total, self._capacity)
+
+    def _push(self, *transition):
+        """PyFunc entry of push."""
+        slot = self._total % self._capacity
+        for column, data in zip(self._columns, transition):
+            column[slot] = data
+        priority = self._max_priority ** self._alpha
+        self.sum_tree.update([slot], priority)
+        self.min_tree.update([slot], priority)
+        self._total += 1
+        return np.array([True], np.bool_)
+
+    def _sample(self):
+        """PyFunc entry of sample."""
+        size = self._size()
+        if size == 0:
+            raise RuntimeError("Can not sample from an empty replay buffer.")
+        total_priority = self.sum_tree.root
+        segment = total_priority / self._sample_size
+        masses = (np.arange(self._sample_size) + self._rng.random(self._sample_size)) * segment
+        indices = np.minimum(self.sum_tree.find_prefix_sum(masses), size - 1)
+
+        # The weights are normalized by the maximum weight, which belongs to the minimum priority.
+        probabilities = self.sum_tree.get(indices) / total_priority
+        min_probability = self.min_tree.root / total_priority
+        weights = np.power(probabilities / min_probability, -self._beta).astype(np.float32)
+        transitions = [column[indices] for column in self._columns]
+        return tuple([indices.astype(np.int64), weights] + transitions)
+
+    def _update_priorities(self, indices, priorities):
+        """PyFunc entry of update_priorities."""
+        priorities = np.asarray(priorities, np.float64)
+        self._max_priority = max(self._max_priority, float(priorities.max()))
+        priorities = np.power(priorities, self._alpha)
+        self.sum_tree.update(indices, priorities)
+        self.min_tree.update(indices, priorities)
+        return np.array([True], np.bool_)
+
+    def _destroy(self):
+        """PyFunc entry of destroy."""
+        self._columns = []
+        self.sum_tree.reset()
+        self.min_tree.reset()
+        self._total = 0
+        return np.array([True], np.bool_)
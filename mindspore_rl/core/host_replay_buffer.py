@@ -0,0 +1,210 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Implementation of the base class of host replay buffers.
+"""
+
+import threading
+import numpy as np
+import mindspore as ms
+import mindspore.nn as nn
+from mindspore.common import dtype as mstype
+from mindspore.ops import operations as P
+
+
+class HostReplayBuffer(nn.Cell):
+    """
+    The base class of replay buffers whose storage lives in host memory and is operated by NumPy code.
+    The python code is wrapped by PyFunc, so that the buffer can be used in MindSpore Graph Mode with the
+    same `insert/sample/get_item/reset/size/full` interface as ReplayBuffer.
+
+    The subclass should override the private functions `_insert`, `_sample`, `_get_item`, `_reset`
+    and `_size`, which take and return numpy arrays.
+
+    Args:
+        batch_size (int): size for sampling from the buffer.
+        capacity (int): the capacity of the buffer.
+        shapes (List[int]): the shape of each tensor in a buffer element.
+        types (List[mindspore.dtype]): the data type of each tensor in a buffer element.
+    """
+
+    def __init__(self, batch_size, capacity, shapes, types):
+        super().__init__()
+        if capacity < 1:
+            raise ValueError(f"The capacity of replay buffer should be positive, but got {capacity}.")
+        self._batch_size = batch_size
+        self._capacity = capacity
+        self._shapes = [tuple(shape) for shape in shapes]
+        self._types = list(types)
+        self._np_types = [mstype.dtype_to_nptype(t) for t in self._types]
+        # The numpy types of the outputs of sample and get_item.
+        self._output_np_types = list(self._np_types)
+
+        # The types and shapes of the outputs of sample.
+        self._sample_types = list(self._types)
+        self._sample_shapes = [(batch_size,) + shape for shape in self._shapes]
+        # The number of insertions and resets since the creation, which are used to measure the staleness
+        # of samples.
+        self._insert_count = 0
+        self._reset_count = 0
+        # The lock of the storage, the wrappers may be called by the background sampler thread.
+        self._lock = threading.RLock()
+
+        self._insert_op = P.PyFunc(self._insert_wrapper, self._types, self._shapes, [ms.bool_], [(1,)])
+        self._sample_op = P.PyFunc(self._sample_wrapper, [], [], self._sample_types, self._sample_shapes)
+        self._get_item_op = P.PyFunc(self._get_item_wrapper, [ms.int32], [(1,)], self._types, self._shapes)
+        self._reset_op = P.PyFunc(self._reset_wrapper, [], [], [ms.bool_], [(1,)])
+        self._size_op = P.PyFunc(self._size_wrapper, [], [], [ms.int32], [(1,)])
+        self._full_op = P.PyFunc(self._full_wrapper, [], [], [ms.bool_], [(1,)])
+        self.reshape = P.Reshape()
+
+    @property
+    def capacity(self):
+        """The capacity of the buffer."""
+        return self._capacity
+
+    def insert(self, exp):
+        """
+        Insert an element to the buffer. If the buffer is full, FIFO strategy will be used to
+        replace the element in the buffer.
+
+        Args:
+            exp (List[Tensor]): insert a list of tensor which matches with the initialized shape
+                and type into the buffer.
+
+        Returns:
+             success (Tensor), whether the insertion is successful or not.
+        """
+
+        return self._insert_op(*exp)[0]
+
+    def get_item(self, index):
+        """
+        Get an element from the replaybuffer in specific position(index).
+
+        Args:
+            index (int): the location of the item, 0 stands for the oldest element.
+
+        Returns:
+            element (List[Tensor]), the element from the buffer.
+        """
+
+        index = self.reshape(index, (1,))
+        return self._get_item_op(index)
+
+    def sample(self):
+        """
+        Sampling the replaybuffer, which means that it will randomly choose a set of element
+        and output them.
+
+        Returns:
+            data (Tuple(Tensor)), A set of sampled elements from the buffer.
+        """
+
+        return self._sample_op()
+
+    def reset(self):
+        """
+        Reset the replaybuffer. It changes the number of elements to zero.
+
+        Returns:
+            success (Tensor), whether the reset successful or not.
+        """
+
+        return self._reset_op()[0]
+
+    def size(self):
+        """
+        Return the size of the replybuffer.
+
+        Returns:
+            size (Tensor), the number of element in the replaybuffer.
+        """
+
+        return self._size_op()[0]
+
+    def full(self):
+        """
+        Check if the replaybuffer is full or not.
+
+        Returns:
+            Full(Tensor), True if the replaybuffer is full, False otherwise.
+        """
+
+        return self._full_op()[0]
+
+    def _insert(self, *exp):
+        """Insert one element. Should be overridden by subclass."""
+        raise NotImplementedError("Method should be overridden by subclass.")
+
+    def _sample(self):
+        """Sample a batch of elements, return a tuple of numpy array. Should be overridden by subclass."""
+        raise NotImplementedError("Method should be overridden by subclass.")
+
+    def _get_item(self, index):
+        """Get the element at position index. Should be overridden by subclass."""
+        raise NotImplementedError("Method should be overridden by subclass.")
+
+    def _reset(self):
+        """Remove all the elements. Should be overridden by subclass."""
+        raise NotImplementedError("Method should be overridden by subclass.")
+
+    def _size(self):
+        """Return the number of elements. Should be overridden by subclass."""
+        raise NotImplementedError("Method should be overridden by subclass.")
+
+    def _insert_wrapper(self, *exp):
+        """PyFunc entry of insert."""
+        with self._lock:
+            self._insert(*exp)
+            self._insert_count += 1
+        return np.array([True], np.bool_)
+
+    def _sample_wrapper(self):
+        """PyFunc entry of sample."""
+        with self._lock:
+            if self._size() == 0:
+                raise RuntimeError("Can not sample from an empty replay buffer.")
+            outputs = self._sample()
+        return tuple(data.astype(np_type, copy=False) for data, np_type in zip(outputs, self._output_np_types))
+
+    def _get_item_wrapper(self, index):
+        """PyFunc entry of get_item."""
+        index = int(index[0])
+        with self._lock:
+            size = self._size()
+            if index < 0:
+                index += size
+            if index < 0 or index >= size:
+                raise IndexError(f"The index {index} is out of the range of replay buffer with size {size}.")
+            outputs = self._get_item(index)
+        return tuple(data.astype(np_type, copy=False) for data, np_type in zip(outputs, self._output_np_types))
+
+    def _reset_wrapper(self):
+        """PyFunc entry of reset."""
+        with self._lock:
+            self._reset()
+            self._reset_count += 1
+        return np.array([True], np.bool_)
+
+    def _size_wrapper(self):
+        """PyFunc entry of size."""
+        with self._lock:
+            return np.array([self._size()], np.int32)
+
+    def _full_wrapper(self):
+        """PyFunc entry of full."""
+        with self._lock:
+            return np.array([self._size() >= self._capacity], np.bool_)
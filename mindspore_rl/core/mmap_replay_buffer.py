@@ -0,0 +1,160 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Implementation of memory-mapped Replay Buffer class.
+"""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+from mindspore_rl.core.host_replay_buffer import HostReplayBuffer
+
+
+class MmapReplayBuffer(HostReplayBuffer):
+    """
+    The memory-mapped replay buffer keeps its columns in `numpy.memmap` files, so the capacity is bounded by
+    disk space instead of host/device memory. The most recent elements are kept in an in-memory hot window and
+    written to disk in bulk when the window is full. Sampled rows are gathered from disk in ascending order
+    of position, which turns random reads into a forward scan that is friendly to the page cache.
+
+    It has the same interface as ReplayBuffer, and can be selected by the `type` of `replay_buffer`
+    in the algorithm configuration. The extra arguments can be passed by the `params` of `replay_buffer`.
+
+    Args:
+        batch_size (int): size for sampling from the buffer.
+        capacity (int): the capacity of the buffer.
+        shapes (List[int]): the shape of each tensor in a buffer element.
+        types (List[mindspore.dtype]): the data type of each tensor in a buffer element.
+        directory (str): the directory to store the memory-mapped files. If it is None, a temporary
+            directory will be created and removed when the buffer is destroyed. When the `number` of
+            `replay_buffer` is more than 1, the i-th buffer uses the subdirectory `buffer_<i>` of it.
+            Default: None.
+        hot_size (int): the number of recent elements kept in memory before they are written to disk.
+            Default: 4096.
+        seed (int): the seed of the random generator used in sampling. Default: None.
+
+    Examples:
+        >>> batch_size = 64
+        >>> capacity = 10000000
+        >>> shapes = [(4,), (1,), (1,), (4,)]
+        >>> types = [ms.float32, ms.int32, ms.float32, ms.float32]
+        >>> replaybuffer = MmapReplayBuffer(batch_size, capacity, shapes, types, directory='./buffer')
+        >>> print(replaybuffer)
+        MmapReplayBuffer<>
+    """
+
+    def __init__(self, batch_size, capacity, shapes, types, directory=None, hot_size=4096, seed=None):
+        super().__init__(batch_size, capacity, shapes, types)
+        if hot_size < 1:
+            raise ValueError(f"The hot_size of MmapReplayBuffer should be positive, but got {hot_size}.")
+        self._remove_directory = directory is None
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix='mmap_replay_buffer_')
+        elif not os.path.exists(directory):
+            os.makedirs(directory)
+        self._directory = directory
+
+        self._columns = []
+        for i, (shape, np_type) in enumerate(zip(self._shapes, self._np_types)):
+            path = os.path.join(directory, 'column_%d.dat' % i)
+            self._columns.append(np.memmap(path, dtype=np_type, mode='w+', shape=(capacity,) + shape))
+        self._hot_size = min(hot_size, capacity)
+        self._hot = [np.zeros((self._hot_size,) + shape, np_type)
+                     for shape, np_type in zip(self._shapes, self._np_types)]
+        # The number of elements inserted since the last reset. The element i is stored in slot i % capacity.
+        self._total = 0
+        # The number of the most recent elements that only exist in the hot window.
+        self._hot_count = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def directory(self):
+        """The directory of the memory-mapped files."""
+        return self._directory
+
+    def flush(self):
+        """Write the hot window to the memory-mapped files, and flush the files to disk."""
+        self._flush_hot()
+        for column in self._columns:
+            column.flush()
+
+    def destroy(self):
+        """Close the memory-mapped files. The files are removed if the directory is created by the buffer."""
+        self.flush()
+        self._columns = []
+        self._hot = []
+        if self._remove_directory:
+            shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _insert(self, *exp):
+        if self._hot_count == self._hot_size:
+            self._flush_hot()
+        for hot, data in zip(self._hot, exp):
+            hot[self._hot_count] = data
+        self._hot_count += 1
+        self._total += 1
+
+    def _sample(self):
+        size = self._size()
+        positions = self._rng.integers(0, size, self._batch_size)
+        return self._gather(positions)
+
+    def _get_item(self, index):
+        return [data[0] for data in self._gather(np.array([index]))]
+
+    def _reset(self):
+        self._total = 0
+        self._hot_count = 0
+
+    def _size(self):
+        return min(self._total, self._capacity)
+
+    def _gather(self, positions):
+        """
+        Gather the elements at the input positions, which count from the oldest element. The elements in hot
+        window are read from memory, and the others are read from disk in ascending order of their slots.
+        """
+        size = self._size()
+        # The index of element since the last reset.
+        element_index = self._total - size + positions
+        hot_begin = self._total - self._hot_count
+        in_hot = element_index >= hot_begin
+        hot_index = (element_index[in_hot] - hot_begin)
+        cold_slots = element_index[~in_hot] % self._capacity
+        order = np.argsort(cold_slots, kind='stable')
+        sorted_slots = cold_slots[order]
+
+        outputs = []
+        for column, hot in zip(self._columns, self._hot):
+            data = np.empty((len(positions),) + column.shape[1:], column.dtype)
+            data[in_hot] = hot[hot_index]
+            cold = np.empty((len(sorted_slots),) + column.shape[1:], column.dtype)
+            cold[order] = column[sorted_slots]
+            data[~in_hot] = cold
+            outputs.append(data)
+        return outputs
+
+    def _flush_hot(self):
+        """Write the elements in hot window to the memory-mapped files in at most two contiguous blocks."""
+        if self._hot_count == 0:
+            return
+        begin = (self._total - self._hot_count) % self._capacity
+        first = min(self._hot_count, self._capacity - begin)
+        for column, hot in zip(self._columns, self._hot):
+            column[begin:begin + first] = hot[:first]
+            if first < self._hot_count:
+                column[:self._hot_count - first] = hot[first:self._hot_count]
+        self._hot_count = 0
@@ -17,9 +17,29 @@ Implementation of MSRL class.
 """
 
 import inspect
+import os
 import mindspore.nn as nn
 from mindspore.ops import operations as P
+from mindspore.ops.primitive import constexpr
 from mindspore_rl.environment.multi_environment_wrapper import MultiEnvironmentWrapper
+from mindspore_rl.environment.env_process import EnvironmentFactory
+from mindspore_rl.core.prefetch_sampler import PrefetchSampler
+
+
+@constexpr
+def _swap_first_axes(rank):
+    """The permutation which swaps the first two axes of a tensor."""
+    return (1, 0) + tuple(range(2, rank))
+
+
+def _freeze_config(config):
+    """Convert the configuration to nested tuples with the dicts sorted by key, ignoring the insertion order."""
+    if isinstance(config, dict):
+        return tuple(sorted(((repr(key), _freeze_config(value)) for key, value in config.items()),
+                            key=lambda item: item[0]))
+    if isinstance(config, (list, tuple)):
+        return tuple(_freeze_config(value) for value in config)
+    return config
 
 
 class MSRL(nn.Cell):
@@ -43,6 +63,8 @@ class MSRL(nn.Cell):
     Args:
         alg_config(dict): provides the algorithm configuration.
         deploy_config(dict): provides the distribute configuration.
+        env_pool(EnvironmentPool): if it is set, the batch environments are acquired from the pool,
+            which reuses the environment processes of the same configuration. Default: None.
 
             - Top level: defines the algorithm components.
 
@@ -60,17 +82,33 @@ class MSRL(nn.Cell):
               - key: 'type',        value: the type of the
                 actor/learner/policy_and_network/environment (class name).
               - key: 'params',      value: the parameters of
-                actor/learner/policy_and_network/environment (dict).
+                actor/learner/policy_and_network/environment/replay_buffer (dict).
               - key: 'policies',    value: the list of policies used by the
                 actor/learner (list).
               - key: 'networks',    value: the list of networks used by the
                 actor/learner (list).
               - key: 'pass_environment', value: True user needs to pass the environment
                 instance into actor, False otherwise (Bool).
+              - key: 'prefetch',    value: the `size` and `max_staleness` of the PrefetchSampler
+                of the replay buffer, which should be a HostReplayBuffer (dict).
+              - key: 'transport',   value: 'queue' or 'shared_memory', the way the batch environment
+                passes the actions and results to the environment processes (str).
+              - key: 'num_ready',   value: the number of environments returned by `recv` of the
+                asynchronous stepping of the collect environment, see MultiEnvironmentWrapper (int).
+              - key: 'auto_reset',  value: whether the batch environment resets the finished
+                environments where they run, and 'terminal_observation' whether its step also
+                returns the states before the reset, see MultiEnvironmentWrapper (bool).
+              - key: 'rebalance_interval', value: the number of steps between the rebalances of the
+                environments over the processes, see MultiEnvironmentWrapper (int).
+              - key: 'start_method', value: the start method of the environment processes, such as
+                'spawn', see MultiEnvironmentWrapper (str).
+              - key: 'instrument', value: whether the batch environment records the latency histograms
+                of the environments, which EnvironmentStatsCallback reports, see MultiEnvironmentWrapper (bool).
     """
 
-    def __init__(self, alg_config, deploy_config=None):
+    def __init__(self, alg_config, deploy_config=None, env_pool=None):
         super(MSRL, self).__init__()
+        self.env_pool = env_pool
         self.actors = []
         self.learner = None
         self.envs = []
@@ -89,6 +127,7 @@ class MSRL(nn.Cell):
         self.replay_buffer_insert = None
         self.replay_buffer_full = None
         self.replay_buffer_reset = None
+        self.sampler = None
 
         compulsory_items = [
             'eval_environment', 'collect_environment', 'policy_and_network',
@@ -130,23 +169,40 @@ class MSRL(nn.Cell):
             obj = class_type(params, actor_id)
         return obj
 
-    def _create_batch_env(self, sub_config, env_num, proc_num):
+    def _create_batch_env(self, sub_config, env_num, proc_num, num_ready=None, lazy=False, role='collect'):
         """
         Create the batch environments object from the sub_config,
-        and return the instance of a batch env.
+        and return the instance of a batch env. The environments are created by the
+        environment processes from their factories.
 
         Args:
             sub_config (dict): algorithm config of env.
             env_num (int): number of environment to be created.
             proc_num (int): the process for environment.
+            num_ready (int): the number of environments returned by the asynchronous stepping. Default: None.
+            lazy (bool): whether to start the environment processes at the first use. Default: False.
+            role (str): 'collect' or 'eval', the batch environments of different roles are not shared by the
+                env_pool. Default: 'collect'.
 
         Returns:
             - batch_env (object), the created batch-environment object.
         """
-        env_list = []
-        for i in range(env_num):
-            env_list.append(self._create_instance(sub_config, i))
-        return MultiEnvironmentWrapper(env_list, proc_num)
+        def create():
+            env_list = [EnvironmentFactory(sub_config['type'], sub_config['params'], i) for i in range(env_num)]
+            return MultiEnvironmentWrapper(env_list, proc_num, sub_config.get('transport', 'queue'), num_ready,
+                                           sub_config.get('auto_reset', False),
+                                           sub_config.get('terminal_observation', False),
+                                           sub_config.get('rebalance_interval'),
+                                           sub_config.get('start_method'), lazy,
+                                           sub_config.get('instrument', False))
+
+        if self.env_pool is None:
+            return create()
+        # The seed is not a part of the key, the reused batch environment is reseeded by it instead.
+        params = {name: value for name, value in sub_config['params'].items() if name != 'seed'}
+        config = dict(sub_config, params=params)
+        key = repr((role, _freeze_config(config), env_num, proc_num, num_ready))
+        return self.env_pool.acquire(key, create, sub_config['params'].get('seed'))
 
     def __create_environments(self, config, num_agent=1):
         """
@@ -200,13 +256,16 @@ class MSRL(nn.Cell):
         config['eval_environment']['params']['num_agent'] = num_agent
 
         if self.num_collect_env > 1:
-            collect_env = self._create_batch_env(config['eval_environment'], self.num_collect_env, collect_proc_num)
-            eval_env = self._create_batch_env(config['eval_environment'], num_eval_env, eval_proc_num)
+            collect_env = self._create_batch_env(config['collect_environment'], self.num_collect_env, collect_proc_num,
+                                                 collect_env_config.get('num_ready'))
+            eval_env = self._create_batch_env(config['eval_environment'], num_eval_env, eval_proc_num, lazy=True,
+                                              role='eval')
         else:
             collect_env = self._create_instance(config['collect_environment'], None)
             if num_eval_env > 1:
                 collect_env = MultiEnvironmentWrapper([collect_env], collect_proc_num)
-                eval_env = self._create_batch_env(config['eval_environment'], num_eval_env, eval_proc_num)
+                eval_env = self._create_batch_env(config['eval_environment'], num_eval_env, eval_proc_num,
+                                                  lazy=True, role='eval')
             else:
                 eval_env = self._create_instance(config['eval_environment'], None)
 
@@ -261,15 +320,24 @@ class MSRL(nn.Cell):
         sample_size = replay_buffer_config.get('sample_size')
         if not sample_size:
             sample_size = 1
+        # The extra parameters of the replay buffer type, such as the directory of MmapReplayBuffer.
+        buffer_params = replay_buffer_config.get('params')
+        if not buffer_params:
+            buffer_params = {}
 
         if num_replay_buffer == 1:
             buffer = replay_buffer_type(sample_size, capacity,
-                                        buffer_data_shapes, buffer_data_type)
+                                        buffer_data_shapes, buffer_data_type, **buffer_params)
         else:
-            buffer = [
-                replay_buffer_type(sample_size, capacity, buffer_data_shapes,
-                                   buffer_data_type) for _ in range(num_replay_buffer)
-            ]
+            buffer = []
+            for i in range(num_replay_buffer):
+                params = dict(buffer_params)
+                # Each buffer stores its files in its own subdirectory, otherwise the buffers would truncate and
+                # overwrite the files of each other.
+                if params.get('directory') is not None:
+                    params['directory'] = os.path.join(params['directory'], 'buffer_%d' % i)
+                buffer.append(replay_buffer_type(sample_size, capacity, buffer_data_shapes,
+                                                 buffer_data_type, **params))
             buffer = nn.CellList(buffer)
         return buffer
 
@@ -394,6 +462,10 @@ class MSRL(nn.Cell):
                 self.replay_buffer_insert = replay_buffer_insert
             else:
                 self.replay_buffer_sample = self.buffers.sample
+                prefetch_config = replay_buffer_config.get('prefetch')
+                if prefetch_config:
+                    self.sampler = PrefetchSampler(self.buffers, **prefetch_config)
+                    self.replay_buffer_sample = self.sampler.sample
                 self.replay_buffer_insert = self.buffers.insert
                 self.replay_buffer_full = self.buffers.full
                 self.replay_buffer_reset = self.buffers.reset
@@ -457,24 +529,37 @@ class MSRL(nn.Cell):
 
         return self.buffers
 
-    def get_replay_buffer_elements(self, transpose=False, shape=None):
+    def get_replay_buffer_elements(self, transpose=False, shape=None, layout=None):
         """
         It will return all the elements in the replay buffer.
 
+        The buffer stores one row per insertion, so its columns are time-major, in shape
+        (capacity, num_envs, ...) when each insertion holds a step of all the environments. The time-major
+        layout returns the columns as they are stored, without any copy. The env-major layout swaps the
+        first two axes by a transpose, which copies the whole columns.
+
         Args:
             transpose (bool): whether the output element needs to be transpose,
                 if transpose is true, shape will also need to be filled. Default: False
             shape (Tuple[int]): the shape used in transpose. Default: None
+            layout (str): the layout of the output elements, 'time_major' or 'env_major'. If it is set,
+                `transpose` and `shape` are ignored. Default: None
 
         Returns:
             elements (List[Tensor]), A set of tensor contains all the elements in the replay buffer
         """
 
+        if layout not in (None, 'time_major', 'env_major'):
+            raise ValueError(f"The layout should be 'time_major' or 'env_major', but got {layout}.")
+        if layout is not None:
+            transpose = layout == 'env_major'
+            shape = None
         transpose_op = P.Transpose()
         elements = ()
         for e in self.buffers.buffer:
             if transpose:
-                e = transpose_op(e, shape)
+                perm = shape if shape is not None else _swap_first_axes(len(e.shape))
+                e = transpose_op(e, perm)
                 elements += (e,)
             else:
                 elements += (e,)
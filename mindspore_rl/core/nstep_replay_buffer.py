@@ -0,0 +1,265 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Implementation of N-step return Replay Buffer class.
+"""
+
+import numpy as np
+import mindspore as ms
+from mindspore import context, Tensor
+from mindspore.ops import operations as P
+from mindspore.common.parameter import Parameter, ParameterTuple
+import mindspore.nn as nn
+from mindspore_rl.core.replay_buffer import ReplayBuffer
+from mindspore_rl.core.priority_replay_buffer import PriorityReplayBuffer
+
+
+class NStepReplayBuffer(nn.Cell):
+    """
+    The replay buffer which stores N-step transitions. The inserted 1-step transitions are kept in a window
+    of N elements, in which the discounted rewards are accumulated incrementally at each insertion. Once a
+    transition has accumulated N rewards, or its episode is done, it is written to the backend buffer as
+
+    `[..., reward_{t}^{(n)}, state_{t+n}, done, ..., discount]`
+
+    where the reward column holds the discounted N-step return, the new state column holds the bootstrap
+    state, and an extra float32 column of shape (1,) holds the bootstrap discount :math:`\\gamma^n`, which is 0
+    if the episode is done within the N steps. So the target is `reward + discount * Q(new_state)`.
+
+    The transitions of the window are written to the backend one per insertion, so the last transitions of an
+    episode stay in the window until the next insertions.
+
+    Args:
+        batch_size (int): size for sampling from the buffer.
+        capacity (int): the capacity of the backend buffer.
+        shapes (List[int]): the shape of each tensor in an inserted element.
+        types (List[mindspore.dtype]): the data type of each tensor in an inserted element.
+        n_step (int): the number of steps of the return. Default: 3.
+        gamma (float): the discount factor. Default: 0.99.
+        reward_index (int): the index of reward in an element, the reward should be float32. Default: 2.
+        next_state_index (int): the index of new state in an element. Default: 3.
+        done_index (int): the index of done in an element. Default: 4.
+        backend (type): the class of backend buffer, ReplayBuffer or PriorityReplayBuffer. Default: ReplayBuffer.
+        backend_params (dict): the extra arguments of the backend, such as `alpha` and `beta` of
+            PriorityReplayBuffer. Default: None.
+
+    Examples:
+        >>> batch_size = 64
+        >>> capacity = 100000
+        >>> shapes = [(17,), (6,), (1,), (17,), (1,)]
+        >>> types = [ms.float32, ms.float32, ms.float32, ms.float32, ms.bool_]
+        >>> replaybuffer = NStepReplayBuffer(batch_size, capacity, shapes, types, n_step=3)
+        >>> print(replaybuffer)
+        NStepReplayBuffer<>
+    """
+
+    def __init__(self, batch_size, capacity, shapes, types, n_step=3, gamma=0.99, reward_index=2,
+                 next_state_index=3, done_index=4, backend=ReplayBuffer, backend_params=None):
+        nn.Cell.__init__(self)
+        if n_step < 1:
+            raise ValueError(f"The n_step of NStepReplayBuffer should be positive, but got {n_step}.")
+        shapes = [tuple(shape) for shape in shapes]
+        types = list(types)
+        self._n_step = n_step
+        self._shapes = shapes
+        self._reward_index = reward_index % len(shapes)
+        self._next_state_index = next_state_index % len(shapes)
+        self._done_index = done_index % len(shapes)
+
+        backend_shapes = shapes + [(1,)]
+        backend_types = types + [ms.float32]
+        backend_params = dict(backend_params or {})
+        self._priority = issubclass(backend, PriorityReplayBuffer)
+        if self._priority:
+            alpha = backend_params.pop('alpha', 1.)
+            beta = backend_params.pop('beta', 1.)
+            self.backend = backend(alpha, beta, capacity, batch_size, backend_shapes, backend_types,
+                                   **backend_params)
+        else:
+            self.backend = backend(batch_size, capacity, backend_shapes, backend_types, **backend_params)
+
+        # The window of the pending transitions, which is a ring of n_step slots.
+        window = []
+        for i, (shape, dtype) in enumerate(zip(shapes, types)):
+            if i == self._reward_index:
+                dtype = ms.float32
+            window.append(Parameter(Tensor(np.zeros((n_step,) + shape), dtype), name=('window_%d' % i),
+                                    requires_grad=False))
+        self.window = ParameterTuple(window)
+        self.discount = Parameter(Tensor(np.ones((n_step, 1)), ms.float32), name="discount", requires_grad=False)
+        # The number of accumulated rewards of each transition.
+        self.age = Parameter(Tensor(np.zeros((n_step,)), ms.int32), name="age", requires_grad=False)
+        # Whether the episode of the transition is still running, 1 for running and 0 for done.
+        self.running = Parameter(Tensor(np.zeros((n_step,)), ms.float32), name="running", requires_grad=False)
+        self.window_count = Parameter(Tensor(0, ms.int32), name="window_count", requires_grad=False)
+        self.window_head = Parameter(Tensor(0, ms.int32), name="window_head", requires_grad=False)
+
+        self.gamma = Tensor(gamma, ms.float32)
+        self.zero = Tensor(0, ms.int32)
+        self.one = Tensor(1., ms.float32)
+        self.half = Tensor(0.5, ms.float32)
+        self.finished = Tensor([0.], ms.float32)
+        self.zero_reward = Tensor(np.zeros((1,) + shapes[self._reward_index]), ms.float32)
+        self.n_step_tensor = Tensor([n_step], ms.int32)
+        self.reset_discount = Tensor(np.ones((n_step, 1)), ms.float32)
+        self.reset_age = Tensor(np.zeros((n_step,)), ms.int32)
+        self.reset_running = Tensor(np.zeros((n_step,)), ms.float32)
+        self.broadcasts = [P.BroadcastTo((n_step,) + shape) for shape in shapes]
+
+        self.assign = P.Assign()
+        self.cast = P.Cast()
+        self.reshape = P.Reshape()
+        self.gather = P.Gather()
+        self.select = P.Select()
+        self.floor_mod = P.FloorMod()
+        self.logical_or = P.LogicalOr()
+        self.less = P.Less()
+        self.greater = P.Greater()
+        self.greater_equal = P.GreaterEqual()
+        self.scatter_update = P.ScatterUpdate()
+        if context.get_context('device_target') in ['Ascend']:
+            self.scatter_update.add_prim_attr('primitive_target', 'CPU')
+
+    def insert(self, exp):
+        """
+        Insert a 1-step transition to the window, and write the oldest transition in the window to the backend
+        if its N-step return is complete.
+
+        Args:
+            exp (List[Tensor]): insert a list of tensor which matches with the initialized shape
+                and type into the buffer.
+
+        Returns:
+             written (Tensor), whether a N-step transition is written to the backend.
+        """
+
+        # Put the new transition at the tail of the window.
+        tail = self.reshape(self.floor_mod(self.window_head + self.window_count, self._n_step), (1,))
+        for i in range(len(self.window)):
+            data = self.zero_reward if i == self._reward_index else exp[i]
+            self.scatter_update(self.window[i], tail, self.reshape(data, (1,) + self._shapes[i]))
+        self.scatter_update(self.discount, tail, self.reshape(self.one, (1, 1)))
+        self.scatter_update(self.age, tail, self.reshape(self.zero, (1,)))
+        self.scatter_update(self.running, tail, self.reshape(self.one, (1,)))
+        self.assign(self.window_count, self.window_count + 1)
+
+        # Accumulate the reward to the transitions whose episode is running.
+        running = self.running
+        not_done = self.one - self.reshape(self.cast(exp[self._done_index], ms.float32), (1,))
+        reward = self.reshape(self.cast(exp[self._reward_index], ms.float32), (1,) + self._shapes[self._reward_index])
+        reward_running = self.reshape(running, (self._n_step,) + (1,) * len(self._shapes[self._reward_index]))
+        reward_discount = self.reshape(self.discount, (self._n_step,) + (1,) * len(self._shapes[self._reward_index]))
+        self.assign(self.window[self._reward_index],
+                    self.window[self._reward_index] + reward_running * reward_discount * reward)
+        running_2d = self.reshape(running, (self._n_step, 1))
+        self.assign(self.discount, self.discount * (self.one - running_2d + running_2d * self.gamma * not_done))
+        self.assign(self.age, self.age + self.cast(running, ms.int32))
+        for i in (self._next_state_index, self._done_index):
+            mask = self.reshape(self.greater(running, self.half), (self._n_step,) + (1,) * len(self._shapes[i]))
+            mask = self.broadcasts[i](mask)
+            value = self.broadcasts[i](self.reshape(exp[i], (1,) + self._shapes[i]))
+            self.assign(self.window[i], self.select(mask, value, self.window[i]))
+        self.assign(self.running, running * not_done)
+
+        # Write the oldest transition if its return is complete.
+        head = self.reshape(self.window_head, (1,))
+        done = self.less(self.gather(self.running, head, 0), self.half)
+        written = self.logical_or(done, self.greater_equal(self.gather(self.age, head, 0), self.n_step_tensor))
+        if written:
+            transition = []
+            for i in range(len(self.window)):
+                transition.append(self.reshape(self.gather(self.window[i], head, 0), self._shapes[i]))
+            transition.append(self.reshape(self.gather(self.discount, head, 0), (1,)))
+            if self._priority:
+                self.backend.push(*transition)
+            else:
+                self.backend.insert(transition)
+            self.scatter_update(self.running, head, self.finished)
+            self.assign(self.window_head, self.floor_mod(self.window_head + 1, self._n_step))
+            self.assign(self.window_count, self.window_count - 1)
+        return written
+
+    def sample(self):
+        """
+        Sample a batch of N-step transitions from the backend.
+
+        Returns:
+            data (Tuple(Tensor)), the output of `sample` of the backend. For PriorityReplayBuffer, the
+            indices and weights are output before the transitions.
+        """
+
+        return self.backend.sample()
+
+    def update_priorities(self, indices, priorities):
+        """
+        Update the priorities of transitions if the backend is PriorityReplayBuffer.
+
+        Args:
+            indices (Tensor): transition indices.
+            priorities (Tensor): transition priorities.
+
+        Returns:
+            tuple(Tensor), the output of `update_priorities` of the backend.
+        """
+
+        return self.backend.update_priorities(indices, priorities)
+
+    def get_item(self, index):
+        """
+        Get an N-step transition from the backend ReplayBuffer in specific position(index).
+
+        Args:
+            index (int): the location of the item.
+
+        Returns:
+            element (List[Tensor]), the element from the buffer.
+        """
+
+        return self.backend.get_item(index)
+
+    def reset(self):
+        """
+        Drop the pending transitions in the window, and reset the backend ReplayBuffer.
+
+        Returns:
+            success (boolean), whether the reset successful or not.
+        """
+
+        self.assign(self.window_count, self.zero)
+        self.assign(self.window_head, self.zero)
+        self.assign(self.discount, self.reset_discount)
+        self.assign(self.age, self.reset_age)
+        self.assign(self.running, self.reset_running)
+        return self.backend.reset()
+
+    def size(self):
+        """
+        Return the number of N-step transitions in the backend ReplayBuffer.
+
+        Returns:
+            size (int), the number of element in the replaybuffer.
+        """
+
+        return self.backend.size()
+
+    def full(self):
+        """
+        Check if the backend ReplayBuffer is full or not.
+
+        Returns:
+            Full(bool), True if the replaybuffer is full, False otherwise.
+        """
+
+        return self.backend.full()
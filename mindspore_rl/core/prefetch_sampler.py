@@ -0,0 +1,135 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Implementation of the background prefetching sampler of host replay buffers.
+"""
+
+# pylint: disable=W0212
+import queue
+import threading
+import mindspore.nn as nn
+from mindspore.ops import operations as P
+from mindspore_rl.core.host_replay_buffer import HostReplayBuffer
+
+
+class PrefetchSampler(nn.Cell):
+    """
+    The sampler which samples a HostReplayBuffer in a background thread, and keeps up to `size` batches
+    ready in a bounded queue, so that the sampling latency is hidden behind the learning step.
+
+    A batch is sampled after some insertions of the buffer. When it is fetched, it is dropped if more than
+    `max_staleness` insertions or any reset have happened since it was sampled, and a fresh batch is used.
+    So the output batch never misses more than `max_staleness` newest elements. If no batch is ready,
+    the sampling is done in the calling thread.
+
+    It can be enabled by the `prefetch` of `replay_buffer` in the algorithm configuration, such as
+    `'prefetch': {'size': 4, 'max_staleness': 16}`, then `MSRL.replay_buffer_sample` uses the sampler.
+
+    Args:
+        buffer (HostReplayBuffer): the replay buffer to sample.
+        size (int): the maximum number of prefetched batches. Default: 2.
+        max_staleness (int): the maximum number of insertions after a batch is sampled. As a batch waits for
+            about `size` samplings in the queue, it should be larger than `size` times the insertions per
+            sampling, otherwise most of the batches are dropped. Default: 16.
+
+    Examples:
+        >>> buffer = MmapReplayBuffer(64, 1000000, shapes, types)
+        >>> sampler = PrefetchSampler(buffer, size=4, max_staleness=16)
+        >>> data = sampler.sample()
+        >>> sampler.close()
+    """
+
+    def __init__(self, buffer, size=2, max_staleness=16):
+        super().__init__()
+        if not isinstance(buffer, HostReplayBuffer):
+            raise TypeError(f"The buffer of PrefetchSampler should be a HostReplayBuffer, but got {type(buffer)}.")
+        if size < 1 or max_staleness < 0:
+            raise ValueError(f"The size of PrefetchSampler should be positive and the max_staleness should not be "
+                             f"negative, but got {size} and {max_staleness}.")
+        self._buffer = buffer
+        self._max_staleness = max_staleness
+        self._queue = queue.Queue(size)
+        self._stop = threading.Event()
+        self._thread = None
+        self._prefetched = 0
+        self._dropped = 0
+        self._sample_op = P.PyFunc(self._sample_wrapper, [], [], buffer._sample_types, buffer._sample_shapes)
+
+    @property
+    def stats(self):
+        """The number of the batches output from the queue and dropped for staleness."""
+        return {'prefetched': self._prefetched, 'dropped': self._dropped}
+
+    def sample(self):
+        """
+        Output a prefetched batch of the buffer. The background thread is started at the first call.
+
+        Returns:
+            data (Tuple(Tensor)), A set of sampled elements from the buffer.
+        """
+
+        return self._sample_op()
+
+    def close(self):
+        """Stop the background thread and drop the prefetched batches."""
+        self._stop.set()
+        self._drain()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._drain()
+        self._stop.clear()
+
+    def _drain(self):
+        """Drop all the batches in the queue."""
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _prefetch(self):
+        """The loop of the background thread."""
+        while not self._stop.is_set():
+            with self._buffer._lock:
+                version = (self._buffer._reset_count, self._buffer._insert_count)
+                batch = self._buffer._sample_wrapper() if self._buffer._size() > 0 else None
+            if batch is None:
+                # The buffer is reset, wait for the new elements.
+                self._stop.wait(0.01)
+                continue
+            while not self._stop.is_set():
+                # Wake up periodically to check whether the sampler is closed.
+                try:
+                    self._queue.put((version, batch), timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def _sample_wrapper(self):
+        """PyFunc entry of sample."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._prefetch, name='prefetch_sampler', daemon=True)
+            self._thread.start()
+        while True:
+            try:
+                (reset_count, insert_count), batch = self._queue.get_nowait()
+            except queue.Empty:
+                return self._buffer._sample_wrapper()
+            if reset_count == self._buffer._reset_count and \
+                    self._buffer._insert_count - insert_count <= self._max_staleness:
+                self._prefetched += 1
+                return batch
+            self._dropped += 1
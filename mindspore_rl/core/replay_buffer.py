@@ -19,9 +19,12 @@ Implementation of Replay Buffer class.
 import numpy as np
 import mindspore as ms
 from mindspore import context, Tensor
+from mindspore.common import dtype as mstype
 from mindspore.ops import operations as P
+from mindspore.ops.primitive import constexpr
 from mindspore.common.parameter import Parameter, ParameterTuple
 import mindspore.nn as nn
+from mindspore_rl.core.buffer_snapshot import save_snapshot, load_snapshot, check_snapshot
 
 
 def _create_tensor(capacity, shapes, types):
@@ -43,6 +46,14 @@ def _create_tensor(capacity, shapes, types):
     return buffer
 
 
+@constexpr
+def _batch_offsets(n, capacity):
+    """Create the constant offsets [0, n) used to locate the slots of a batched insertion."""
+    if n < 1 or n > capacity:
+        raise ValueError(f"The batch size of insert_batch should be in [1, {capacity}], but got {n}.")
+    return Tensor(np.arange(n), ms.int32)
+
+
 class ReplayBuffer(nn.Cell):
     """
     The replay buffer class.
@@ -94,9 +105,16 @@ class ReplayBuffer(nn.Cell):
 
         self.reshape = P.Reshape()
         self.assign = P.Assign()
+        self.scatter_update = P.ScatterUpdate()
+        self.minimum = P.Minimum()
+        self.maximum = P.Maximum()
+        self.floor_mod = P.FloorMod()
+        if context.get_context('device_target') in ['Ascend']:
+            self.scatter_update.add_prim_attr('primitive_target', 'CPU')
 
         self.greater_equal = P.GreaterEqual()
         self.capacity_tensor = Tensor([capacity,], ms.int32)
+        self._shapes = [tuple(shape) for shape in shapes]
 
     def insert(self, exp):
         """
@@ -114,6 +132,31 @@ class ReplayBuffer(nn.Cell):
         self.buffer_append(self.buffer, exp, self.count, self.head)
         return self.buffer
 
+    def insert_batch(self, exp, n):
+        """
+        Insert n independent elements to the buffer in one call. Each tensor in `exp` holds n elements
+        stacked along the first dimension. The elements are written at the same positions that n sequential
+        calls of `insert` would use, and the FIFO strategy is applied when the buffer wraps around.
+
+        Args:
+            exp (List[Tensor]): insert a list of tensor, the i-th tensor is in shape (n,) + shapes[i].
+            n (int): the number of elements in `exp`. It should not be larger than the capacity.
+
+        Returns:
+             element (List[Tensor]), return the whole buffer after insertion
+        """
+
+        offsets = _batch_offsets(n, self._capacity)
+        # While the buffer is not full, head stays 0 and the next slot is count. Once the buffer is full,
+        # count equals capacity and the next slot is head. Both cases are covered by (head + count) % capacity.
+        indices = self.floor_mod(self.head + self.count + offsets, self._capacity)
+        for i in range(len(self.buffer)):
+            self.scatter_update(self.buffer[i], indices, exp[i])
+        overflow = self.maximum(self.count + n - self._capacity, self.zero)
+        self.assign(self.head, self.floor_mod(self.head + overflow, self._capacity))
+        self.assign(self.count, self.minimum(self.count + n, self._capacity))
+        return self.buffer
+
     def get_item(self, index):
         """
         Get an element from the replaybuffer in specific position(index).
@@ -170,3 +213,45 @@ class ReplayBuffer(nn.Cell):
         count = self.reshape(self.count, (1,))
         capacity = self.reshape(self.capacity_tensor, (1,))
         return self.greater_equal(count, capacity)
+
+    def snapshot(self, directory, chunk_size=65536, background=False):
+        """
+        Save the elements, `count` and `head` of the buffer to a snapshot directory. Only the `count` valid
+        rows of each column are written, chunk by chunk.
+
+        Args:
+            directory (str): the directory of the snapshot, which is replaced if it exists.
+            chunk_size (int): the number of rows written at a time. Default: 65536.
+            background (bool): write in a background thread. The columns are copied before the thread
+                starts, so the buffer can be used during the writing. Default: False.
+
+        Returns:
+            writer (SnapshotWriter), the writer to join if `background` is True, otherwise None.
+        """
+
+        count = int(self.count.asnumpy())
+        columns = [column.asnumpy()[:count] for column in self.buffer]
+        if background:
+            columns = [column.copy() for column in columns]
+        meta = {'type': 'ReplayBuffer', 'capacity': self._capacity, 'shapes': self._shapes,
+                'count': count, 'head': int(self.head.asnumpy())}
+        arrays = {'column_%d' % i: column for i, column in enumerate(columns)}
+        return save_snapshot(directory, meta, arrays, chunk_size, background)
+
+    def restore(self, directory):
+        """
+        Restore the buffer from a snapshot directory, which is memory-mapped and copied into the buffer.
+
+        Args:
+            directory (str): the directory of the snapshot.
+        """
+
+        meta, arrays = load_snapshot(directory)
+        check_snapshot(meta, 'ReplayBuffer', capacity=self._capacity, shapes=[list(s) for s in self._shapes])
+        count = meta['count']
+        for i, column in enumerate(self.buffer):
+            data = np.zeros(column.shape, mstype.dtype_to_nptype(column.dtype))
+            data[:count] = arrays['column_%d' % i]
+            column.set_data(Tensor(data))
+        self.count.set_data(Tensor(count, ms.int32))
+        self.head.set_data(Tensor(meta['head'], ms.int32))
@@ -49,10 +49,13 @@ class Session():
         deploy_config (dict): the deployment configuration for distribution. Default: None.
             For more details of configuration of algorithm, please have a look at
             https://www.mindspore.cn/reinforcement/docs/zh-CN/master/custom_config_info.html
+        env_pool (EnvironmentPool): the pool which keeps the environment processes alive after the run, so
+            that the next Session of the same environment configuration reuses them. Default: None.
     """
 
-    def __init__(self, alg_config, deploy_config=None):
-        self.msrl = MSRL(alg_config, deploy_config)
+    def __init__(self, alg_config, deploy_config=None, env_pool=None):
+        self.msrl = MSRL(alg_config, deploy_config, env_pool)
+        self.env_pool = env_pool
         self.dist = False
         if deploy_config:
             if deploy_config['distributed']:
@@ -97,12 +100,12 @@ class Session():
                 else:
                     print('Please provide a ckpt_path for eval.')
 
-        if isinstance(self.msrl.collect_environment, MultiEnvironmentWrapper):
-            if self.msrl.collect_environment.num_proc != 1:
-                for collect_env in self.msrl.collect_environment.mpe_env_procs:
-                    collect_env.terminate()
+        for env in (self.msrl.collect_environment, self.msrl.eval_environment):
+            if isinstance(env, MultiEnvironmentWrapper):
+                if self.env_pool is not None:
+                    self.env_pool.release(env)
+                else:
+                    env.close()
 
-        if isinstance(self.msrl.eval_environment, MultiEnvironmentWrapper):
-            if self.msrl.eval_environment.num_proc != 1:
-                for eval_env in self.msrl.eval_environment.mpe_env_procs:
-                    eval_env.terminate()
+        if self.msrl.sampler is not None:
+            self.msrl.sampler.close()
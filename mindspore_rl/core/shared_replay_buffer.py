@@ -0,0 +1,268 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Implementation of the shared memory Replay Buffer split into per-writer shards.
+"""
+
+import uuid
+from multiprocessing import shared_memory
+import numpy as np
+from mindspore_rl.core.host_replay_buffer import HostReplayBuffer
+
+
+def _attach(name):
+    """
+    Attach an existing shared memory block, which is owned and unlinked by the SharedReplayBuffer.
+    The processes started by multiprocessing share the resource tracker with the owner, and the block
+    is not tracked if the Python version supports it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedReplayBufferWriter:
+    """
+    The writer of a shard of SharedReplayBuffer, which can be sent to an actor process. Each shard should be
+    written by only one writer, so no lock is needed. The shared memory is attached at the first insertion
+    in the process.
+
+    Args:
+        name (str): the name of the SharedReplayBuffer.
+        shard (int): the index of the shard to write.
+        shard_capacity (int): the capacity of each shard.
+        shapes (List[tuple]): the shape of each tensor in a buffer element.
+        np_types (List[numpy.dtype]): the numpy type of each tensor in a buffer element.
+        num_shards (int): the number of shards.
+    """
+
+    def __init__(self, name, shard, shard_capacity, shapes, np_types, num_shards):
+        self._name = name
+        self._shard = shard
+        self._shard_capacity = shard_capacity
+        self._shapes = shapes
+        self._np_types = np_types
+        self._num_shards = num_shards
+        self._blocks = None
+        self._columns = None
+        self._counters = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update({'_blocks': None, '_columns': None, '_counters': None})
+        return state
+
+    @property
+    def shard(self):
+        """The index of the shard."""
+        return self._shard
+
+    def insert(self, *exp):
+        """
+        Insert an element to the shard. If the shard is full, FIFO strategy will be used to replace the
+        oldest element of the shard.
+
+        Args:
+            exp (List[numpy.ndarray]): the element which matches with the shapes and types of the buffer.
+        """
+
+        if self._blocks is None:
+            self._open()
+        count = self._counters[self._shard]
+        slot = count % self._shard_capacity
+        for column, data in zip(self._columns, exp):
+            column[self._shard, slot] = data
+        # Publish the element after it is written, the readers only read the published elements.
+        self._counters[self._shard] = count + 1
+
+    def close(self):
+        """Detach the shared memory."""
+        self._columns = None
+        self._counters = None
+        if self._blocks is not None:
+            for block in self._blocks:
+                block.close()
+            self._blocks = None
+
+    def _open(self):
+        """Attach the shared memory of the buffer."""
+        self._blocks = [_attach('%s_column_%d' % (self._name, i)) for i in range(len(self._shapes))]
+        self._blocks.append(_attach('%s_counters' % self._name))
+        self._columns = [np.ndarray((self._num_shards, self._shard_capacity) + shape, np_type, block.buf)
+                         for shape, np_type, block in zip(self._shapes, self._np_types, self._blocks)]
+        self._counters = np.ndarray((self._num_shards,), np.int64, self._blocks[-1].buf)
+
+
+class SharedReplayBuffer(HostReplayBuffer):
+    """
+    The replay buffer whose storage lives in POSIX shared memory and is split into `num_shards` shards of
+    equal capacity. Each actor process writes to its own shard by a SharedReplayBufferWriter without lock
+    and without pickling the transitions, and the learner samples across the shards with weights
+    proportional to the shard sizes, which is the uniform sampling over all the elements.
+
+    An element is published by increasing the counter of its shard after the element is written, and the
+    slot which is going to be overwritten by the writer of a full shard is never sampled. As the writers
+    keep writing while the learner reads, the counters are read again after the elements are gathered, and
+    the elements which are overwritten in the meantime are sampled again, like a seqlock.
+
+    It has the same interface as ReplayBuffer, and can be selected by the `type` of `replay_buffer`
+    in the algorithm configuration. The `insert` of the cell writes to the shard 0.
+
+    Args:
+        batch_size (int): size for sampling from the buffer.
+        capacity (int): the capacity of the buffer, which is divided equally by the shards, so it should be
+            a multiple of `num_shards`.
+        shapes (List[int]): the shape of each tensor in a buffer element.
+        types (List[mindspore.dtype]): the data type of each tensor in a buffer element.
+        num_shards (int): the number of shards. Default: 1.
+        name (str): the prefix of the names of the shared memory blocks. If it is None, a unique name
+            is generated. Default: None.
+        seed (int): the seed of the random generator used in sampling. Default: None.
+
+    Examples:
+        >>> replaybuffer = SharedReplayBuffer(64, 100000, shapes, types, num_shards=4)
+        >>> actors = [multiprocessing.Process(target=actor_loop, args=(replaybuffer.writer(i),))
+        ...           for i in range(4)]
+        >>> data = replaybuffer.sample()
+        >>> replaybuffer.destroy()
+    """
+
+    def __init__(self, batch_size, capacity, shapes, types, num_shards=1, name=None, seed=None):
+        super().__init__(batch_size, capacity, shapes, types)
+        if num_shards < 1 or capacity < 2 * num_shards:
+            raise ValueError(f"The num_shards of SharedReplayBuffer should be in [1, {capacity // 2}], "
+                             f"but got {num_shards}.")
+        if capacity % num_shards != 0:
+            raise ValueError(f"The capacity of SharedReplayBuffer should be a multiple of the num_shards "
+                             f"{num_shards}, but got {capacity}.")
+        self._num_shards = num_shards
+        self._shard_capacity = capacity // num_shards
+        self._name = name if name is not None else 'replay_buffer_%s' % uuid.uuid4().hex[:12]
+
+        self._blocks = []
+        self._columns = []
+        for i, (shape, np_type) in enumerate(zip(self._shapes, self._np_types)):
+            column_shape = (num_shards, self._shard_capacity) + shape
+            nbytes = max(int(np.prod(column_shape)) * np.dtype(np_type).itemsize, 1)
+            block = shared_memory.SharedMemory(name='%s_column_%d' % (self._name, i), create=True, size=nbytes)
+            self._blocks.append(block)
+            self._columns.append(np.ndarray(column_shape, np_type, block.buf))
+        block = shared_memory.SharedMemory(name='%s_counters' % self._name, create=True,
+                                           size=num_shards * np.dtype(np.int64).itemsize)
+        self._blocks.append(block)
+        # The number of elements written to each shard since the last reset.
+        self._counters = np.ndarray((num_shards,), np.int64, block.buf)
+        self._counters[:] = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def name(self):
+        """The prefix of the names of the shared memory blocks."""
+        return self._name
+
+    @property
+    def num_shards(self):
+        """The number of shards."""
+        return self._num_shards
+
+    def writer(self, shard):
+        """
+        Create the writer of a shard, which can be sent to another process.
+
+        Args:
+            shard (int): the index of the shard.
+
+        Returns:
+            writer (SharedReplayBufferWriter), the writer of the shard.
+        """
+
+        if shard < 0 or shard >= self._num_shards:
+            raise IndexError(f"The shard {shard} is out of the range of {self._num_shards} shards.")
+        return SharedReplayBufferWriter(self._name, shard, self._shard_capacity, self._shapes, self._np_types,
+                                        self._num_shards)
+
+    def shard_sizes(self):
+        """
+        Return the number of readable elements in each shard.
+
+        Returns:
+            sizes (numpy.ndarray), the sizes of the shards.
+        """
+
+        return self._readable(self._counters.copy())
+
+    def destroy(self):
+        """Release and remove the shared memory. The writers should be closed before."""
+        self._columns = []
+        self._counters = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def _insert(self, *exp):
+        count = self._counters[0]
+        for column, data in zip(self._columns, exp):
+            column[0, count % self._shard_capacity] = data
+        self._counters[0] = count + 1
+
+    def _sample(self):
+        batch = [np.empty((self._batch_size,) + shape, np_type)
+                 for shape, np_type in zip(self._shapes, self._np_types)]
+        rows = np.arange(self._batch_size)
+        while rows.size > 0:
+            counters = self._counters.copy()
+            sizes = self._readable(counters)
+            shards = self._rng.choice(self._num_shards, rows.size, p=sizes / sizes.sum())
+            offsets = (self._rng.random(rows.size) * sizes[shards]).astype(np.int64)
+            # The index of each element in its shard since the last reset.
+            elements = counters[shards] - sizes[shards] + offsets
+            for data, column in zip(batch, self._columns):
+                data[rows] = column[shards, elements % self._shard_capacity]
+            rows = rows[self._overwritten(shards, elements)]
+        return batch
+
+    def _get_item(self, index):
+        while True:
+            counters = self._counters.copy()
+            sizes = self._readable(counters)
+            shard = int(np.searchsorted(np.cumsum(sizes), index, side='right'))
+            offset = index - int(sizes[:shard].sum())
+            element = counters[shard] - sizes[shard] + offset
+            item = [column[shard, element % self._shard_capacity].copy() for column in self._columns]
+            if not self._overwritten(shard, element):
+                return item
+
+    def _reset(self):
+        self._counters[:] = 0
+
+    def _size(self):
+        return int(self.shard_sizes().sum())
+
+    def _full_wrapper(self):
+        """PyFunc entry of full, the buffer is full when all the shards are full."""
+        return np.array([np.all(self._counters >= self._shard_capacity)], np.bool_)
+
+    def _overwritten(self, shards, elements):
+        """Whether the elements of the shards are overwritten, or are being overwritten, by the writers."""
+        # The writer of a shard whose counter is c may be writing the element c, whose slot is shared with the
+        # elements before c by multiples of the shard capacity.
+        return elements + self._shard_capacity <= self._counters[shards]
+
+    def _readable(self, counters):
+        """The number of readable elements of each shard with the counters."""
+        # The slot of a full shard which is going to be overwritten is excluded.
+        return np.where(counters >= self._shard_capacity, self._shard_capacity - 1, counters)
@@ -22,12 +22,23 @@ from mindspore_rl.environment.environment import Environment
 from mindspore_rl.environment.tag_environment import TagEnvironment
 from mindspore_rl.environment.ms_environment import ms_register, MsEnvironment
 from mindspore_rl.environment.space import Space
-from mindspore_rl.environment.env_process import EnvironmentProcess
+from mindspore_rl.environment.env_process import EnvironmentProcess, SharedEnvArrays, EnvironmentFactory
+from mindspore_rl.environment.env_stats import EnvironmentStats
 from mindspore_rl.environment.multi_environment_wrapper import MultiEnvironmentWrapper
+from mindspore_rl.environment.environment_pool import EnvironmentPool
 from mindspore_rl.environment.sc2_environment import StarCraft2Environment
-from mindspore_rl.environment.tic_tac_toe_environment import TicTacToeEnvironment
+from mindspore_rl.environment.tic_tac_toe_environment import TicTacToeEnvironment, BatchTicTacToeEnvironment
+from mindspore_rl.environment.numpy_policy import NumpyMLPPolicy
+from mindspore_rl.environment.classic_control_environment import CartPoleEnvironment, PendulumEnvironment, \
+    MountainCarEnvironment, AcrobotEnvironment
 
 __all__ = ["GymEnvironment", "MultiEnvironmentWrapper", "Environment", "Space", "MsEnvironment", "EnvironmentProcess",
-           "StarCraft2Environment", "TicTacToeEnvironment"]
+           "SharedEnvArrays", "EnvironmentFactory", "EnvironmentStats", "EnvironmentPool", "StarCraft2Environment",
+           "TicTacToeEnvironment", "NumpyMLPPolicy", "BatchTicTacToeEnvironment", "CartPoleEnvironment",
+           "PendulumEnvironment", "MountainCarEnvironment", "AcrobotEnvironment"]
 
 ms_register('Tag', TagEnvironment)
+ms_register('CartPole', CartPoleEnvironment)
+ms_register('Pendulum', PendulumEnvironment)
+ms_register('MountainCar', MountainCarEnvironment)
+ms_register('Acrobot', AcrobotEnvironment)
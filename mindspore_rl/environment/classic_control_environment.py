@@ -0,0 +1,414 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+The vectorized NumPy implementations of the Gym classic control environments.
+"""
+
+import numpy as np
+from mindspore.ops import operations as P
+from mindspore_rl.environment.environment import Environment
+from mindspore_rl.environment.space import Space
+
+_float_max = np.finfo(np.float32).max
+
+
+class ClassicControlEnvironment(Environment):
+    """
+    The base class of the vectorized classic control environments, which step all the `environment_num`
+    instances with array operations in one PyFunc call. The spaces are the spaces of the GymEnvironment of
+    the same game, with the batch shape (environment_num,). The finished instances are reset in the step,
+    and the step returns the initial states of their new episodes.
+
+    Args:
+        defaults (dict): The default configurations of the subclass, which contain 'max_timestep'.
+        kwargs (dict): The configurations, 'environment_num' (default 1), 'seed' (default 42) and 'max_timestep'
+            are common to all the environments.
+        observation_space (tuple): The feature shape, lower and upper boundaries of a single observation.
+        action_space (tuple): The feature shape, numpy dtype, lower and upper boundaries of a single action.
+    """
+
+    def __init__(self, defaults, kwargs, observation_space, action_space):
+        super(ClassicControlEnvironment, self).__init__()
+        self._config = dict({'environment_num': 1, 'seed': 42}, **defaults)
+        for key in kwargs:
+            if key not in self._config:
+                raise ValueError(f"The key {key} is not supported by {type(self).__name__}.")
+            self._config[key] = kwargs[key]
+
+        num = self._config['environment_num']
+        batch_shape = (num,)
+        self._observation_space = Space(observation_space[0], np.float32, low=observation_space[1],
+                                        high=observation_space[2], batch_shape=batch_shape)
+        self._action_space = Space(action_space[0], action_space[1], low=action_space[2], high=action_space[3],
+                                   batch_shape=batch_shape)
+        self._reward_space = Space((1,), np.float32, batch_shape=batch_shape)
+        self._done_space = Space((1,), np.bool_, low=0, high=2, batch_shape=batch_shape)
+        self._rng = np.random.default_rng(self._config['seed'])
+        self._max_timestep = self._config['max_timestep']
+        self._timestep = np.zeros((num,), np.int64)
+        self._state = None
+
+        self._reset_op = P.PyFunc(self._reset, (), (), (self._observation_space.ms_dtype,),
+                                  (self._observation_space.shape,))
+        self._step_op = P.PyFunc(self._step, (self._action_space.ms_dtype,), (self._action_space.shape,),
+                                 (self._observation_space.ms_dtype, self._reward_space.ms_dtype,
+                                  self._done_space.ms_dtype),
+                                 (self._observation_space.shape, self._reward_space.shape, self._done_space.shape))
+
+    def reset(self):
+        """
+        Reset all the environments.
+
+        Returns:
+            A tensor which states for the initial states of the environments.
+        """
+
+        return self._reset_op()[0]
+
+    def step(self, action):
+        r"""
+        Step all the environments, and reset the finished ones.
+
+        Args:
+            action (Tensor): A tensor that contains the actions of the environments.
+
+        Returns:
+            - state (Tensor), the states after performing the actions, or the initial states of the new episodes.
+            - reward (Tensor), the rewards after performing the actions.
+            - done (Tensor), whether the simulations finish or not.
+        """
+
+        return self._step_op(action)
+
+    @property
+    def observation_space(self):
+        """
+        Get the state space of the environment.
+
+        Returns:
+            The state space of environment.
+        """
+
+        return self._observation_space
+
+    @property
+    def action_space(self):
+        """
+        Get the action space of the environment.
+
+        Returns:
+            The action space of environment.
+        """
+
+        return self._action_space
+
+    @property
+    def reward_space(self):
+        """
+        Get the reward space of the environment.
+
+        Returns:
+            The reward space of environment.
+        """
+
+        return self._reward_space
+
+    @property
+    def done_space(self):
+        """
+        Get the done space of the environment.
+
+        Returns:
+            The done space of environment.
+        """
+
+        return self._done_space
+
+    @property
+    def config(self):
+        """
+        Get the config of environment.
+
+        Returns:
+            A dictionary which contains environment's info.
+        """
+
+        return self._config
+
+    def _reset(self):
+        """
+        The python code of resetting all the environments.
+
+        Returns:
+            A numpy array which states for the initial states of the environments.
+        """
+
+        self._state = self._initial_state(self._config['environment_num'])
+        self._timestep[:] = 0
+        return self._observation()
+
+    def _step(self, action):
+        """
+        The python code of stepping all the environments.
+
+        Args:
+            action (numpy.ndarray): The actions of the environments.
+
+        Returns:
+            - s1 (numpy.ndarray), the states after performing the actions.
+            - r1 (numpy.ndarray), the rewards after performing the actions.
+            - done (numpy.ndarray), whether the simulations finish or not.
+        """
+
+        if self._state is None:
+            self._reset()
+        reward, terminal = self._dynamics(action)
+        self._timestep += 1
+        done = terminal | (self._timestep >= self._max_timestep)
+        if np.any(done):
+            self._state[done] = self._initial_state(int(done.sum()))
+            self._timestep[done] = 0
+        return self._observation(), reward.astype(np.float32)[:, None], done[:, None]
+
+    def _seed(self, seed):
+        """
+        The python code of reseeding the environments.
+
+        Args:
+            seed (int): The new seed.
+        """
+
+        self._rng = np.random.default_rng(seed)
+        self._state = None
+
+    def _initial_state(self, num):
+        """Sample the initial internal states of `num` environments."""
+        raise NotImplementedError("Method should be overridden by subclass.")
+
+    def _dynamics(self, action):
+        """Update the internal states in place, and return the rewards and whether the states are terminal."""
+        raise NotImplementedError("Method should be overridden by subclass.")
+
+    def _observation(self):
+        """The observations of the internal states."""
+        return self._state.astype(np.float32)
+
+
+class CartPoleEnvironment(ClassicControlEnvironment):
+    """
+    The vectorized CartPole, which is the same as CartPole-v0 of Gym by default.
+
+    Args:
+        kwargs (dict): 'environment_num' (default 1), 'seed' (default 42) and 'max_timestep' (default 200).
+
+    Examples:
+        >>> env = MsEnvironment({'name': 'CartPole', 'environment_num': 1024})
+        >>> state = env.reset()
+        >>> print(state.shape)
+        (1024, 4)
+    """
+
+    gravity = 9.8
+    masscart = 1.0
+    masspole = 0.1
+    total_mass = masspole + masscart
+    length = 0.5
+    polemass_length = masspole * length
+    force_mag = 10.0
+    tau = 0.02
+    theta_threshold = 12 * 2 * np.pi / 360
+    x_threshold = 2.4
+
+    def __init__(self, **kwargs):
+        high = np.array([self.x_threshold * 2, _float_max, self.theta_threshold * 2, _float_max], np.float32)
+        super(CartPoleEnvironment, self).__init__({'max_timestep': 200}, kwargs, ((4,), -high, high),
+                                                  ((), np.int32, 0, 2))
+
+    def _initial_state(self, num):
+        return self._rng.uniform(-0.05, 0.05, (num, 4))
+
+    def _dynamics(self, action):
+        x, x_dot, theta, theta_dot = self._state.T
+        force = np.where(action == 1, self.force_mag, -self.force_mag)
+        costheta = np.cos(theta)
+        sintheta = np.sin(theta)
+        temp = (force + self.polemass_length * theta_dot ** 2 * sintheta) / self.total_mass
+        thetaacc = (self.gravity * sintheta - costheta * temp) / (
+            self.length * (4.0 / 3.0 - self.masspole * costheta ** 2 / self.total_mass))
+        xacc = temp - self.polemass_length * thetaacc * costheta / self.total_mass
+        self._state = np.stack([x + self.tau * x_dot, x_dot + self.tau * xacc,
+                                theta + self.tau * theta_dot, theta_dot + self.tau * thetaacc], axis=1)
+        terminal = (np.abs(self._state[:, 0]) > self.x_threshold) | (np.abs(self._state[:, 2]) > self.theta_threshold)
+        return np.ones_like(x), terminal
+
+
+class PendulumEnvironment(ClassicControlEnvironment):
+    """
+    The vectorized Pendulum, which is the same as Pendulum-v1 of Gym by default.
+
+    Args:
+        kwargs (dict): 'environment_num' (default 1), 'seed' (default 42) and 'max_timestep' (default 200).
+
+    Examples:
+        >>> env = MsEnvironment({'name': 'Pendulum', 'environment_num': 1024})
+        >>> state = env.reset()
+        >>> print(state.shape)
+        (1024, 3)
+    """
+
+    max_speed = 8.0
+    max_torque = 2.0
+    dt = 0.05
+    g = 10.0
+    m = 1.0
+    l = 1.0
+
+    def __init__(self, **kwargs):
+        high = np.array([1.0, 1.0, self.max_speed], np.float32)
+        super(PendulumEnvironment, self).__init__({'max_timestep': 200}, kwargs, ((3,), -high, high),
+                                                  ((1,), np.float32, -self.max_torque, self.max_torque))
+
+    def _initial_state(self, num):
+        return self._rng.uniform([-np.pi, -1.0], [np.pi, 1.0], (num, 2))
+
+    def _dynamics(self, action):
+        th, thdot = self._state.T
+        u = np.clip(action.reshape(-1), -self.max_torque, self.max_torque)
+        normalized_th = ((th + np.pi) % (2 * np.pi)) - np.pi
+        costs = normalized_th ** 2 + 0.1 * thdot ** 2 + 0.001 * u ** 2
+        newthdot = thdot + (3 * self.g / (2 * self.l) * np.sin(th) + 3.0 / (self.m * self.l ** 2) * u) * self.dt
+        # The angle is updated by the speed before clipping, as Gym does.
+        newth = th + newthdot * self.dt
+        newthdot = np.clip(newthdot, -self.max_speed, self.max_speed)
+        self._state = np.stack([newth, newthdot], axis=1)
+        return -costs, np.zeros_like(th, np.bool_)
+
+    def _observation(self):
+        th, thdot = self._state.T
+        return np.stack([np.cos(th), np.sin(th), thdot], axis=1).astype(np.float32)
+
+
+class MountainCarEnvironment(ClassicControlEnvironment):
+    """
+    The vectorized MountainCar, which is the same as MountainCar-v0 of Gym by default.
+
+    Args:
+        kwargs (dict): 'environment_num' (default 1), 'seed' (default 42) and 'max_timestep' (default 200).
+
+    Examples:
+        >>> env = MsEnvironment({'name': 'MountainCar', 'environment_num': 1024})
+        >>> state = env.reset()
+        >>> print(state.shape)
+        (1024, 2)
+    """
+
+    min_position = -1.2
+    max_position = 0.6
+    max_speed = 0.07
+    goal_position = 0.5
+    force = 0.001
+    gravity = 0.0025
+
+    def __init__(self, **kwargs):
+        low = np.array([self.min_position, -self.max_speed], np.float32)
+        high = np.array([self.max_position, self.max_speed], np.float32)
+        super(MountainCarEnvironment, self).__init__({'max_timestep': 200}, kwargs, ((2,), low, high),
+                                                     ((), np.int32, 0, 3))
+
+    def _initial_state(self, num):
+        return np.stack([self._rng.uniform(-0.6, -0.4, num), np.zeros(num)], axis=1)
+
+    def _dynamics(self, action):
+        position, velocity = self._state.T
+        velocity = velocity + (action - 1) * self.force + np.cos(3 * position) * (-self.gravity)
+        velocity = np.clip(velocity, -self.max_speed, self.max_speed)
+        position = np.clip(position + velocity, self.min_position, self.max_position)
+        velocity = np.where((position == self.min_position) & (velocity < 0), 0.0, velocity)
+        self._state = np.stack([position, velocity], axis=1)
+        terminal = (position >= self.goal_position) & (velocity >= 0)
+        return -np.ones_like(position), terminal
+
+
+class AcrobotEnvironment(ClassicControlEnvironment):
+    """
+    The vectorized Acrobot, which is the same as Acrobot-v1 of Gym by default.
+
+    Args:
+        kwargs (dict): 'environment_num' (default 1), 'seed' (default 42) and 'max_timestep' (default 500).
+
+    Examples:
+        >>> env = MsEnvironment({'name': 'Acrobot', 'environment_num': 1024})
+        >>> state = env.reset()
+        >>> print(state.shape)
+        (1024, 6)
+    """
+
+    dt = 0.2
+    link_length_1 = 1.0
+    link_mass_1 = 1.0
+    link_mass_2 = 1.0
+    link_com_pos_1 = 0.5
+    link_com_pos_2 = 0.5
+    link_moi = 1.0
+    max_vel_1 = 4 * np.pi
+    max_vel_2 = 9 * np.pi
+
+    def __init__(self, **kwargs):
+        high = np.array([1.0, 1.0, 1.0, 1.0, self.max_vel_1, self.max_vel_2], np.float32)
+        super(AcrobotEnvironment, self).__init__({'max_timestep': 500}, kwargs, ((6,), -high, high),
+                                                 ((), np.int32, 0, 3))
+
+    def _initial_state(self, num):
+        return self._rng.uniform(-0.1, 0.1, (num, 4))
+
+    def _dynamics(self, action):
+        torque = action.astype(np.float64) - 1
+        # The 4th order Runge-Kutta integration over one step, as Gym does.
+        s = self._state
+        k1 = self._dsdt(s, torque)
+        k2 = self._dsdt(s + self.dt / 2 * k1, torque)
+        k3 = self._dsdt(s + self.dt / 2 * k2, torque)
+        k4 = self._dsdt(s + self.dt * k3, torque)
+        s = s + self.dt / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
+        s[:, :2] = (s[:, :2] + np.pi) % (2 * np.pi) - np.pi
+        s[:, 2] = np.clip(s[:, 2], -self.max_vel_1, self.max_vel_1)
+        s[:, 3] = np.clip(s[:, 3], -self.max_vel_2, self.max_vel_2)
+        self._state = s
+        terminal = -np.cos(s[:, 0]) - np.cos(s[:, 1] + s[:, 0]) > 1.0
+        return np.where(terminal, 0.0, -1.0), terminal
+
+    def _observation(self):
+        theta1, theta2, dtheta1, dtheta2 = self._state.T
+        return np.stack([np.cos(theta1), np.sin(theta1), np.cos(theta2), np.sin(theta2), dtheta1, dtheta2],
+                        axis=1).astype(np.float32)
+
+    def _dsdt(self, s, torque):
+        """The time derivative of the states, by the dynamics of the book of Sutton and Barto."""
+        m1, m2 = self.link_mass_1, self.link_mass_2
+        l1 = self.link_length_1
+        lc1, lc2 = self.link_com_pos_1, self.link_com_pos_2
+        i1 = i2 = self.link_moi
+        g = 9.8
+        theta1, theta2, dtheta1, dtheta2 = s.T
+        d1 = m1 * lc1 ** 2 + m2 * (l1 ** 2 + lc2 ** 2 + 2 * l1 * lc2 * np.cos(theta2)) + i1 + i2
+        d2 = m2 * (lc2 ** 2 + l1 * lc2 * np.cos(theta2)) + i2
+        phi2 = m2 * lc2 * g * np.cos(theta1 + theta2 - np.pi / 2.0)
+        phi1 = -m2 * l1 * lc2 * dtheta2 ** 2 * np.sin(theta2) \
+            - 2 * m2 * l1 * lc2 * dtheta2 * dtheta1 * np.sin(theta2) \
+            + (m1 * lc1 + m2 * l1) * g * np.cos(theta1 - np.pi / 2) + phi2
+        ddtheta2 = (torque + d2 / d1 * phi1 - m2 * l1 * lc2 * dtheta1 ** 2 * np.sin(theta2) - phi2) / \
+            (m2 * lc2 ** 2 + i2 - d2 ** 2 / d1)
+        ddtheta1 = -(d2 * ddtheta2 + phi1) / d1
+        return np.stack([dtheta1, dtheta2, ddtheta1, ddtheta2], axis=1)
@@ -17,10 +17,121 @@ The class uses the python process to manage and interact with environments.
 """
 
 #pylint: disable=W0212
-from multiprocessing import Process
+import ctypes
+import pickle
+import time
+import traceback
+from multiprocessing import Process, RawArray, get_context
 import numpy as np
 
 
+def auto_reset_step(env, action):
+    """
+    Step an environment, and reset it in place if the simulation finishes.
+
+    Args:
+        env (Environment): The environment to step.
+        action (numpy.ndarray): The action of the environment.
+
+    Returns:
+        - s1 (numpy.ndarray), the state after the step, or the initial state of the new episode.
+        - r1 (numpy.ndarray), the reward of the step.
+        - done (numpy.ndarray), whether the simulation finishes or not.
+        - terminal_s1 (numpy.ndarray), the state after the step, before the reset.
+    """
+    s, r, done = env._step(action)
+    if np.any(done):
+        return env._reset(), r, done, s
+    return s, r, done, s
+
+
+class EnvironmentFactory:
+    r"""
+    A picklable description of an environment, which is called to create the environment where it runs, such
+    as in an environment process. It can replace the environment instances passed to MultiEnvironmentWrapper,
+    then the environments are created in parallel by the processes, and the processes can be started by the
+    'spawn' start method.
+
+    Args:
+        env_type (type): The class of the environment.
+        params (dict): The parameters of the environment.
+        env_id (int): If it is set, it is passed to the environment after the parameters. Default: None.
+
+    Examples:
+        >>> factory = EnvironmentFactory(GymEnvironment, {'name': 'CartPole-v0'}, 0)
+        >>> env = factory()
+    """
+
+    def __init__(self, env_type, params, env_id=None):
+        self.env_type = env_type
+        self.params = params
+        self.env_id = env_id
+
+    def __call__(self):
+        if self.env_id is None:
+            return self.env_type(self.params)
+        return self.env_type(self.params, self.env_id)
+
+
+def create_environment(env):
+    """Create the environment if the input is an EnvironmentFactory, otherwise return the input."""
+    return env() if isinstance(env, EnvironmentFactory) else env
+
+
+def seed_environment(env, seed):
+    """Reseed the environment if it supports reseeding by `_seed`."""
+    if hasattr(env, '_seed'):
+        env._seed(seed)
+
+
+class SharedEnvArrays:
+    r"""
+    The preallocated shared memory arrays of the actions, observations, rewards and dones of a batch of
+    environments, indexed by the environment id. It can be passed to the environment processes, which
+    read the actions and write the results in place, so only a tiny signal crosses the processes.
+
+    Args:
+        num_envs (int): The number of environments.
+        specs (list(tuple)): The (shape, numpy dtype) of a single action, observation, reward and done, and
+            optionally the terminal observation.
+
+    Examples:
+        >>> specs = [(env.action_space.shape, env.action_space.np_dtype),
+        ...          (env.observation_space.shape, env.observation_space.np_dtype),
+        ...          (env.reward_space.shape, env.reward_space.np_dtype),
+        ...          (env.done_space.shape, env.done_space.np_dtype)]
+        >>> shared_arrays = SharedEnvArrays(8, specs)
+        >>> actions, observations, rewards, dones = shared_arrays.arrays()
+    """
+
+    def __init__(self, num_envs, specs):
+        self._specs = [((num_envs,) + tuple(shape), np.dtype(dtype)) for shape, dtype in specs]
+        self._raws = [RawArray(ctypes.c_byte, max(int(np.prod(shape)) * dtype.itemsize, 1))
+                      for shape, dtype in self._specs]
+        self._arrays = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_arrays'] = None
+        return state
+
+    def arrays(self):
+        """
+        The numpy views of the shared memory, which are created once in each process.
+
+        Returns:
+            - actions (numpy.ndarray), the actions of the environments.
+            - observations (numpy.ndarray), the observations of the environments.
+            - rewards (numpy.ndarray), the rewards of the environments.
+            - dones (numpy.ndarray), the dones of the environments.
+        """
+
+        if self._arrays is None:
+            self._arrays = tuple(np.frombuffer(raw, dtype, int(np.prod(shape))).reshape(shape)
+                                 for raw, (shape, dtype) in zip(self._raws, self._specs))
+        return self._arrays
+
+
 class EnvironmentProcess(Process):
     r"""
     An independent process responsible for creating and interacting with one or more environments.
@@ -28,10 +139,32 @@ class EnvironmentProcess(Process):
     Args:
         proc_no (int): The process number assigned by the caller.
         env_num (int): The number of input environments.
-        envs (list(Environment)): A list that contains instance of environment (subclass of Environment).
+        envs (list(Union[Environment, EnvironmentFactory])): A list that contains instance of environment
+            (subclass of Environment), or the factories which create the environments when the process starts.
         actions (Queue): The queue used to pass actions to the environment process.
         observations (Queue): The queue used to pass observations to the caller process.
         initial_states (Queue): The queue used to pass initial states to the caller process.
+        shared_arrays (SharedEnvArrays): If it is set, the actions are read from and the results are written
+            to the shared arrays, and the queues only pass the 'step'/'reset' signals and the process number.
+            Default: None.
+        env_offset (int): The id of the first input environment in the shared arrays. Default: 0.
+        auto_reset (bool): Whether to reset an environment in the process when its simulation finishes, then
+            the step returns the initial state of the new episode and the terminal state. Default: False.
+        stats (RawArray): If it is set, the process adds its busy time of stepping in seconds and its number of
+            steps to the elements `2 * proc_no` and `2 * proc_no + 1`. Default: None.
+        start_method (str): The start method of the process, such as 'fork' or 'spawn'. If it is None, the
+            default start method of multiprocessing is used. Default: None.
+        env_stats (EnvironmentStats): If it is set, the process records the step and reset latency of each
+            environment and its wait and serialize latency. With the 'queue' transport, the results are then
+            pickled by the process and put as bytes, so that the serialization is measured. Default: None.
+
+    After creating the environments, the process puts ('ready', None), or ('error', traceback) if the creation
+    fails, to `initial_states`.
+
+    Besides the 'step' and 'reset' messages, the process accepts the control messages which migrate the
+    environments between the processes: ('pop', 'front'/'back') replies the pickled first or last environment
+    by `initial_states`, ('push', 'front'/'back', data) inserts a pickled environment, and ('offset', offset)
+    sets the id of the first environment. ('seed', seed) reseeds the environment of id `i` by `seed + i * 1000`.
 
     Examples:
         >>> from multiprocessing import Queue
@@ -46,8 +179,9 @@ class EnvironmentProcess(Process):
         >>> env_proc.start()
     """
 
-    def __init__(self, proc_no, env_num, envs,
-                 actions, observations, initial_states):
+    def __init__(self, proc_no, env_num, envs, actions, observations, initial_states,
+                 shared_arrays=None, env_offset=0, auto_reset=False, stats=None, start_method=None,
+                 env_stats=None):
         super().__init__()
         self.proc_no = proc_no
         self.actions = actions
@@ -56,15 +190,136 @@ class EnvironmentProcess(Process):
 
         self.env_num = env_num
         self.envs = envs
+        self.shared_arrays = shared_arrays
+        self.env_offset = env_offset
+        self.auto_reset = auto_reset
+        self.stats = stats
+        self.start_method = start_method
+        self.env_stats = env_stats
 
     def run(self):
+        try:
+            self.envs = [create_environment(env) for env in self.envs]
+        except Exception:  # pylint: disable=W0703
+            self.initial_states.put(('error', traceback.format_exc()))
+            return
+        self.initial_states.put(('ready', None))
+        if self.shared_arrays is not None:
+            self._run_shared()
+            return
         while True:
-            message = self.actions.get()
+            message = self._get_message()
             if isinstance(message, np.ndarray):
-                obs = [self.envs[i]._step(message[i])
+                start = time.perf_counter()
+                obs = [self._step_env(i, message[i])
                        for i in range(self.env_num)]
-                self.observations.put(obs)
+                self._record(start)
+                self.observations.put(self._serialize(obs))
+            elif isinstance(message, tuple):
+                self._control(message)
             elif message == 'reset':
-                init_states = [self.envs[i]._reset()
+                init_states = [self._reset_env(i)
                                for i in range(self.env_num)]
-                self.initial_states.put(init_states)
+                self.initial_states.put(self._serialize(init_states))
+
+    def _run_shared(self):
+        """Interact with the environments through the shared arrays."""
+        arrays = self.shared_arrays.arrays()
+        actions, observations, rewards, dones = arrays[:4]
+        # The terminal states are kept only if the caller allocates them.
+        terminals = arrays[4] if len(arrays) > 4 else None
+        while True:
+            message = self._get_message()
+            begin = self.env_offset
+            if message == 'step':
+                start = time.perf_counter()
+                for i in range(self.env_num):
+                    j = begin + i
+                    if self.auto_reset:
+                        observations[j], rewards[j], dones[j], terminal = self._step_env(i, actions[j])
+                        if terminals is not None:
+                            terminals[j] = terminal
+                    else:
+                        observations[j], rewards[j], dones[j] = self._step_env(i, actions[j])
+                self._record(start)
+                self.observations.put(self.proc_no)
+            elif isinstance(message, tuple):
+                self._control(message)
+            elif message == 'reset':
+                for i in range(self.env_num):
+                    observations[begin + i] = self._reset_env(i)
+                self.initial_states.put(self.proc_no)
+
+    def _Popen(self, process_obj):  # pylint: disable=C0103
+        """Start the process by the `start_method`."""
+        if self.start_method is None:
+            return super()._Popen(process_obj)
+        return get_context(self.start_method).Process._Popen(process_obj)
+
+    def _record(self, start):
+        """Add the busy time since `start` and one step to the stats."""
+        if self.stats is not None:
+            self.stats[2 * self.proc_no] += time.perf_counter() - start
+            self.stats[2 * self.proc_no + 1] += 1
+
+    def _get_message(self):
+        """Get the next message, and record the time blocked on the queue."""
+        if self.env_stats is None:
+            return self.actions.get()
+        start = time.perf_counter()
+        message = self.actions.get()
+        self.env_stats.record_proc('wait', self.proc_no, time.perf_counter() - start)
+        return message
+
+    def _step_env(self, i, action):
+        """Step the `i`-th environment of the process, and record its step latency."""
+        if self.env_stats is None:
+            return auto_reset_step(self.envs[i], action) if self.auto_reset else self.envs[i]._step(action)
+        start = time.perf_counter()
+        result = auto_reset_step(self.envs[i], action) if self.auto_reset else self.envs[i]._step(action)
+        self.env_stats.record_env('step', self.env_offset + i, time.perf_counter() - start)
+        return result
+
+    def _reset_env(self, i):
+        """Reset the `i`-th environment of the process, and record its reset latency."""
+        if self.env_stats is None:
+            return self.envs[i]._reset()
+        start = time.perf_counter()
+        state = self.envs[i]._reset()
+        self.env_stats.record_env('reset', self.env_offset + i, time.perf_counter() - start)
+        return state
+
+    def _serialize(self, results):
+        """Pickle the results to be put to the queue when they are instrumented, and record the time."""
+        if self.env_stats is None:
+            return results
+        start = time.perf_counter()
+        data = pickle.dumps(results, pickle.HIGHEST_PROTOCOL)
+        self.env_stats.record_proc('serialize', self.proc_no, time.perf_counter() - start)
+        return data
+
+    def _control(self, message):
+        """Handle the control messages which migrate the environments."""
+        command = message[0]
+        if command == 'pop':
+            index = 0 if message[1] == 'front' else -1
+            try:
+                data = pickle.dumps(self.envs[index])
+            except Exception as e:  # pylint: disable=W0703
+                # The environment is kept if it can not be migrated.
+                self.initial_states.put(('error', str(e)))
+                return
+            self.envs.pop(index)
+            self.initial_states.put(('env', data))
+        elif command == 'push':
+            env = pickle.loads(message[2])
+            if message[1] == 'front':
+                self.envs.insert(0, env)
+            else:
+                self.envs.append(env)
+        elif command == 'offset':
+            self.env_offset = message[1]
+        elif command == 'seed':
+            for i, env in enumerate(self.envs):
+                seed_environment(env, message[1] + (self.env_offset + i) * 1000)
+        self.env_num = len(self.envs)
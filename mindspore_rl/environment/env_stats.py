@@ -0,0 +1,172 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+The latency histograms of the environments shared by the environment processes.
+"""
+
+import time
+from multiprocessing import RawArray
+import numpy as np
+
+ENV_METRICS = ('step', 'reset')
+PROC_METRICS = ('wait', 'serialize')
+
+
+def _bucket(seconds, num_buckets):
+    """The histogram bucket of a latency, the bucket `b > 0` holds the latencies in [2^(b-1), 2^b) us."""
+    return min(int(seconds * 1e6).bit_length(), num_buckets - 1)
+
+
+class EnvironmentStats:
+    r"""
+    The latency histograms of a batch of environments in shared memory, which the environment processes update
+    in place. Each histogram has logarithmic buckets of microseconds and the total seconds, so recording a
+    latency is two additions, and every element has a single writer, so no lock is needed.
+
+    The metrics of each environment are 'step' and 'reset', the time spent in its `_step` and `_reset`. The
+    metrics of each process are 'wait', the time blocked on the action queue, and 'serialize', the time spent
+    in pickling the results with the 'queue' transport, which is zero with the 'shared_memory' transport.
+
+    Args:
+        num_envs (int): The number of environments.
+        num_proc (int): The number of environment processes.
+        num_buckets (int): The number of buckets of each histogram, the last one also holds the longer
+            latencies. Default: 32.
+
+    Examples:
+        >>> env_stats = EnvironmentStats(4, 2)
+        >>> env_stats.record_env('step', 0, 0.001)
+        >>> summary = env_stats.summary()
+    """
+
+    def __init__(self, num_envs, num_proc, num_buckets=32):
+        self.num_envs = num_envs
+        self.num_proc = num_proc
+        self.num_buckets = num_buckets
+        # The last column of each histogram is the total seconds.
+        self._env_raw = RawArray('d', len(ENV_METRICS) * num_envs * (num_buckets + 1))
+        self._proc_raw = RawArray('d', len(PROC_METRICS) * num_proc * (num_buckets + 1))
+        self._arrays = None
+        self._start = time.time()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_arrays'] = None
+        return state
+
+    def arrays(self):
+        """
+        The numpy views of the shared memory, which are created once in each process.
+
+        Returns:
+            - env_hist (numpy.ndarray), the histograms of the environments in shape (2, num_envs, num_buckets + 1).
+            - proc_hist (numpy.ndarray), the histograms of the processes in shape (2, num_proc, num_buckets + 1).
+        """
+
+        if self._arrays is None:
+            width = self.num_buckets + 1
+            self._arrays = (np.frombuffer(self._env_raw, np.float64).reshape(len(ENV_METRICS), self.num_envs, width),
+                            np.frombuffer(self._proc_raw, np.float64).reshape(len(PROC_METRICS), self.num_proc, width))
+        return self._arrays
+
+    def record_env(self, metric, env_id, seconds):
+        """Record a latency of the 'step' or 'reset' of an environment."""
+        hist = self.arrays()[0][ENV_METRICS.index(metric), env_id]
+        hist[_bucket(seconds, self.num_buckets)] += 1
+        hist[-1] += seconds
+
+    def record_proc(self, metric, proc_no, seconds):
+        """Record a latency of the 'wait' or 'serialize' of a process."""
+        hist = self.arrays()[1][PROC_METRICS.index(metric), proc_no]
+        hist[_bucket(seconds, self.num_buckets)] += 1
+        hist[-1] += seconds
+
+    def histogram(self, metric):
+        """
+        Get the histograms of a metric.
+
+        Args:
+            metric (str): 'step', 'reset', 'wait' or 'serialize'.
+
+        Returns:
+            - counts (numpy.ndarray), the counts of the buckets of each environment or process.
+            - total (numpy.ndarray), the total seconds of each environment or process.
+        """
+
+        if metric in ENV_METRICS:
+            hist = self.arrays()[0][ENV_METRICS.index(metric)]
+        elif metric in PROC_METRICS:
+            hist = self.arrays()[1][PROC_METRICS.index(metric)]
+        else:
+            raise ValueError(f"The metric should be one of {ENV_METRICS + PROC_METRICS}, but got {metric}.")
+        return hist[:, :-1].copy(), hist[:, -1].copy()
+
+    def percentile(self, metric, q):
+        """
+        Estimate a percentile of a metric over all the environments or processes from the histograms.
+
+        Args:
+            metric (str): 'step', 'reset', 'wait' or 'serialize'.
+            q (float): The percentile in [0, 100].
+
+        Returns:
+            The upper bound of the bucket of the percentile in seconds, or 0 if nothing is recorded.
+        """
+
+        counts = self.histogram(metric)[0].sum(axis=0)
+        if counts.sum() == 0:
+            return 0.0
+        bucket = int(np.searchsorted(np.cumsum(counts), counts.sum() * q / 100))
+        return float(2 ** bucket) * 1e-6
+
+    def summary(self, env_nums=None):
+        """
+        Summarize the statistics since the creation or the last clear.
+
+        Args:
+            env_nums (list(int)): The number of environments of each process, which are contiguous. If it is
+                set, the process of the straggler is returned as well. Default: None.
+
+        Returns:
+            A dictionary which contains the environment steps per second, the mean, p50 and p99 step latency,
+            the mean reset, wait and serialize latency in seconds, the id and the mean step latency of the
+            slowest environment, i.e. the straggler, and optionally its process.
+        """
+
+        counts, total = self.histogram('step')
+        steps = counts.sum(axis=1)
+        num_steps = int(steps.sum())
+        result = {'env_steps': num_steps,
+                  'env_steps_per_sec': num_steps / max(time.time() - self._start, 1e-9),
+                  'step_latency': float(total.sum() / max(num_steps, 1)),
+                  'step_latency_p50': self.percentile('step', 50),
+                  'step_latency_p99': self.percentile('step', 99)}
+        for metric in ('reset', 'wait', 'serialize'):
+            counts, metric_total = self.histogram(metric)
+            result[metric + '_latency'] = float(metric_total.sum() / max(counts.sum(), 1))
+        latency = np.where(steps > 0, total / np.maximum(steps, 1), -1)
+        straggler = int(np.argmax(latency))
+        result['straggler_env'] = straggler
+        result['straggler_latency'] = float(max(latency[straggler], 0))
+        if env_nums is not None:
+            result['straggler_process'] = int(np.searchsorted(np.cumsum(env_nums), straggler, side='right'))
+        return result
+
+    def clear(self):
+        """Clear the statistics."""
+        env_hist, proc_hist = self.arrays()
+        env_hist.fill(0)
+        proc_hist.fill(0)
+        self._start = time.time()
@@ -0,0 +1,89 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+The pool of the batch environments reused across the Sessions.
+"""
+
+
+class EnvironmentPool:
+    r"""
+    The pool of the batch environments, which keeps the environment processes alive across the Sessions. A
+    Session with the pool acquires the batch environments of the same configuration from the pool, which are
+    reseeded in place instead of starting new processes and creating the environments again, and releases
+    them at the end of its run. The processes are terminated when the pool is closed, or at the end of the
+    `with` block.
+
+    Examples:
+        >>> with EnvironmentPool() as pool:
+        ...     for lr in [0.001, 0.0003]:
+        ...         config.algorithm_config['learner']['params']['lr'] = lr
+        ...         ppo_session = Session(config.algorithm_config, env_pool=pool)
+        ...         ppo_session.run(class_type=PPOTrainer, episode=100)
+    """
+
+    def __init__(self):
+        self._wrappers = {}
+        self._in_use = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return sum(len(wrappers) for wrappers in self._wrappers.values())
+
+    def acquire(self, key, create_fn, seed=None):
+        """
+        Acquire a free batch environment of the key, or create one if there is none.
+
+        Args:
+            key (str): The key of the configuration of the batch environment.
+            create_fn (Callable): The function which creates the batch environment.
+            seed (int): If it is set, the reused batch environment is reseeded. Default: None.
+
+        Returns:
+            wrapper (MultiEnvironmentWrapper), the batch environment.
+        """
+
+        for wrapper in self._wrappers.get(key, []):
+            if id(wrapper) not in self._in_use:
+                if seed is not None:
+                    wrapper.reseed(seed)
+                break
+        else:
+            wrapper = create_fn()
+            self._wrappers.setdefault(key, []).append(wrapper)
+        self._in_use.add(id(wrapper))
+        return wrapper
+
+    def release(self, wrapper):
+        """
+        Return a batch environment to the pool, so that it can be acquired again.
+
+        Args:
+            wrapper (MultiEnvironmentWrapper): The batch environment.
+        """
+
+        self._in_use.discard(id(wrapper))
+
+    def close(self):
+        """Terminate the processes of all the batch environments."""
+        for wrappers in self._wrappers.values():
+            for wrapper in wrappers:
+                wrapper.close()
+        self._wrappers = {}
+        self._in_use = set()
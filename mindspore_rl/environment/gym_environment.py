@@ -19,8 +19,10 @@ The GymEnvironment base class.
 import gym
 from gym import spaces
 import numpy as np
+from mindspore.common import dtype as mstype
 from mindspore.ops import operations as P
 from mindspore_rl.environment.environment import Environment
+from mindspore_rl.environment.numpy_policy import NumpyMLPPolicy
 from mindspore_rl.environment.space import Space
 
 
@@ -39,6 +41,27 @@ class GymEnvironment(Environment):
             +------------------------------+----------------------------+
             |  seed                        |  seed used in Gym          |
             +------------------------------+----------------------------+
+            |  auto_reset                  |  reset in step when the    |
+            |                              |  episode finishes, and     |
+            |                              |  return the first state of |
+            |                              |  the new episode           |
+            +------------------------------+----------------------------+
+            |  terminal_observation        |  step also returns the     |
+            |                              |  last state of the episode |
+            |                              |  with auto_reset           |
+            +------------------------------+----------------------------+
+            |  action_repeat               |  repeat the action in a    |
+            |                              |  step and sum the rewards, |
+            |                              |  stop when the episode     |
+            |                              |  finishes, default 1       |
+            +------------------------------+----------------------------+
+            |  rollout_steps               |  the number of steps run   |
+            |                              |  by rollout in one call    |
+            +------------------------------+----------------------------+
+            |  rollout_policy              |  the arguments of the      |
+            |                              |  NumpyMLPPolicy used by    |
+            |                              |  rollout                   |
+            +------------------------------+----------------------------+
         env_id (int): A integer which is used to set the seed of this environment.
 
     Supported Platforms:
@@ -63,6 +86,13 @@ class GymEnvironment(Environment):
         self._action_space = self._space_adapter(self._env.action_space)
         self._reward_space = Space((1,), np.float32)
         self._done_space = Space((1,), np.bool_, low=0, high=2)
+        self._auto_reset = params.get('auto_reset', False)
+        self._return_terminal = self._auto_reset and params.get('terminal_observation', False)
+        self._terminal_observation = None
+        self._action_repeat = params.get('action_repeat', 1)
+        if self._action_repeat < 1:
+            raise ValueError(f"The action_repeat should be positive, but got {self._action_repeat}.")
+        self._state = None
 
         # reset op
         reset_input_type = []
@@ -79,11 +109,31 @@ class GymEnvironment(Environment):
                             self._reward_space.ms_dtype, self._done_space.ms_dtype)
         step_output_shape = (self._observation_space.shape,
                              self._reward_space.shape, self._done_space.shape)
+        step_fn = self._step
+        if self._return_terminal:
+            step_output_type += (self.observation_space.ms_dtype,)
+            step_output_shape += (self._observation_space.shape,)
+            step_fn = self._step_with_terminal
         self._step_op = P.PyFunc(
-            self._step, step_input_type, step_input_shape, step_output_type, step_output_shape)
+            step_fn, step_input_type, step_input_shape, step_output_type, step_output_shape)
         self.action_dtype = self._action_space.ms_dtype
         self.cast = P.Cast()
 
+        # rollout op
+        self._rollout_steps = params.get('rollout_steps', 0)
+        if self._rollout_steps > 0:
+            self._rollout_policy = NumpyMLPPolicy(**params['rollout_policy'])
+            steps = self._rollout_steps
+            rollout_output_type = (self._observation_space.ms_dtype, self._action_space.ms_dtype,
+                                   self._reward_space.ms_dtype, self._done_space.ms_dtype,
+                                   self._observation_space.ms_dtype)
+            rollout_output_shape = ((steps,) + self._observation_space.shape, (steps,) + self._action_space.shape,
+                                    (steps,) + self._reward_space.shape, (steps,) + self._done_space.shape,
+                                    (steps,) + self._observation_space.shape)
+            self._rollout_op = P.PyFunc(self._rollout, (mstype.float32,),
+                                        ((self._rollout_policy.num_params,),), rollout_output_type,
+                                        rollout_output_shape)
+
     def reset(self):
         """
         Reset the environment to the initial state. It is always used at the beginning of each
@@ -104,15 +154,40 @@ class GymEnvironment(Environment):
             action (Tensor): A tensor that contains the action information.
 
         Returns:
-            - state (Tensor), the environment state after performing the action.
+            - state (Tensor), the environment state after performing the action. If `auto_reset` is set and
+              the simulation finishes, it is the initial state of the new episode.
             - reward (Tensor), the reward after performing the action.
             - done (Tensor), whether the simulation finishes or not.
+            - terminal_state (Tensor), the state after performing the action, before the automatic reset.
+              It is only returned if `terminal_observation` is set.
         """
 
         # Add cast ops for mixed precision case. Redundant cast ops will be eliminated automatically.
         action = self.cast(action, self.action_dtype)
         return self._step_op(action)
 
+    def rollout(self, policy_params):
+        r"""
+        Run `rollout_steps` steps in one call, the actions are sampled by the `rollout_policy` evaluated by
+        NumPy. It continues from the current state, and resets the environment when an episode finishes,
+        so the rollouts can be chained.
+
+        Args:
+            policy_params (Tensor): The flat float32 parameter vector of the NumpyMLPPolicy.
+
+        Returns:
+            - states (Tensor), the states where the actions are taken, in shape (rollout_steps, ...).
+            - actions (Tensor), the actions, in shape (rollout_steps, ...).
+            - rewards (Tensor), the rewards, in shape (rollout_steps, 1).
+            - dones (Tensor), whether the simulation finishes at each step, in shape (rollout_steps, 1).
+            - next_states (Tensor), the states after the actions, before the reset at the end of an episode,
+              in shape (rollout_steps, ...).
+        """
+
+        if self._rollout_steps <= 0:
+            raise ValueError("The rollout needs the rollout_steps and rollout_policy in the parameters.")
+        return self._rollout_op(policy_params)
+
     @property
     def observation_space(self):
         """
@@ -178,6 +253,7 @@ class GymEnvironment(Environment):
         s0 = self._env.reset()
         # In some gym version, the obvervation space is announced to be float32, but get float64 from reset and step.
         s0 = s0.astype(self.observation_space.np_dtype)
+        self._state = s0
         return s0
 
     def _step(self, action):
@@ -197,12 +273,85 @@ class GymEnvironment(Environment):
         """
 
         s, r, done, _ = self._env.step(action)
+        for _ in range(self._action_repeat - 1):
+            if done:
+                break
+            s, repeat_r, done, _ = self._env.step(action)
+            r += repeat_r
         # In some gym version, the obvervation space is announced to be float32, but get float64 from reset and step.
         s = s.astype(self.observation_space.np_dtype)
         r = np.array([r]).astype(np.float32)
+        self._state = s
+        if self._auto_reset:
+            self._terminal_observation = s
+            if done:
+                s = self._reset()
         done = np.array([done])
         return s, r, done
 
+    def _step_with_terminal(self, action):
+        """
+        The python code of the step which also returns the state before the automatic reset.
+
+        Args:
+            action(int or float): The action which is calculated by policy net.
+
+        Returns:
+            - s1 (numpy.array), the environment state after performing the action and the automatic reset.
+            - r1 (numpy.array), the reward after performing the action.
+            - done (boolean), whether the simulation finishes or not.
+            - terminal_s1 (numpy.array), the environment state after performing the action.
+        """
+
+        s, r, done = self._step(action)
+        return s, r, done, self._terminal_observation
+
+    def _rollout(self, policy_params):
+        """
+        The python code of the rollout, which steps the environment `rollout_steps` times.
+
+        Args:
+            policy_params (numpy.ndarray): The flat parameter vector of the policy.
+
+        Returns:
+            - states (numpy.ndarray), the states where the actions are taken.
+            - actions (numpy.ndarray), the actions.
+            - rewards (numpy.ndarray), the rewards.
+            - dones (numpy.ndarray), whether the simulation finishes at each step.
+            - next_states (numpy.ndarray), the states after the actions.
+        """
+
+        steps = self._rollout_steps
+        states = np.empty((steps,) + self._observation_space.shape, self._observation_space.np_dtype)
+        next_states = np.empty_like(states)
+        actions = np.empty((steps,) + self._action_space.shape, self._action_space.np_dtype)
+        rewards = np.empty((steps,) + self._reward_space.shape, np.float32)
+        dones = np.empty((steps,) + self._done_space.shape, np.bool_)
+        if self._state is None:
+            self._reset()
+        for t in range(steps):
+            states[t] = self._state
+            action = self._rollout_policy(policy_params, self._state)
+            if not self._action_space.is_discrete:
+                action = np.clip(action, *self._action_space.boundary)
+            actions[t] = action
+            s, rewards[t], dones[t] = self._step(actions[t])
+            next_states[t] = self._terminal_observation if self._auto_reset else s
+            if dones[t].any() and not self._auto_reset:
+                self._reset()
+        return states, actions, rewards, dones, next_states
+
+    def _seed(self, seed):
+        """
+        The python code of reseeding the environment.
+
+        Args:
+            seed (int): The new seed.
+        """
+
+        self._env.seed(seed)
+        self._state = None
+
     def _space_adapter(self, gym_space):
         """Transfer gym dtype to the dtype that is suitable for MindSpore"""
         shape = gym_space.shape
@@ -16,11 +16,17 @@
 """MultiEnvironmentWrapper Class"""
 
 #pylint: disable=W0212
-from multiprocessing import Queue
+import pickle
+import time
+from collections import deque
+from multiprocessing import get_context
 import numpy as np
+import mindspore as ms
 import mindspore.nn as nn
 from mindspore.ops import operations as P
-from mindspore_rl.environment.env_process import EnvironmentProcess
+from mindspore_rl.environment.env_process import EnvironmentProcess, SharedEnvArrays, auto_reset_step, \
+    create_environment, seed_environment
+from mindspore_rl.environment.env_stats import EnvironmentStats
 
 
 class MultiEnvironmentWrapper(nn.Cell):
@@ -30,8 +36,39 @@ class MultiEnvironmentWrapper(nn.Cell):
     file, framework will automatically invoke this class to create a multi environment class.
 
     Args:
-        env_instance (list(Class)): A list that contains instance of environment (subclass of Environment).
+        env_instance (list(Union[Environment, EnvironmentFactory])): A list that contains instance of environment
+            (subclass of Environment), or the EnvironmentFactory of each environment. The factories are called in
+            the processes, so the environments are created in parallel and only the first one is created in the
+            caller process for the spaces.
         num_proc (int): Number of processing uses during interacting with environment. Default: None.
+        transport (str): The way to pass the actions and results between the processes. 'queue' pickles them
+            through the queues. 'shared_memory' keeps them in preallocated shared memory arrays indexed by the
+            environment id, only the step and reset signals cross the processes, and the step returns the same
+            preallocated arrays without any allocation. Default: 'queue'.
+        num_ready (int): If it is set, the asynchronous stepping is enabled, `send` steps a part of the
+            environments and `recv` returns the first `num_ready` finished environments with their ids, so that
+            the policy can act on them while the others keep running. The environments are stepped by process,
+            so the environment number should be divisible by the process number and `num_ready` should be a
+            multiple of the environments per process. It implies the 'shared_memory' transport. Default: None.
+        auto_reset (bool): Whether to reset an environment where it runs when its simulation finishes, so that
+            the step returns the initial state of the new episode for it, and no reset call is needed between
+            the episodes. Default: False.
+        terminal_observation (bool): Whether the step also returns the states before the automatic reset.
+            It is only used with `auto_reset`. Default: False.
+        rebalance_interval (int): If it is set, `rebalance` is called every `rebalance_interval` steps, which moves
+            the environments from the persistently slower processes to the faster ones. Default: None.
+        start_method (str): The start method of the processes, such as 'fork' or 'spawn'. The 'spawn' needs the
+            environments to be picklable, which the factories are. Default: None.
+        lazy (bool): Whether to start the processes at the first reset or step instead of the construction, so
+            that an environment which is seldom used, such as the evaluation one, costs nothing until it is
+            used. Default: False.
+        instrument (bool): Whether to record the latency histograms of the step and reset of each environment,
+            and the queue wait and serialization of each process, see `environment_stats`. Recording a latency
+            costs a clock read and two additions in shared memory, so it can be left on. Default: False.
+
+    The environments are spread evenly over the processes, the first `len(env_instance) % num_proc` processes
+    get one more environment. Each process keeps the ids of its environments contiguous, and the busy time of
+    each process is measured, see `process_stats`.
 
     Supported Plantforms:
         ``Ascend`` ``GPU`` ``CPU``
@@ -42,64 +79,119 @@ class MultiEnvironmentWrapper(nn.Cell):
         >>> wrapper = MultiEnvironmentWrapper(multi_env)
         >>> print(wrapper)
         MultiEnvironmentWrapper<>
+        >>> async_wrapper = MultiEnvironmentWrapper(multi_env, num_proc=2, num_ready=1)
+        >>> state = async_wrapper.reset()
+        >>> state, reward, done, env_id = async_wrapper.recv()
+        >>> async_wrapper.send(action, env_id)
     """
 
     def __init__(self,
                  env_instance,
-                 num_proc=None):
+                 num_proc=None,
+                 transport='queue',
+                 num_ready=None,
+                 auto_reset=False,
+                 terminal_observation=False,
+                 rebalance_interval=None,
+                 start_method=None,
+                 lazy=False,
+                 instrument=False):
         super().__init__()
+        if transport not in ('queue', 'shared_memory'):
+            raise ValueError(f"The transport should be 'queue' or 'shared_memory', but got {transport}.")
         self._nums = len(env_instance)
+        if num_proc == 1:
+            env_instance = [create_environment(env) for env in env_instance]
         self._envs = env_instance
+        # The first environment provides the spaces and the config.
+        self._spec_env = create_environment(env_instance[0])
         self.num_proc = num_proc
+        self.num_ready = num_ready
+        self.auto_reset = auto_reset
+        self.terminal_observation = auto_reset and terminal_observation
+        if num_ready is not None:
+            self._check_num_ready()
+            transport = 'shared_memory'
+        self.transport = transport
+        self.shared_arrays = None
+        if rebalance_interval is not None and num_ready is not None:
+            raise ValueError("The rebalance_interval can not be used with the asynchronous stepping.")
+        self.rebalance_interval = rebalance_interval
+        self._steps = 0
+        self.env_stats = EnvironmentStats(self._nums, num_proc or 1) if instrument else None
         batch_shape = (self._nums,)
 
-        obs_type = self._envs[0].observation_space.ms_dtype
-        action_type = self._envs[0].action_space.ms_dtype
-        reward_type = self._envs[0].reward_space.ms_dtype
-        done_type = self._envs[0].done_space.ms_dtype
-
-        obs_shape = batch_shape + self._envs[0].observation_space.shape
-        action_shape = batch_shape + self._envs[0].action_space.shape
-        reward_shape = batch_shape + self._envs[0].reward_space.shape
-        done_shape = batch_shape + self._envs[0].done_space.shape
-
+        obs_type = self._spec_env.observation_space.ms_dtype
+        action_type = self._spec_env.action_space.ms_dtype
+        reward_type = self._spec_env.reward_space.ms_dtype
+        done_type = self._spec_env.done_space.ms_dtype
+
+        obs_shape = batch_shape + self._spec_env.observation_space.shape
+        action_shape = batch_shape + self._spec_env.action_space.shape
+        reward_shape = batch_shape + self._spec_env.reward_space.shape
+        done_shape = batch_shape + self._spec_env.done_space.shape
+
+        step_output_types = [obs_type, reward_type, done_type]
+        step_output_shapes = [obs_shape, reward_shape, done_shape]
+        if self.terminal_observation:
+            step_output_types.append(obs_type)
+            step_output_shapes.append(obs_shape)
         self._step_op = P.PyFunc(self._step,
                                  [action_type,],
                                  [action_shape,],
-                                 [obs_type, reward_type, done_type],
-                                 [obs_shape, reward_shape, done_shape])
+                                 step_output_types,
+                                 step_output_shapes)
         self._reset_op = P.PyFunc(self._reset, [], [],
                                   [obs_type,],
                                   [obs_shape,])
+        if num_ready is not None:
+            ready_shape = (num_ready,)
+            self._send_op = P.PyFunc(self._send,
+                                     [action_type, ms.int32],
+                                     [ready_shape + self._spec_env.action_space.shape, ready_shape],
+                                     [ms.bool_], [(1,)])
+            self._recv_op = P.PyFunc(self._recv, [], [],
+                                     [obs_type, reward_type, done_type, ms.int32],
+                                     [ready_shape + self._spec_env.observation_space.shape,
+                                      ready_shape + self._spec_env.reward_space.shape,
+                                      ready_shape + self._spec_env.done_space.shape, ready_shape])
+            # The processes whose results are not received, and the ones finished but not returned by recv.
+            self._in_flight = set()
+            self._ready = deque()
 
         if self.num_proc != 1:
             self.mpe_env_procs = []
             self.action_queues = []
             self.exp_queues = []
             self.init_state_queues = []
+            self.start_method = start_method
+            context = get_context(start_method)
 
             if self._nums < self.num_proc:
                 raise ValueError("Environment number can not be smaller than process number.")
-
-            avg_env_num_per_proc = int(self._nums / self.num_proc)
-            for i in range(self.num_proc):
-                action_q = Queue()
-                self.action_queues.append(action_q)
-                exp_q = Queue()
-                self.exp_queues.append(exp_q)
-                init_state_q = Queue()
-                self.init_state_queues.append(init_state_q)
-
-                assigned_env_num = i * avg_env_num_per_proc
-                if assigned_env_num < self._nums:
-                    env_num = avg_env_num_per_proc
-                else:
-                    env_num = self._nums - assigned_env_num
-
-                env_proc = EnvironmentProcess(i, env_num, self._envs[env_num * i:env_num * (i+1)],
-                                              action_q, exp_q, init_state_q)
-                self.mpe_env_procs.append(env_proc)
-                env_proc.start()
+            if transport == 'shared_memory':
+                spaces = [self._spec_env.action_space, self._spec_env.observation_space,
+                          self._spec_env.reward_space, self._spec_env.done_space]
+                if self.terminal_observation:
+                    spaces.append(self._spec_env.observation_space)
+                self.shared_arrays = SharedEnvArrays(self._nums, [(space.shape, space.np_dtype) for space in spaces])
+
+            # In the asynchronous stepping, all the processes signal the same queue in the finishing order.
+            ready_q = context.Queue() if num_ready is not None else None
+            base, remainder = divmod(self._nums, self.num_proc)
+            self._env_nums = [base + 1 if i < remainder else base for i in range(self.num_proc)]
+            # The busy time in seconds and the number of steps of each process.
+            self.stats = context.RawArray('d', 2 * self.num_proc)
+            self._stats_start = time.time()
+            for _ in range(self.num_proc):
+                self.action_queues.append(context.Queue())
+                self.exp_queues.append(ready_q if ready_q is not None else context.Queue())
+                self.init_state_queues.append(context.Queue())
+            self._started = False
+            # The seed of reseed before the processes are started, which is sent to them when they start.
+            self._pending_seed = None
+            if not lazy:
+                self._start_processes()
 
     def reset(self):
         """
@@ -121,13 +213,188 @@ class MultiEnvironmentWrapper(nn.Cell):
             action (Tensor): A tensor that contains the action information.
 
         Returns:
-            - state (list(Tensor)), a list of environment state after performing the action.
+            - state (list(Tensor)), a list of environment state after performing the action. With `auto_reset`,
+              the finished environments return the initial states of their new episodes.
             - reward (list(Tensor)), a list of reward after performing the action.
             - done (list(Tensor)), whether the simulations of each environment finishes or not.
+            - terminal_state (list(Tensor)), a list of environment state before the automatic reset. It is only
+              returned if `terminal_observation` is set.
         """
 
         return self._step_op(action)
 
+    def send(self, action, env_id):
+        """
+        Send the actions to the environments without waiting for the results. It is only available when
+        `num_ready` is set.
+
+        Args:
+            action (Tensor): A tensor that contains the actions of the environments in `env_id`.
+            env_id (Tensor): The ids of the environments, which should be the ones returned by `recv`.
+
+        Returns:
+            success (Tensor), whether the actions are sent.
+        """
+
+        return self._send_op(action, env_id)[0]
+
+    def recv(self):
+        """
+        Receive the results of the first `num_ready` environments which finish stepping or resetting. It is
+        only available when `num_ready` is set.
+
+        Returns:
+            - state (Tensor), the states of the environments.
+            - reward (Tensor), the rewards of the environments, zero if the environments are just reset.
+            - done (Tensor), whether the simulations of the environments finish or not.
+            - env_id (Tensor), the ids of the environments.
+        """
+
+        return self._recv_op()
+
+    def process_stats(self):
+        """
+        Get the statistics of the environment processes since the creation or the last rebalance, which can be
+        used to tune the number of processes.
+
+        Returns:
+            A dictionary of lists, which contain the number of environments, the number of steps, the mean step
+            latency in seconds and the utilisation, i.e. the fraction of the time spent in stepping, of each
+            process.
+        """
+
+        if self.num_proc == 1:
+            return {}
+        busy = np.array(self.stats[0::2])
+        steps = np.array(self.stats[1::2])
+        elapsed = max(time.time() - self._stats_start, 1e-9)
+        return {'env_num': list(self._env_nums),
+                'steps': steps.astype(np.int64).tolist(),
+                'step_latency': (busy / np.maximum(steps, 1)).tolist(),
+                'utilisation': (busy / elapsed).tolist()}
+
+    def environment_stats(self, clear=False):
+        """
+        Get the summary of the latency histograms of the environments since the creation or the last clear. It
+        is only available when `instrument` is set.
+
+        Args:
+            clear (bool): Whether to clear the histograms after the summary, so that the next summary covers
+                the following interval. The latencies recorded while clearing may be lost. Default: False.
+
+        Returns:
+            A dictionary which contains the environment steps per second, the step latency and its percentiles,
+            the reset, wait and serialize latency, and the straggler environment and its process, see
+            `EnvironmentStats.summary`. It is empty if `instrument` is not set.
+        """
+
+        if self.env_stats is None:
+            return {}
+        summary = self.env_stats.summary([self._nums] if self.num_proc == 1 else self._env_nums)
+        if clear:
+            self.env_stats.clear()
+        return summary
+
+    def rebalance(self, tolerance=0.1):
+        """
+        Move the environments between the neighbouring processes, so that the number of environments of each
+        process is proportional to its measured speed. An environment which can not be pickled stays where it
+        is, and no environment is moved across it. The statistics are cleared after rebalancing.
+
+        Args:
+            tolerance (float): The processes are not rebalanced if the step latencies are within this fraction
+                of the mean latency. Default: 0.1.
+
+        Returns:
+            A list of the number of environments of each process.
+        """
+
+        if self.num_proc == 1 or self.num_ready is not None:
+            raise RuntimeError("The rebalance needs the synchronous stepping with more than one process.")
+        busy = np.array(self.stats[0::2])
+        steps = np.array(self.stats[1::2])
+        env_nums = np.array(self._env_nums)
+        if np.any(steps == 0) or np.any(env_nums == 0):
+            return list(self._env_nums)
+        latency = busy / steps
+        if np.all(np.abs(latency - latency.mean()) <= tolerance * latency.mean()):
+            self._clear_stats()
+            return list(self._env_nums)
+
+        # The speed of each process in environment steps per second, and the targets by largest remainder.
+        speed = env_nums / np.maximum(latency, 1e-12)
+        share = self._nums * speed / speed.sum()
+        target = np.maximum(np.floor(share).astype(np.int64), 1)
+        while target.sum() > self._nums:
+            target[np.argmax(target - share)] -= 1
+        while target.sum() < self._nums:
+            target[np.argmax(share - target)] += 1
+
+        # Move one environment at a time across the boundaries until every boundary is at its target, or is
+        # blocked by an environment which can not be moved.
+        blocked = set()
+        try:
+            moved = True
+            while moved:
+                moved = False
+                for i in range(self.num_proc - 1):
+                    if i in blocked:
+                        continue
+                    boundary = sum(self._env_nums[:i + 1])
+                    target_boundary = int(target[:i + 1].sum())
+                    if boundary < target_boundary and self._env_nums[i + 1] > 0:
+                        src, dst = i + 1, i
+                    elif boundary > target_boundary and self._env_nums[i] > 0:
+                        src, dst = i, i + 1
+                    else:
+                        continue
+                    if self._migrate(src, dst):
+                        moved = True
+                    else:
+                        blocked.add(i)
+        finally:
+            # The offsets of the processes always match the environments they hold, even if a migration fails.
+            for i in range(self.num_proc):
+                self.action_queues[i].put(('offset', sum(self._env_nums[:i])))
+            self._clear_stats()
+        return list(self._env_nums)
+
+    def reseed(self, seed):
+        """
+        Reseed the environments in place, the environment of id `i` is seeded by `seed + i * 1000` as
+        GymEnvironment does. The environments which do not support reseeding are not changed. The step and the
+        auto rebalancing counters and the statistics are cleared as well, so a reused wrapper behaves like a new
+        one after reset.
+
+        Args:
+            seed (int): The base seed.
+        """
+
+        self._steps = 0
+        if self.env_stats is not None:
+            self.env_stats.clear()
+        if self.num_proc == 1:
+            for i, env in enumerate(self._envs):
+                seed_environment(env, seed + i * 1000)
+            return
+        self._clear_stats()
+        # The processes which are not started reseed the environments created by the factories when they start.
+        if not self._started:
+            self._pending_seed = seed
+            return
+        for action_q in self.action_queues:
+            action_q.put(('seed', seed))
+
+    def close(self):
+        """Terminate the environment processes, the wrapper can not be used after closing."""
+        if self.num_proc == 1:
+            return
+        for env_proc in self.mpe_env_procs:
+            env_proc.terminate()
+        for env_proc in self.mpe_env_procs:
+            env_proc.join()
+        self.mpe_env_procs = []
+
     @property
     def observation_space(self):
         """
@@ -137,7 +404,7 @@ class MultiEnvironmentWrapper(nn.Cell):
             A tuple which states for the space of state.
         """
 
-        return self._envs[0].observation_space
+        return self._spec_env.observation_space
 
     @property
     def action_space(self):
@@ -148,7 +415,7 @@ class MultiEnvironmentWrapper(nn.Cell):
             A tuple which states for the space of action.
         """
 
-        return self._envs[0].action_space
+        return self._spec_env.action_space
 
     @property
     def reward_space(self):
@@ -158,7 +425,7 @@ class MultiEnvironmentWrapper(nn.Cell):
         Returns:
             A tuple which states for the space of reward.
         """
-        return self._envs[0].reward_space
+        return self._spec_env.reward_space
 
     @property
     def done_space(self):
@@ -168,7 +435,7 @@ class MultiEnvironmentWrapper(nn.Cell):
         Returns:
             A tuple which states for the space of done.
         """
-        return self._envs[0].done_space
+        return self._spec_env.done_space
 
     @property
     def config(self):
@@ -178,7 +445,7 @@ class MultiEnvironmentWrapper(nn.Cell):
         Returns:
             A dictionary which contains environment's info.
         """
-        return self._envs[0].config
+        return self._spec_env.config
 
     def _reset(self):
         """
@@ -189,14 +456,36 @@ class MultiEnvironmentWrapper(nn.Cell):
         Returns:
             A list of numpy array which states for the initial state of each environment.
         """
+        if self.num_proc != 1 and not self._started:
+            self._start_processes()
+        if self.shared_arrays is not None:
+            if self.num_ready is not None:
+                # Wait for the steps in flight, whose results are dropped.
+                while self._in_flight:
+                    self._in_flight.discard(self.exp_queues[0].get())
+            for i in range(self.num_proc):
+                self.action_queues[i].put('reset')
+            for j in range(self.num_proc):
+                self.init_state_queues[j].get()
+            obs, rewards, dones = self.shared_arrays.arrays()[1:4]
+            if self.num_ready is not None:
+                rewards.fill(0)
+                dones.fill(False)
+                self._ready = deque(range(self.num_proc))
+            return obs
         if self.num_proc != 1:
             s0 = []
             for i in range(self.num_proc):
                 self.action_queues[i].put('reset')
             for j in range(self.num_proc):
-                s0.extend(self.init_state_queues[j].get())
+                s0.extend(self._receive(self.init_state_queues[j]))
         else:
-            s0 = [env._reset() for env in self._envs]
+            s0 = []
+            for i, env in enumerate(self._envs):
+                start = time.perf_counter()
+                s0.append(env._reset())
+                if self.env_stats is not None:
+                    self.env_stats.record_env('reset', i, time.perf_counter() - start)
         return s0
 
     def _step(self, actions):
@@ -214,19 +503,141 @@ class MultiEnvironmentWrapper(nn.Cell):
             - r1 (List[numpy.array]), a list of reward after performing the action.
             - done (List[boolean]), whether the simulations of each environment finishes or not.
         """
+        if self.num_proc != 1 and not self._started:
+            self._start_processes()
+        if self.rebalance_interval is not None and self.num_proc != 1:
+            self._steps += 1
+            if self._steps % self.rebalance_interval == 0:
+                self.rebalance()
+        if self.shared_arrays is not None:
+            arrays = self.shared_arrays.arrays()
+            arrays[0][:] = actions
+            for i in range(self.num_proc):
+                self.action_queues[i].put('step')
+            for j in range(self.num_proc):
+                self.exp_queues[j].get()
+            return arrays[1:]
         results = []
         if self.num_proc != 1:
             accum_env_num = 0
             for i in range(self.num_proc):
-                env_num = self.mpe_env_procs[i].env_num
+                env_num = self._env_nums[i]
                 self.action_queues[i].put(actions[accum_env_num: accum_env_num+env_num,])
                 accum_env_num += env_num
             for j in range(self.num_proc):
-                exp = self.exp_queues[j].get()
-                results.extend(exp)
+                results.extend(self._receive(self.exp_queues[j]))
         else:
             for i in range(self._nums):
-                exp = self._envs[i]._step(actions[i])
+                start = time.perf_counter()
+                if self.auto_reset:
+                    exp = auto_reset_step(self._envs[i], actions[i])
+                else:
+                    exp = self._envs[i]._step(actions[i])
+                if self.env_stats is not None:
+                    self.env_stats.record_env('step', i, time.perf_counter() - start)
                 results.append(exp)
-        obs, rewards, dones = map(np.array, zip(*results))
-        return obs, rewards, dones
+        outputs = tuple(map(np.array, zip(*results)))
+        if self.terminal_observation:
+            return outputs
+        return outputs[:3]
+
+    def _send(self, actions, env_ids):
+        """
+        The python code of sending the actions, which signals the processes of the environments to step.
+
+        Args:
+            actions (numpy.ndarray): The actions of the environments.
+            env_ids (numpy.ndarray): The ids of the environments.
+
+        Returns:
+            success (numpy.ndarray), whether the actions are sent.
+        """
+        self.shared_arrays.arrays()[0][env_ids] = actions
+        env_num = self._nums // self.num_proc
+        for proc in np.unique(env_ids // env_num):
+            self._in_flight.add(proc)
+            self.action_queues[proc].put('step')
+        return np.array([True], np.bool_)
+
+    def _recv(self):
+        """
+        The python code of receiving the results, which waits for the first processes to finish.
+
+        Returns:
+            - s1 (numpy.ndarray), the states of the environments.
+            - r1 (numpy.ndarray), the rewards of the environments.
+            - done (numpy.ndarray), whether the simulations of the environments finish or not.
+            - env_ids (numpy.ndarray), the ids of the environments.
+        """
+        env_num = self._nums // self.num_proc
+        while len(self._ready) * env_num < self.num_ready:
+            proc = self.exp_queues[0].get()
+            self._in_flight.discard(proc)
+            self._ready.append(proc)
+        procs = [self._ready.popleft() for _ in range(self.num_ready // env_num)]
+        env_ids = (np.array(procs, np.int32)[:, None] * env_num + np.arange(env_num, dtype=np.int32)).reshape(-1)
+        obs, rewards, dones = self.shared_arrays.arrays()[1:4]
+        return obs[env_ids], rewards[env_ids], dones[env_ids], env_ids
+
+    def _receive(self, queue):
+        """Get the results of a process from the queue, which are pickled by the process if instrumented."""
+        results = queue.get()
+        return pickle.loads(results) if self.env_stats is not None else results
+
+    def _check_num_ready(self):
+        """Check that the environments can be stepped by process in the asynchronous stepping."""
+        if self.num_proc is None or self.num_proc == 1:
+            raise ValueError("The asynchronous stepping needs more than one process.")
+        if self._nums % self.num_proc != 0:
+            raise ValueError(f"The environment number {self._nums} should be divisible by the process number "
+                             f"{self.num_proc} in the asynchronous stepping.")
+        env_num = self._nums // self.num_proc
+        if self.num_ready % env_num != 0 or not env_num <= self.num_ready <= self._nums:
+            raise ValueError(f"The num_ready should be a multiple of {env_num} in [{env_num}, {self._nums}], "
+                             f"but got {self.num_ready}.")
+
+    def _migrate(self, src, dst):
+        """
+        Move the environment at the boundary of the neighbouring processes `src` and `dst`. It returns False if
+        the environment can not be pickled, which is kept by `src`.
+        """
+        src_end, dst_end = ('front', 'back') if src > dst else ('back', 'front')
+        self.action_queues[src].put(('pop', src_end))
+        status, data = self.init_state_queues[src].get()
+        if status == 'error':
+            return False
+        self.action_queues[dst].put(('push', dst_end, data))
+        self._env_nums[src] -= 1
+        self._env_nums[dst] += 1
+        return True
+
+    def _clear_stats(self):
+        """Clear the statistics of the processes."""
+        for i in range(2 * self.num_proc):
+            self.stats[i] = 0
+        self._stats_start = time.time()
+
+    def _start_processes(self):
+        """Start the environment processes, and wait for them to create the environments."""
+        self._started = True
+        for i in range(self.num_proc):
+            begin = sum(self._env_nums[:i])
+            env_num = self._env_nums[i]
+            env_proc = EnvironmentProcess(i, env_num, self._envs[begin:begin + env_num], self.action_queues[i],
+                                          self.exp_queues[i], self.init_state_queues[i], self.shared_arrays, begin,
+                                          self.auto_reset, self.stats, self.start_method, self.env_stats)
+            self.mpe_env_procs.append(env_proc)
+            env_proc.start()
+        errors = []
+        for i in range(self.num_proc):
+            status, message = self.init_state_queues[i].get()
+            if status == 'error':
+                errors.append(f"process {i}:\n{message}")
+        if errors:
+            for env_proc in self.mpe_env_procs:
+                env_proc.terminate()
+            raise RuntimeError("Failed to create the environments in " + "\n".join(errors))
+        if self._pending_seed is not None:
+            for action_q in self.action_queues:
+                action_q.put(('seed', self._pending_seed))
+            self._pending_seed = None
@@ -0,0 +1,108 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+The lightweight NumPy policy evaluated in the environments.
+"""
+
+import numpy as np
+
+_activations = {
+    'tanh': np.tanh,
+    'relu': lambda x: np.maximum(x, 0),
+    'identity': lambda x: x,
+}
+
+
+class NumpyMLPPolicy:
+    r"""
+    A multi-layer perceptron policy evaluated by NumPy, which lets the environment run several steps in
+    one call without returning to the graph. The parameters are passed as a flat float32 vector which
+    concatenates the weight and the bias of each layer, the weight is in the (out, in) layout of
+    `mindspore.nn.Dense`, so the vector can be built from the parameters of the policy network.
+
+    Args:
+        layer_sizes (list(int)): The sizes of the input, the hidden layers and the output.
+        activation (str): The activation of the hidden layers, 'tanh', 'relu' or 'identity'. Default: 'tanh'.
+        discrete (bool): If it is True, the outputs are the logits and the action is sampled from the
+            categorical distribution, otherwise the output is the mean of a gaussian action. Default: True.
+        noise_std (float): The standard deviation of the gaussian action. Default: 0.0.
+        seed (int): The seed of the random generator used in sampling. Default: None.
+
+    Examples:
+        >>> policy = NumpyMLPPolicy([4, 64, 2])
+        >>> params = np.random.randn(policy.num_params).astype(np.float32)
+        >>> action = policy(params, np.zeros(4, np.float32))
+    """
+
+    def __init__(self, layer_sizes, activation='tanh', discrete=True, noise_std=0.0, seed=None):
+        if len(layer_sizes) < 2:
+            raise ValueError(f"The layer_sizes should contain the input and output sizes, but got {layer_sizes}.")
+        if activation not in _activations:
+            raise ValueError(f"The activation should be one of {sorted(_activations)}, but got {activation}.")
+        self._layer_sizes = list(layer_sizes)
+        self._activation = _activations[activation]
+        self._discrete = discrete
+        self._noise_std = noise_std
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def num_params(self):
+        """The length of the flat parameter vector."""
+        return sum(n_in * n_out + n_out for n_in, n_out in zip(self._layer_sizes[:-1], self._layer_sizes[1:]))
+
+    def forward(self, params, state):
+        """
+        Compute the outputs of the network.
+
+        Args:
+            params (numpy.ndarray): The flat parameter vector.
+            state (numpy.ndarray): The state, or a batch of states.
+
+        Returns:
+            outputs (numpy.ndarray), the outputs of the last layer.
+        """
+
+        x = np.asarray(state, np.float32)
+        offset = 0
+        num_layers = len(self._layer_sizes) - 1
+        for i, (n_in, n_out) in enumerate(zip(self._layer_sizes[:-1], self._layer_sizes[1:])):
+            weight = params[offset:offset + n_in * n_out].reshape(n_out, n_in)
+            offset += n_in * n_out
+            bias = params[offset:offset + n_out]
+            offset += n_out
+            x = x @ weight.T + bias
+            if i < num_layers - 1:
+                x = self._activation(x)
+        return x
+
+    def __call__(self, params, state):
+        """
+        Sample an action.
+
+        Args:
+            params (numpy.ndarray): The flat parameter vector.
+            state (numpy.ndarray): The state.
+
+        Returns:
+            action (numpy.ndarray), the sampled action.
+        """
+
+        outputs = self.forward(params, state)
+        if self._discrete:
+            probs = np.exp(outputs - outputs.max())
+            return np.array(self._rng.choice(len(probs), p=probs / probs.sum()))
+        if self._noise_std > 0:
+            outputs = outputs + self._rng.normal(0, self._noise_std, outputs.shape).astype(np.float32)
+        return outputs
@@ -311,3 +311,318 @@ class TicTacToeEnvironment(Environment):
         if cross_one == -3 or cross_two == -3:
             return self._player_two_win
         return self._draw_or_no_result
+
+
+# The cells of the rows, columns and diagonals of the flattened board.
+_LINES = np.array([[0, 1, 2], [3, 4, 5], [6, 7, 8], [0, 3, 6], [1, 4, 7], [2, 5, 8], [0, 4, 8], [2, 4, 6]])
+
+
+def batch_rewards(boards):
+    """
+    Compute the rewards of a batch of Tic-Tac-Toe boards.
+
+    Args:
+        boards (numpy.ndarray): The boards in shape (B, 3, 3), 1 for player one and -1 for player two.
+
+    Returns:
+        - rewards (numpy.ndarray), the rewards of the two players in shape (B, 2).
+        - terminal (numpy.ndarray), whether the games finish in shape (B,).
+    """
+
+    cells = boards.reshape(-1, 9)
+    line_sums = cells[:, _LINES].sum(-1)
+    player_one_win = (line_sums == 3).any(-1)
+    player_two_win = (line_sums == -3).any(-1)
+    rewards = np.zeros((len(cells), 2), np.float32)
+    rewards[player_one_win] = (1.0, -1.0)
+    rewards[player_two_win] = (-1.0, 1.0)
+    terminal = player_one_win | player_two_win | (cells != 0).all(-1)
+    return rewards, terminal
+
+
+class BatchTicTacToeEnvironment(Environment):
+    """
+    The batched Tic-Tac-Toe, which holds `environment_num` games and computes the legal actions, the terminal
+    status and the rewards of all the games with vectorized NumPy. It has the same interface as
+    TicTacToeEnvironment with a leading batch dimension, the finished games ignore their actions until
+    they are reset, and the games whose actions are -1 are not played. The `random_rollout` plays all the
+    input boards to the end by the uniform random players, which can be used as the simulation of MCTS and
+    to evaluate many games at once.
+
+    Args:
+        params (dict): A dictionary contains all the parameters which are used in this class.
+
+            +------------------------------+----------------------------+
+            |  Configuration Parameters    |  Notices                   |
+            +==============================+============================+
+            |  environment_num             |  the number of games,      |
+            |                              |  default 1                 |
+            +------------------------------+----------------------------+
+            |  seed                        |  the seed of random_rollout|
+            +------------------------------+----------------------------+
+        env_id (int): A integer which is used to set the seed of this environment.
+
+    Supported Platforms:
+        ``Ascend`` ``GPU`` ``CPU``
+
+    Examples:
+        >>> from mindspore_rl.environment import BatchTicTacToeEnvironment
+        >>> environment = BatchTicTacToeEnvironment({'environment_num': 1024})
+        >>> state = environment.reset()
+        >>> print(state.shape)
+        (1024, 3, 3)
+    """
+
+    def __init__(self, params, env_id=0):
+        super().__init__()
+        params = params if params is not None else {}
+        self.params = params
+        self.env_id = env_id
+        self._num = params.get('environment_num', 1)
+        seed = params.get('seed')
+        self._rng = np.random.default_rng(None if seed is None else seed + env_id * 1000)
+        self._boards = np.zeros((self._num, 3, 3), np.float32)
+        self._rewards = np.zeros((self._num, 2), np.float32)
+        self._done = np.zeros((self._num,), np.bool_)
+        self._max_utility = Tensor(1.0, ms.float32)
+
+        batch_shape = (self._num,)
+        self._observation_space = Space((3, 3), np.float32, low=-1, high=2, batch_shape=batch_shape)
+        self._action_space = Space((1,), np.int32, low=0, high=9, batch_shape=batch_shape)
+        self._reward_space = Space((2,), np.float32, low=-1, high=2, batch_shape=batch_shape)
+        self._done_space = Space((1,), np.bool_, batch_shape=batch_shape)
+
+        self._reset_ops = P.PyFunc(self._reset, (), (), (self._observation_space.ms_dtype,),
+                                   (self._observation_space.shape,))
+        step_out_dtype = (self._observation_space.ms_dtype, self._reward_space.ms_dtype, self._done_space.ms_dtype)
+        step_out_shape = (self._observation_space.shape, self._reward_space.shape, self._done_space.shape)
+        self._step_ops = P.PyFunc(self._step, (self._action_space.ms_dtype,),
+                                  (self._action_space.shape,), step_out_dtype, step_out_shape)
+        self._save_ops = P.PyFunc(self._save, (), (), (self._observation_space.ms_dtype,),
+                                  (self._observation_space.shape,))
+        self._load_ops = P.PyFunc(self._load, (self._observation_space.ms_dtype,),
+                                  (self._observation_space.shape,), step_out_dtype, step_out_shape)
+        self._legal_action_ops = P.PyFunc(self._legal_action, (), (), (ms.int32,), ((self._num, 9),))
+        self._current_player_ops = P.PyFunc(self._current_player, (), (), (ms.int32,), (batch_shape,))
+        self._is_terminal_ops = P.PyFunc(self._is_terminal, (), (), (ms.bool_,), (batch_shape,))
+        self._rewards_ops = P.PyFunc(self._calculate_rewards, (), (), (ms.float32,), (self._reward_space.shape,))
+        self._random_rollout_ops = P.PyFunc(self._random_rollout, (self._observation_space.ms_dtype,),
+                                            (self._observation_space.shape,), (ms.float32,),
+                                            (self._reward_space.shape,))
+
+    @property
+    def observation_space(self):
+        """
+        Get the state space of the environment.
+
+        Returns:
+            The state space of environment.
+        """
+
+        return self._observation_space
+
+    @property
+    def action_space(self):
+        """
+        Get the action space of the environment.
+
+        Returns:
+            The action space of environment.
+        """
+
+        return self._action_space
+
+    @property
+    def reward_space(self):
+        """
+        Get the reward space of the environment.
+
+        Returns:
+            The reward space of environment.
+        """
+        return self._reward_space
+
+    @property
+    def done_space(self):
+        """
+        Get the done space of the environment.
+
+        Returns:
+            The done space of environment.
+        """
+        return self._done_space
+
+    @property
+    def config(self):
+        """
+        Get the config of environment.
+
+        Returns:
+            A dictionary which contains environment's info.
+        """
+        return {}
+
+    def reset(self):
+        """
+        Reset all the games to the empty boards.
+
+        Returns:
+            A Tensor which states for the initial states in shape (environment_num, 3, 3).
+        """
+        return self._reset_ops()[0]
+
+    def step(self, action):
+        r"""
+        Play one move in each unfinished game.
+
+        Args:
+            action (Tensor): The cells to mark in shape (environment_num, 1), -1 for the games which are not played.
+
+        Returns:
+            - state (Tensor), the boards after performing the actions.
+            - reward (Tensor), the rewards of the two players in shape (environment_num, 2).
+            - done (Tensor), whether the games finish in shape (environment_num, 1).
+        """
+        return self._step_ops(action)
+
+    def save(self):
+        """
+        Return the current boards, which can be loaded later.
+
+        Returns:
+            A tensor which states for the current boards.
+        """
+        return self._save_ops()[0]
+
+    def load(self, state):
+        """
+        Load the input boards, and update the legal actions, the current players and the done info of the games.
+
+        Args:
+            state (Tensor): The input boards.
+
+        Returns:
+            - state (Tensor), the boards.
+            - reward (Tensor), the rewards of the boards.
+            - done (Tensor), whether the boards are terminal.
+        """
+        return self._load_ops(state)
+
+    def calculate_rewards(self):
+        """
+        Return the rewards of the current boards.
+
+        Returns:
+            A tensor which states for the rewards in shape (environment_num, 2).
+        """
+        return self._rewards_ops()[0]
+
+    def legal_action(self):
+        """
+        Return the legal actions of the current boards, the occupied cells are filled as -1.
+
+        Returns:
+            A tensor which states for the legal actions in shape (environment_num, 9).
+        """
+        return self._legal_action_ops()[0]
+
+    def max_utility(self):
+        """
+        Return the max utility of Tic-Tac-Toe.
+
+        Returns:
+            A tensor which states for max utility
+        """
+        return self._max_utility
+
+    def current_player(self):
+        """
+        Return the players to move of the current boards.
+
+        Returns:
+            A tensor which states for the current players in shape (environment_num,).
+        """
+        return self._current_player_ops()[0]
+
+    def is_terminal(self):
+        """
+        Return whether the current boards are terminal.
+
+        Returns:
+            A tensor which states for whether the games finish in shape (environment_num,).
+        """
+        return self._is_terminal_ops()[0]
+
+    def random_rollout(self, state):
+        """
+        Play the input boards to the end by the uniform random players, the current boards are not changed.
+
+        Args:
+            state (Tensor): The boards to play in shape (environment_num, 3, 3).
+
+        Returns:
+            A tensor which states for the final rewards in shape (environment_num, 2).
+        """
+        return self._random_rollout_ops(state)[0]
+
+    def _reset(self):
+        """private reset function"""
+        self._boards = np.zeros_like(self._boards)
+        self._rewards = np.zeros_like(self._rewards)
+        self._done = np.zeros_like(self._done)
+        return self._boards
+
+    def _step(self, action):
+        """private step function"""
+        action = action.reshape(-1)
+        games = np.nonzero(~self._done & (action != -1))[0]
+        cells = self._boards.reshape(self._num, 9)
+        moves = action[games]
+        illegal = (moves < 0) | (moves >= 9)
+        illegal[~illegal] = cells[games[~illegal], moves[~illegal]] != 0
+        if illegal.any():
+            raise ValueError("action {} of game {} is not available, please check the input of step function"
+                             .format(moves[illegal][0], games[illegal][0]))
+        cells[games, moves] = np.where(cells[games].sum(-1) == 0, 1, -1)
+        self._rewards, self._done = batch_rewards(self._boards)
+        return self._boards, self._rewards, self._done[:, None]
+
+    def _save(self):
+        """private save function"""
+        return self._boards.copy()
+
+    def _load(self, state):
+        """private load function"""
+        self._boards = state.astype(np.float32).copy()
+        self._rewards, self._done = batch_rewards(self._boards)
+        return self._boards, self._rewards, self._done[:, None]
+
+    def _legal_action(self):
+        """private legal action function"""
+        cells = self._boards.reshape(self._num, 9)
+        return np.where(cells == 0, np.arange(9, dtype=np.int32), -1).astype(np.int32)
+
+    def _current_player(self):
+        """private current player function"""
+        return (self._boards.reshape(self._num, 9).sum(-1) != 0).astype(np.int32)
+
+    def _is_terminal(self):
+        """private is terminal function"""
+        return self._done
+
+    def _calculate_rewards(self):
+        """private rewards function"""
+        return self._rewards
+
+    def _random_rollout(self, state):
+        """private random rollout function"""
+        cells = state.reshape(-1, 9).astype(np.float32)
+        rewards, done = batch_rewards(cells)
+        while not done.all():
+            games = np.nonzero(~done)[0]
+            # Pick a uniform random empty cell of each game by the largest random key.
+            keys = self._rng.random((len(games), 9))
+            keys[cells[games] != 0] = -1
+            cells[games, keys.argmax(-1)] = np.where(cells[games].sum(-1) == 0, 1, -1)
+            rewards, done = batch_rewards(cells)
+        return rewards
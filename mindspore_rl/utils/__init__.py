@@ -22,7 +22,8 @@ from mindspore_rl.utils.soft_update import SoftUpdate
 from mindspore_rl.utils.noise import OUNoise
 from mindspore_rl.utils.callback import CallbackParam
 from mindspore_rl.utils.callback import CallbackManager
-from .mcts import VanillaFunc, AlgorithmFunc, MCTS
+from .mcts import VanillaFunc, AlgorithmFunc, MCTS, RandomRolloutFunc, BatchAlgorithmFunc, BatchVanillaFunc
 
 __all__ = ["DiscountedReturn", "CallbackParam", "CallbackManager",
-           "SoftUpdate", "OUNoise", "VanillaFunc", "AlgorithmFunc", "MCTS"]
+           "SoftUpdate", "OUNoise", "VanillaFunc", "AlgorithmFunc", "MCTS", "RandomRolloutFunc",
+           "BatchAlgorithmFunc", "BatchVanillaFunc"]
@@ -224,16 +224,61 @@ class TimeCallback(Callback):
                 .format(params.cur_episode, steps, epoch_secends, step_seconds), flush=True)
 
 
+class EnvironmentStatsCallback(Callback):
+    r'''
+    Environment stats callback to monitor the throughput and the latency of the collect environment, which
+    should be a MultiEnvironmentWrapper with `instrument` set. It prints the environment steps per second, the
+    step latency and the straggler environment since the last print.
+
+    Args:
+        print_rate (int): The frequency to print the stats.
+    '''
+    def __init__(self, print_rate=1):
+        super(EnvironmentStatsCallback, self).__init__()
+        if not isinstance(print_rate, int) or print_rate < 0:
+            raise ValueError("The arg of 'print_rate' must be int and >= 0, but get ", print_rate)
+        self._print_rate = print_rate
+
+    def episode_end(self, params):
+        '''
+        Print the stats of the environments in the end of episode.
+
+        Args:
+            params (CallbackParam): Parameters of the tarining.
+        '''
+        if self._print_rate == 0 or params.cur_episode % self._print_rate != 0:
+            return
+        env = params.get('collect_environment')
+        if not hasattr(env, 'environment_stats'):
+            return
+        stats = env.environment_stats(clear=True)
+        if not stats:
+            return
+        straggler = "env {}".format(stats['straggler_env'])
+        if 'straggler_process' in stats:
+            straggler += " in process {}".format(stats['straggler_process'])
+        print("Episode {} env steps/sec: {:.1f}, step time: {:5.3f} ms (p50 {:5.3f} ms, p99 {:5.3f} ms), "
+              "reset time: {:5.3f} ms, wait time: {:5.3f} ms, serialize time: {:5.3f} ms, straggler: {} "
+              "({:5.3f} ms)".format(params.cur_episode, stats['env_steps_per_sec'], stats['step_latency'] * 1000,
+                                    stats['step_latency_p50'] * 1000, stats['step_latency_p99'] * 1000,
+                                    stats['reset_latency'] * 1000, stats['wait_latency'] * 1000,
+                                    stats['serialize_latency'] * 1000, straggler,
+                                    stats['straggler_latency'] * 1000), flush=True)
+
+
 class CheckpointCallback(Callback):
     r'''
     Save the checkpoint file for all the model weights. And keep the latest `max_ckpt_nums` checkpoint files.
+    If `save_replay_buffer` is True, the latest snapshot of each replay buffer returned by
+    `Trainer.replay_buffers` is also saved in a background thread, and restored with the weights.
 
     Args:
         save_per_episode (int): The frequency to save checkpoint.
         directory (Optional[str]): The directory for saving checkpoints. Default is current path.
         max_ckpt_nums (int): Numbers of how many checkpoint files to be kept. Default:5.
+        save_replay_buffer (bool): Whether to save the snapshots of the replay buffers. Default: False.
     '''
-    def __init__(self, save_per_episode=0, directory=None, max_ckpt_nums=5):
+    def __init__(self, save_per_episode=0, directory=None, max_ckpt_nums=5, save_replay_buffer=False):
         super(CheckpointCallback, self).__init__()
         if not isinstance(save_per_episode, int) or save_per_episode < 0:
             raise ValueError("The arg of 'save_per_episode' must be int and >= 0, but get ", save_per_episode)
@@ -242,6 +287,8 @@ class CheckpointCallback(Callback):
 
         self._max_ckpt_nums = max_ckpt_nums
         self._save_per_episode = save_per_episode
+        self._save_replay_buffer = save_replay_buffer
+        self._buffer_writers = {}
 
         # Make directory if provided or get current directory.
         if directory is not None:
@@ -287,6 +334,28 @@ class CheckpointCallback(Callback):
                     os.remove(ckpt_files[0])
                     ckpt_list.remove(ckpt_files[0])
 
+        # 5 Save the snapshots of the replay buffers in background. Eg: /path/replay_buffer/ .
+        if self._save_replay_buffer and params.get('buffers'):
+            for key, buffer in params.buffers.items():
+                self._join_buffer_writer(key)
+                self._buffer_writers[key] = buffer.snapshot(self._save_path + '/' + key, background=True)
+
+    def end(self, params):
+        '''
+        Wait for the snapshots of the replay buffers in the end of training.
+
+        Args:
+            params (CallbackParam): Parameters of the tarining.
+        '''
+        for key in list(self._buffer_writers):
+            self._join_buffer_writer(key)
+
+    def _join_buffer_writer(self, key):
+        '''Wait for the previous snapshot of the replay buffer.'''
+        writer = self._buffer_writers.pop(key, None)
+        if writer is not None:
+            writer.join()
+
 
 class EvaluateCallback(Callback):
     r'''
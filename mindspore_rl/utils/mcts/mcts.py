@@ -29,6 +29,8 @@ from mindspore.common import ms_function
 VANILLA = 0
 # Tree Enum Value
 COMMON = 0
+# Game Enum Value
+TIC_TAC_TOE = 0
 
 
 class MCTS(nn.Cell):
@@ -58,13 +60,24 @@ class MCTS(nn.Cell):
         state_shape (tuple): A tuple which states for the shape of state.
         customized_func (nn.Cell): Some algorithm specific codes. For more detail, please have a look at
             documentation of AlgorithmBasedFunc.
+        game_type (enum): A enum value which states for the game simulated in C++, such as TIC_TAC_TOE. It is
+            only used by `mcts_parallel_search`. Default: None.
+        num_threads (int): The number of threads which search the same tree concurrently in
+            `mcts_parallel_search`. The concurrent selections are spread over the tree by the virtual loss.
+            Default: 1.
+        batch_env (Environment): The batched environment of B games, such as BatchTicTacToeEnvironment, which
+            plays the B leaves selected in each iteration of `mcts_batch_search` or `mcts_multi_root_search` in
+            one call. The customized_func should be a BatchAlgorithmFunc then. Default: None.
 
     Examples:
         >>> mcts = MCTS()
     """
 
-    def __init__(self, env, tree_type, node_type, max_action, max_iteration, state_shape, customized_func):
+    def __init__(self, env, tree_type, node_type, max_action, max_iteration, state_shape, customized_func,
+                 game_type=None, num_threads=1, batch_env=None):
         super().__init__()
+        if num_threads < 1:
+            raise ValueError(f"The num_threads should be positive, but got {num_threads}.")
         current_path = os.path.dirname(os.path.normpath(os.path.realpath(__file__)))
         self.mcts_creation = ops.Custom("{}/libmcts.so:MctsCreation".format(current_path), (1,), ms.int64, "aot")
         if max_action != -1:
@@ -87,6 +100,12 @@ class MCTS(nn.Cell):
             "{}/libmcts.so:UpdateRootState".format(current_path), (1,), (ms.bool_), "aot")
         self.get_state = ops.Custom("{}/libmcts.so:GetState".format(current_path), state_shape, (ms.float32), "aot")
         self.destroy_tree = ops.Custom("{}/libmcts.so:DestroyTree".format(current_path), (1,), (ms.bool_), "aot")
+        self.mcts_parallel = ops.Custom(
+            "{}/libmcts.so:MctsParallelSearch".format(current_path), (1,), (ms.int32), "aot")
+        self.advance_tree_root = ops.Custom(
+            "{}/libmcts.so:MctsAdvanceRoot".format(current_path), (1,), (ms.bool_), "aot")
+        self.mcts_tree_memory = ops.Custom(
+            "{}/libmcts.so:MctsTreeMemory".format(current_path), (2,), (ms.int64), "aot")
         self.depend = P.Depend()
 
         # Add side effect annotation
@@ -97,8 +116,29 @@ class MCTS(nn.Cell):
         self.update_state.add_prim_attr("side_effect_mem", True)
         self.update_root_state.add_prim_attr("side_effect_mem", True)
         self.destroy_tree.add_prim_attr("side_effect_mem", True)
+        self.mcts_parallel.add_prim_attr("side_effect_mem", True)
+        self.advance_tree_root.add_prim_attr("side_effect_mem", True)
+        self.mcts_tree_memory.add_prim_attr("side_effect_mem", True)
+        if batch_env is not None:
+            batch_size = batch_env.observation_space.shape[0]
+            self.mcts_batch_selection = ops.Custom(
+                "{}/libmcts.so:MctsBatchSelection".format(current_path),
+                ((batch_size,), (batch_size, 1), (batch_size,) + tuple(state_shape)),
+                (ms.int64, ms.int32, ms.float32), "aot")
+            self.mcts_batch_update = ops.Custom(
+                "{}/libmcts.so:MctsBatchUpdate".format(current_path), (1,), (ms.bool_), "aot")
+            self.mcts_batch_creation = ops.Custom(
+                "{}/libmcts.so:MctsBatchCreation".format(current_path), (batch_size,), ms.int64, "aot")
+            self.batch_best_action = ops.Custom(
+                "{}/libmcts.so:BestAction".format(current_path), (batch_size,), (ms.int32), "aot")
+            self.mcts_batch_selection.add_prim_attr("side_effect_mem", True)
+            self.mcts_batch_update.add_prim_attr("side_effect_mem", True)
+            self.mcts_batch_creation.add_prim_attr("side_effect_mem", True)
+            self.broadcast_to_batch = P.BroadcastTo((batch_size,))
+            self.batch_size = Tensor(batch_size, ms.int32)
 
         self.zero = Tensor(0, ms.int32)
+        self.one = Tensor(1, ms.int32)
         self.zero_float = Tensor(0, ms.float32)
         self.true = Tensor(True, ms.bool_)
         self.false = Tensor(False, ms.bool_)
@@ -109,6 +149,9 @@ class MCTS(nn.Cell):
         self.max_iteration = Tensor(max_iteration, ms.int32)
         self.max_action = max_action
         self.customized_func = customized_func
+        self.game_type = game_type
+        self.batch_env = batch_env
+        self.num_threads = Tensor(num_threads, ms.int32)
         temp_size = 1
         for shape in state_shape:
             temp_size *= shape
@@ -136,8 +179,6 @@ class MCTS(nn.Cell):
             action (mindspore.int32): The action which is returned by monte carlo tree search.
         """
 
-        expanded = self.false
-        reward = self.zero_float
         root_player = self.env.current_player()
         max_utility = self.env.max_utility()
         tree_handle = self.mcts_creation(self.tree_type, self.node_type, root_player,
@@ -145,12 +186,202 @@ class MCTS(nn.Cell):
         # Create a replica of environment
         new_state = self.env.save()
         self.update_root_state(tree_handle, new_state)
+        self._search(tree_handle)
+        action = self.best_action(tree_handle)
+        tree_handle = self.depend(tree_handle, action)
+        self.destroy_tree(tree_handle)
+        return action
+
+    @ms_function
+    def create_tree(self, *args):
+        """
+        create_tree creates a tree of current state which is kept across the moves. Each move searches the tree by
+        `search_tree`, and plays the action by `advance_root`, so that the next search starts from the statistics
+        of the subtree of the action instead of an empty tree. The tree is destroyed by `release_tree`.
+
+        Args:
+            *args (Tensor): any values which will be the input of MctsCreation, the same as `mcts_search`.
+
+        Returns:
+            tree_handle (mindspore.int64): The unique handle of the tree.
+        """
+
+        root_player = self.env.current_player()
+        max_utility = self.env.max_utility()
+        return self.mcts_creation(self.tree_type, self.node_type, root_player, max_utility, self.state_size, *args)
+
+    @ms_function
+    def search_tree(self, tree_handle):
+        """
+        search_tree searches the tree created by `create_tree` from its root, which is current state, for
+        `max_iteration` more iterations. The environment is restored to current state after the search. If the
+        `game_type` is set, the tree is searched by `num_threads` threads in C++ as `mcts_parallel_search`.
+
+        Args:
+            tree_handle (mindspore.int64): The unique handle of the tree.
+
+        Returns:
+            action (mindspore.int32): The action which is returned by monte carlo tree search.
+        """
+
+        root_state = self.env.save()
+        success = self.update_root_state(tree_handle, root_state)
+        tree_handle = self.depend(tree_handle, success)
+        if self.game_type is not None:
+            return self.mcts_parallel(tree_handle, self.node_type, self.game_type, self.num_threads,
+                                      self.max_iteration)
+        self._search(tree_handle)
+        action = self.best_action(tree_handle)
+        root_state = self.depend(root_state, action)
+        self.env.load(root_state)
+        return action
+
+    @ms_function
+    def advance_root(self, tree_handle, action):
+        """
+        advance_root moves the root of the tree to the child of the action, which keeps the subtree of the child
+        and frees its siblings. It is called after the action is played in the environment, by either player.
+        If the child is not expanded yet, the search of the next move starts from a new root.
+
+        Args:
+            tree_handle (mindspore.int64): The unique handle of the tree.
+            action (mindspore.int32): The action which is played in the root state.
+
+        Returns:
+            success (mindspore.bool\_): Whether the root is advanced successfully.
+        """
+
+        current_player = self.env.current_player()
+        return self.advance_tree_root(tree_handle, self.node_type, action, current_player)
+
+    @ms_function
+    def release_tree(self, tree_handle):
+        """
+        release_tree destroys the tree created by `create_tree`.
+
+        Args:
+            tree_handle (mindspore.int64): The unique handle of the tree.
+
+        Returns:
+            success (mindspore.bool\_): Whether the tree is destroyed successfully.
+        """
+
+        return self.destroy_tree(tree_handle)
+
+    @ms_function
+    def tree_memory(self, tree_handle):
+        """
+        tree_memory returns the memory of the tree created by `create_tree`. The nodes of a tree, their states and
+        the arrays of their children are allocated from the arena of the tree, which reuses the memory of the
+        freed subtrees and is released with the tree.
+
+        Args:
+            tree_handle (mindspore.int64): The unique handle of the tree.
+
+        Returns:
+            memory (mindspore.int64): The number of nodes of the tree and the bytes of its arena in shape (2,).
+        """
+
+        return self.mcts_tree_memory(tree_handle)
+
+    @ms_function
+    def mcts_parallel_search(self, *args):
+        """
+        mcts_parallel_search searches the tree of current state by `num_threads` threads in C++, which simulate
+        the game of `game_type` instead of the environment and the customized_func, so that the search scales
+        across CPU cores for the same root. The expansion uses the uniform prior, and the simulation plays
+        randomly to the end.
+
+        Args:
+            *args (Tensor): any values which will be the input of MctsCreation, the same as `mcts_search`.
+
+        Returns:
+            action (mindspore.int32): The action which is returned by monte carlo tree search.
+        """
+
+        root_player = self.env.current_player()
+        max_utility = self.env.max_utility()
+        tree_handle = self.mcts_creation(self.tree_type, self.node_type, root_player,
+                                         max_utility, self.state_size, *args)
+        new_state = self.env.save()
+        success = self.update_root_state(tree_handle, new_state)
+        tree_handle = self.depend(tree_handle, success)
+        action = self.mcts_parallel(tree_handle, self.node_type, self.game_type, self.num_threads,
+                                    self.max_iteration)
+        tree_handle = self.depend(tree_handle, action)
+        self.destroy_tree(tree_handle)
+        return action
+
+    @ms_function
+    def mcts_batch_search(self, *args):
+        """
+        mcts_batch_search selects B leaves of the tree in each iteration, where B is the number of games of
+        `batch_env`. The pending leaves are spread over the tree by the virtual loss. The leaves are played by
+        `batch_env` in one call, their priors and returns are evaluated by the BatchAlgorithmFunc in one batched
+        call, such as a neural network, then all the leaves are expanded and backpropagated together. The search
+        stops after `max_iteration` leaves are evaluated.
+
+        Args:
+            *args (Tensor): any values which will be the input of MctsCreation, the same as `mcts_search`.
+
+        Returns:
+            action (mindspore.int32): The action which is returned by monte carlo tree search.
+        """
+
+        root_player = self.env.current_player()
+        max_utility = self.env.max_utility()
+        tree_handle = self.mcts_creation(self.tree_type, self.node_type, root_player,
+                                         max_utility, self.state_size, *args)
+        new_state = self.env.save()
+        self.update_root_state(tree_handle, new_state)
+        tree_handles = self.broadcast_to_batch(tree_handle)
+        self._batch_search(tree_handles, self.batch_size)
+        action = self.best_action(tree_handle)
+        tree_handle = self.depend(tree_handle, action)
+        self.destroy_tree(tree_handle)
+        return action
+
+    @ms_function
+    def mcts_multi_root_search(self, *args):
+        """
+        mcts_multi_root_search searches B trees in lockstep, one for the current state of each game of
+        `batch_env`, such as the games of self-play. Each iteration selects a leaf of every tree, plays the B
+        leaves by `batch_env` in one call, evaluates them by the BatchAlgorithmFunc in one batched call, then
+        expands and backpropagates them into their own trees. Each tree is searched for `max_iteration`
+        iterations, and `batch_env` is restored to the current states after the search.
+
+        Args:
+            *args (Tensor): any values which will be the input of MctsCreation, the same as `mcts_search`. They
+                are shared by all the trees.
+
+        Returns:
+            action (mindspore.int32): The action returned by monte carlo tree search for each game in shape (B,).
+                It is -1 for the game which is over.
+        """
+
+        root_player = self.batch_env.current_player()
+        max_utility = self.batch_env.max_utility()
+        root_state = self.batch_env.save()
+        tree_handles = self.mcts_batch_creation(self.tree_type, self.node_type, root_player, max_utility,
+                                                self.state_size, root_state, *args)
+        self._batch_search(tree_handles, self.one)
+        action = self.batch_best_action(tree_handles)
+        tree_handles = self.depend(tree_handles, action)
+        self.destroy_tree(tree_handles)
+        root_state = self.depend(root_state, action)
+        self.batch_env.load(root_state)
+        return action
+
+    def _search(self, tree_handle):
+        """Search the tree from its root for max_iteration iterations in the replica of environment."""
+        reward = self.zero_float
         i = self.zero
         while i < self.max_iteration:
             # 1. Interact with the replica of environment, and update the latest state and its reward
             visited_node, last_action, visited_path_length = self.mcts_selection(tree_handle, self.max_action)
             last_state = self.get_state(tree_handle, visited_node, visited_path_length-2)
-            if expanded:
+            # The root is loaded until it is expanded, otherwise the last action is played in its parent state.
+            if visited_path_length > 1:
                 self.env.load(last_state)
                 new_state, reward, _ = self.env.step(last_action)
             else:
@@ -162,7 +393,6 @@ class MCTS(nn.Cell):
             prior = self.customized_func.calculate_prior(new_state, legal_action)
 
             if not self.env.is_terminal():
-                expanded = self.true
                 self.mcts_expansion(tree_handle, self.node_type, visited_node,
                                     legal_action, reward, prior, current_player)
             else:
@@ -173,10 +403,27 @@ class MCTS(nn.Cell):
             returns = self.customized_func.simulation(new_state)
             self.mcts_backpropagation(tree_handle, visited_node, returns)
             i += 1
-        action = self.best_action(tree_handle)
-        tree_handle = self.depend(tree_handle, action)
-        self.destroy_tree(tree_handle)
-        return action
+        return tree_handle
+
+    def _batch_search(self, tree_handles, num_leaf):
+        """Search the trees of the handles in batch_env, each iteration evaluates num_leaf leaves of a tree."""
+        i = self.zero
+        while i < self.max_iteration:
+            # 1. Select B leaves, and play their last actions in the batched environment. The leaves which are
+            #    the root are not played.
+            visited_node, last_action, last_state = self.mcts_batch_selection(tree_handles)
+            self.batch_env.load(last_state)
+            new_state, reward, done = self.batch_env.step(last_action)
+            # 2. Evaluate the priors of the legal actions and the returns of all the leaves in one call.
+            legal_action = self.batch_env.legal_action()
+            current_player = self.batch_env.current_player()
+            prior = self.customized_func.calculate_prior(new_state, legal_action)
+            returns = self.customized_func.simulation(new_state)
+            # 3. Expand or save the outcomes of all the leaves, and backpropagate them.
+            self.mcts_batch_update(tree_handles, self.node_type, visited_node, new_state, reward, done,
+                                   legal_action, prior, current_player, returns)
+            i += num_leaf
+        return tree_handles
 
 
 class AlgorithmFunc(nn.Cell):
@@ -214,6 +461,43 @@ class AlgorithmFunc(nn.Cell):
         raise NotImplementedError("You must implement this function")
 
 
+class BatchAlgorithmFunc(nn.Cell):
+    """
+    This is the batched counterpart of AlgorithmFunc used by `MCTS.mcts_batch_search`, which evaluates all the
+    leaves of an iteration in one call, so that a neural network runs at the batch size instead of one. User
+    need to inherit this base class and implement all the functions with SAME input and output.
+    """
+    def __init__(self):
+        super().__init__()
+
+    def calculate_prior(self, new_states, legal_actions):
+        """
+        The functionality of calculate_prior is to calculate prior of the legal actions of each state.
+
+        Args:
+            new_states (mindspore.float32): The states of the leaves in shape (B, ...).
+            legal_actions (mindspore.int32): The legal actions of the states in shape (B, num_action), the
+                illegal ones are -1.
+
+        Returns:
+            priors (mindspore.float32): The probability (or prior) of the legal actions in shape (B, num_action).
+        """
+        raise NotImplementedError("You must implement this function")
+
+    def simulation(self, new_states):
+        """
+        The functionality of simulation is to calculate the returns of each state, such as by a value network
+        or playing to the end.
+
+        Args:
+            new_states (mindspore.float32): The states of the leaves in shape (B, ...).
+
+        Returns:
+            returns (mindspore.float32): The returns of all the players in shape (B, num_player).
+        """
+        raise NotImplementedError("You must implement this function")
+
+
 class VanillaFunc(AlgorithmFunc):
     """
     This is the customized algorithm for VanillaMCTS. The prior of each legal action is uniform
@@ -265,3 +549,73 @@ class VanillaFunc(AlgorithmFunc):
             action = self.categorical.sample((), prob)
             new_state, reward, done = self.env.step(legal_action[action])
         return reward
+
+
+class RandomRolloutFunc(VanillaFunc):
+    """
+    The VanillaFunc whose simulation plays randomly to the end in one call of `random_rollout` of the
+    environment, such as BatchTicTacToeEnvironment with one game, instead of stepping the environment in
+    the graph move by move.
+
+    Args:
+        env (Environment): The environment which provides `random_rollout` of a batch of one state.
+    """
+    def __init__(self, env):
+        super().__init__(env)
+        self.expand_dims = P.ExpandDims()
+
+    def simulation(self, new_state):
+        """
+        The functionality of simulation is to play the input state to the end randomly.
+
+        Args:
+            new_state (mindspore.float32): The state of environment.
+
+        Returns:
+            rewards (mindspore.float32): The results of simulation.
+        """
+        return self.env.random_rollout(self.expand_dims(new_state, 0))[0]
+
+
+class BatchVanillaFunc(BatchAlgorithmFunc):
+    """
+    This is the batched VanillaFunc. The prior of each legal action is uniform distribution, and all the states
+    are played randomly to the end in one call of `random_rollout` of the batched environment.
+
+    Args:
+        env (Environment): The batched environment which provides `random_rollout`, such as
+            BatchTicTacToeEnvironment with B games.
+    """
+    def __init__(self, env):
+        super().__init__()
+        self.env = env
+        self.reduce_sum = P.ReduceSum(keep_dims=True)
+        self.maximum = P.Maximum()
+        self.cast = P.Cast()
+        self.one = Tensor(1, ms.float32)
+
+    def calculate_prior(self, new_states, legal_actions):
+        """
+        The functionality of calculate_prior is to calculate the uniform prior of the legal actions of each state.
+
+        Args:
+            new_states (mindspore.float32): The states of the leaves in shape (B, ...).
+            legal_actions (mindspore.int32): The legal actions of the states in shape (B, num_action).
+
+        Returns:
+            priors (mindspore.float32): The uniform prior of the legal actions in shape (B, num_action).
+        """
+        legal = self.cast(legal_actions != -1, ms.float32)
+        return legal / self.maximum(self.reduce_sum(legal, -1), self.one)
+
+    def simulation(self, new_states):
+        """
+        The functionality of simulation is to play all the states to the end randomly.
+
+        Args:
+            new_states (mindspore.float32): The states of the leaves in shape (B, ...).
+
+        Returns:
+            returns (mindspore.float32): The final rewards of all the players in shape (B, num_player).
+        """
+        return self.env.random_rollout(new_states)
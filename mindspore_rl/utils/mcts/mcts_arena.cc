@@ -0,0 +1,103 @@
+/**
+ * Copyright 2022 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+
+#include <utils/mcts/mcts_arena.h>
+#include <algorithm>
+#include <iostream>
+
+namespace {
+// The bytes of each slab, which holds at least one slot.
+constexpr size_t kSlabBytes = 64 * 1024;
+// The nodes are aligned as the memory returned by new, so that any node can be placed in them, while the states and
+// the arrays of children only need to hold the pointer of the free list.
+constexpr size_t kNodeAlign = alignof(std::max_align_t);
+constexpr size_t kArrayAlign = alignof(void *);
+}  // namespace
+
+MonteCarloTreeSlabPool::MonteCarloTreeSlabPool(size_t slot_size, size_t slot_align)
+    : slot_size_((std::max(slot_size, sizeof(void *)) + slot_align - 1) / slot_align * slot_align),
+      slots_per_slab_(std::max<size_t>(kSlabBytes / slot_size_, 1)) {}
+
+void *MonteCarloTreeSlabPool::Allocate() {
+  if (free_list_ != nullptr) {
+    auto slot = free_list_;
+    free_list_ = *static_cast<void **>(slot);
+    return slot;
+  }
+  if (cursor_ == slab_end_) {
+    slabs_.emplace_back(new char[slot_size_ * slots_per_slab_]);
+    cursor_ = slabs_.back().get();
+    slab_end_ = cursor_ + slot_size_ * slots_per_slab_;
+  }
+  auto slot = cursor_;
+  cursor_ += slot_size_;
+  return slot;
+}
+
+void MonteCarloTreeSlabPool::Free(void *slot) {
+  *static_cast<void **>(slot) = free_list_;
+  free_list_ = slot;
+}
+
+void *MonteCarloTreeArena::AllocateNode(size_t node_size) {
+  if (node_pool_ == nullptr) {
+    node_pool_ = std::make_unique<MonteCarloTreeSlabPool>(node_size, kNodeAlign);
+  }
+  if (node_size > node_pool_->slot_size()) {
+    std::cout << "[Error]The node of " << node_size << " bytes is larger than the other nodes of the tree."
+              << std::endl;
+    return nullptr;
+  }
+  return node_pool_->Allocate();
+}
+
+void MonteCarloTreeArena::FreeNode(void *node) { node_pool_->Free(node); }
+
+float *MonteCarloTreeArena::AllocateState() {
+  if (state_pool_ == nullptr) {
+    state_pool_ = std::make_unique<MonteCarloTreeSlabPool>(sizeof(float) * state_size_, kArrayAlign);
+  }
+  return static_cast<float *>(state_pool_->Allocate());
+}
+
+void MonteCarloTreeArena::FreeState(float *state) { state_pool_->Free(state); }
+
+MonteCarloTreeNode **MonteCarloTreeArena::AllocateChildren(int num_children) {
+  if (children_pools_.size() <= static_cast<size_t>(num_children)) {
+    children_pools_.resize(num_children + 1);
+  }
+  auto &pool = children_pools_[num_children];
+  if (pool == nullptr) {
+    pool = std::make_unique<MonteCarloTreeSlabPool>(sizeof(MonteCarloTreeNode *) * num_children, kArrayAlign);
+  }
+  return static_cast<MonteCarloTreeNode **>(pool->Allocate());
+}
+
+void MonteCarloTreeArena::FreeChildren(MonteCarloTreeNode **children, int num_children) {
+  children_pools_[num_children]->Free(children);
+}
+
+size_t MonteCarloTreeArena::bytes() const {
+  size_t total = 0;
+  for (auto pool : {node_pool_.get(), state_pool_.get()}) {
+    total += (pool == nullptr ? 0 : pool->bytes());
+  }
+  for (const auto &pool : children_pools_) {
+    total += (pool == nullptr ? 0 : pool->bytes());
+  }
+  return total;
+}
@@ -0,0 +1,80 @@
+/**
+ * Copyright 2022 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+
+#ifndef MINDSPORE_RL_UTILS_MCTS_MCTS_ARENA_H_
+#define MINDSPORE_RL_UTILS_MCTS_MCTS_ARENA_H_
+
+#include <cstddef>
+#include <memory>
+#include <vector>
+
+class MonteCarloTreeNode;
+
+// The pool of the slots of the same size, which are carved from the slabs in order and recycled by a free list.
+// Each slot is aligned by slot_align, which should be a power of 2 and at most the alignment of std::max_align_t.
+class MonteCarloTreeSlabPool {
+ public:
+  MonteCarloTreeSlabPool(size_t slot_size, size_t slot_align);
+  ~MonteCarloTreeSlabPool() = default;
+
+  void *Allocate();
+  void Free(void *slot);
+
+  size_t slot_size() const { return slot_size_; }
+  size_t bytes() const { return slabs_.size() * slot_size_ * slots_per_slab_; }
+
+ private:
+  size_t slot_size_;
+  size_t slots_per_slab_;
+  std::vector<std::unique_ptr<char[]>> slabs_;
+  char *cursor_ = nullptr;     // The next slot of the last slab which is never allocated.
+  char *slab_end_ = nullptr;   // The end of the last slab.
+  void *free_list_ = nullptr;  // The freed slots, each of which saves the next one.
+};
+
+// The arena of a monte carlo tree, which holds the memory of all its nodes. The nodes, their states and the arrays
+// of their children are in three kinds of slab pools, so the siblings which are expanded together are contiguous,
+// and the states are packed without the overhead of the allocator. The freed memory is reused by the next nodes, and
+// all of it is released at once when the tree is destroyed.
+class MonteCarloTreeArena {
+ public:
+  explicit MonteCarloTreeArena(int state_size) : state_size_(state_size) {}
+  ~MonteCarloTreeArena() = default;
+
+  // The memory of a node, the slot size is decided by the first node and all the nodes should not be larger.
+  void *AllocateNode(size_t node_size);
+  void FreeNode(void *node);
+
+  // The memory of the state of a node.
+  float *AllocateState();
+  void FreeState(float *state);
+
+  // The array of the children of a node.
+  MonteCarloTreeNode **AllocateChildren(int num_children);
+  void FreeChildren(MonteCarloTreeNode **children, int num_children);
+
+  // The total bytes of the slabs.
+  size_t bytes() const;
+
+ private:
+  int state_size_;
+  std::unique_ptr<MonteCarloTreeSlabPool> node_pool_;
+  std::unique_ptr<MonteCarloTreeSlabPool> state_pool_;
+  std::vector<std::unique_ptr<MonteCarloTreeSlabPool>> children_pools_;  // The pool of each number of children.
+};
+
+#endif  // MINDSPORE_RL_UTILS_MCTS_MCTS_ARENA_H_
@@ -16,15 +16,17 @@
 
 #include <utils/mcts/mcts_factory.h>
 #include <iostream>
+#include <mutex>
 
 MonteCarloTreeFactory& MonteCarloTreeFactory::GetInstance() {
   static MonteCarloTreeFactory instance;
   return instance;
 }
 
-MonteCarloTreeNodePtr MonteCarloTreeFactory::CreateNode(const std::string& node_name, int action, float prior,
-                                                        float* init_reward, int player, int64_t tree_handle,
-                                                        MonteCarloTreeNodePtr parent_node, int row, int state_size) {
+MonteCarloTreeNodePtr MonteCarloTreeFactory::CreateNode(const std::string& node_name, void* address, int action,
+                                                        float prior, float* init_reward, int player,
+                                                        int64_t tree_handle, MonteCarloTreeNodePtr parent_node, int row,
+                                                        int state_size) {
   auto node_creator = map_node_name_to_node_creator_.find(node_name);
   if (node_creator == map_node_name_to_node_creator_.end()) {
     std::ostringstream oss;
@@ -38,19 +40,34 @@ MonteCarloTreeNodePtr MonteCarloTreeFactory::CreateNode(const std::string& node_
     // Return nullptr to catch the exception outside.
     return nullptr;
   }
-  auto node = std::shared_ptr<MonteCarloTreeNode>(
-      node_creator->second(node_name, action, prior, init_reward, player, tree_handle, parent_node, row, state_size));
-  return node;
+  return node_creator->second(address, node_name, action, prior, init_reward, player, tree_handle, parent_node, row,
+                              state_size);
+}
+
+size_t MonteCarloTreeFactory::NodeSize(const std::string& node_name) {
+  auto node_size = map_node_name_to_node_size_.find(node_name);
+  return node_size == map_node_name_to_node_size_.end() ? 0 : node_size->second;
 }
 
 std::tuple<int64_t, MonteCarloTreePtr> MonteCarloTreeFactory::CreateTree(const std::string& tree_name,
                                                                          const std::string& node_name, int player,
                                                                          float max_utility, int state_size,
-                                                                         std::vector<void*> input_global_variable) {
+                                                                         std::vector<void*> input_global_variable,
+                                                                         const std::vector<size_t>& variable_size) {
+  std::unique_lock<std::shared_mutex> lock(mutex_);
   handle_++;
+  if (!variable_size.empty()) {
+    auto& variable_data = map_handle_to_tree_variable_data_[handle_];
+    variable_data.reserve(input_global_variable.size());
+    for (size_t i = 0; i < input_global_variable.size(); i++) {
+      auto input = static_cast<char*>(input_global_variable[i]);
+      variable_data.emplace_back(input, input + variable_size[i]);
+      input_global_variable[i] = variable_data.back().data();
+    }
+  }
   MonteCarloTreePtr tree;
-  auto root =
-      MonteCarloTreeFactory::GetInstance().CreateNode(node_name, 0, 0.0, 0, player, handle_, nullptr, 0, state_size);
+  // The root is created in the arena of the tree after the tree is created.
+  MonteCarloTreeNodePtr root = nullptr;
   if (tree_name == "Common") {
     tree = std::make_shared<MonteCarloTree>(root, max_utility, handle_, state_size);
   } else {
@@ -64,25 +81,54 @@ std::tuple<int64_t, MonteCarloTreePtr> MonteCarloTreeFactory::CreateTree(const s
       }
       oss << "]";
       std::cout << oss.str() << std::endl;
+      map_handle_to_tree_variable_data_.erase(handle_);
       // Return nullptr to catch the exception outside.
       return std::make_tuple(handle_, nullptr);
     }
     tree = std::shared_ptr<MonteCarloTree>(tree_creator->second(root, max_utility, handle_, state_size));
   }
+  tree->set_global_variable(input_global_variable);
+  if (!tree->CreateRoot(node_name, player)) {
+    map_handle_to_tree_variable_data_.erase(handle_);
+    return std::make_tuple(handle_, nullptr);
+  }
   map_handle_to_tree_ptr_.insert(std::make_pair(handle_, tree));
   map_handle_to_tree_variable_.insert(std::make_pair(handle_, input_global_variable));
   return std::make_tuple(handle_, tree);
 }
 
-void MonteCarloTreeFactory::RegisterNode(const std::string& node_name, NodeCreator&& node_creator) {
+void MonteCarloTreeFactory::RegisterNode(const std::string& node_name, size_t node_size, NodeCreator&& node_creator) {
   map_node_name_to_node_creator_.insert(std::make_pair(node_name, node_creator));
+  map_node_name_to_node_size_.insert(std::make_pair(node_name, node_size));
 }
 
 void MonteCarloTreeFactory::RegisterTree(const std::string& tree_name, TreeCreator&& tree_creator) {
   map_tree_name_to_tree_creator_.insert(std::make_pair(tree_name, tree_creator));
 }
 
+MonteCarloTreeGamePtr MonteCarloTreeFactory::CreateGame(const std::string& game_name) {
+  auto game_creator = map_game_name_to_game_creator_.find(game_name);
+  if (game_creator == map_game_name_to_game_creator_.end()) {
+    std::ostringstream oss;
+    oss << "[Error]The input game name " << game_name << " in CreateGame does not exist.\n";
+    oss << "Game register: [";
+    for (auto iter = map_game_name_to_game_creator_.begin(); iter != map_game_name_to_game_creator_.end(); iter++) {
+      oss << iter->first << " ";
+    }
+    oss << "]";
+    std::cout << oss.str() << std::endl;
+    // Return nullptr to catch the exception outside.
+    return nullptr;
+  }
+  return std::shared_ptr<MonteCarloTreeGame>(game_creator->second());
+}
+
+void MonteCarloTreeFactory::RegisterGame(const std::string& game_name, GameCreator&& game_creator) {
+  map_game_name_to_game_creator_.insert(std::make_pair(game_name, game_creator));
+}
+
 MonteCarloTreePtr MonteCarloTreeFactory::GetTreeByHandle(int64_t handle) {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
   auto iter = map_handle_to_tree_ptr_.find(handle);
   if (iter == map_handle_to_tree_ptr_.end()) {
     std::ostringstream oss;
@@ -100,6 +146,7 @@ MonteCarloTreePtr MonteCarloTreeFactory::GetTreeByHandle(int64_t handle) {
 }
 
 std::vector<void*> MonteCarloTreeFactory::GetTreeVariableByHandle(int64_t handle) {
+  std::shared_lock<std::shared_mutex> lock(mutex_);
   auto iter = map_handle_to_tree_variable_.find(handle);
   if (iter == map_handle_to_tree_variable_.end()) {
     std::ostringstream oss;
@@ -118,6 +165,7 @@ std::vector<void*> MonteCarloTreeFactory::GetTreeVariableByHandle(int64_t handle
 }
 
 void MonteCarloTreeFactory::DeleteTree(int64_t handle) {
+  std::unique_lock<std::shared_mutex> lock(mutex_);
   auto iter = map_handle_to_tree_ptr_.find(handle);
   if (iter == map_handle_to_tree_ptr_.end()) {
     std::ostringstream oss;
@@ -133,6 +181,7 @@ void MonteCarloTreeFactory::DeleteTree(int64_t handle) {
 }
 
 void MonteCarloTreeFactory::DeleteTreeVariable(int64_t handle) {
+  std::unique_lock<std::shared_mutex> lock(mutex_);
   auto iter = map_handle_to_tree_variable_.find(handle);
   if (iter == map_handle_to_tree_variable_.end()) {
     std::ostringstream oss;
@@ -144,5 +193,6 @@ void MonteCarloTreeFactory::DeleteTreeVariable(int64_t handle) {
     oss << "]";
   } else {
     map_handle_to_tree_variable_.erase(handle);
+    map_handle_to_tree_variable_data_.erase(handle);
   }
 }
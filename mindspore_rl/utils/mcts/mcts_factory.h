@@ -17,39 +17,52 @@
 #ifndef MINDSPORE_RL_UTILS_MCTS_MCTS_FACTORY_H_
 #define MINDSPORE_RL_UTILS_MCTS_MCTS_FACTORY_H_
 
+#include <utils/mcts/mcts_game.h>
 #include <utils/mcts/mcts_tree.h>
 #include <utils/mcts/mcts_tree_node.h>
 #include <functional>
 #include <map>
 #include <memory>
+#include <shared_mutex>
 #include <string>
 #include <tuple>
 #include <utility>
 #include <vector>
 
 constexpr int64_t kInvalidHandle = -1;
-using NodeCreator =
-    std::function<MonteCarloTreeNode*(std::string, int, float, float*, int, int64_t, MonteCarloTreeNodePtr, int, int)>;
+// The node creator constructs the node in the input memory, which is allocated in the arena of the tree.
+using NodeCreator = std::function<MonteCarloTreeNode*(void*, std::string, int, float, float*, int, int64_t,
+                                                      MonteCarloTreeNodePtr, int, int)>;
 using TreeCreator = std::function<MonteCarloTree*(MonteCarloTreeNodePtr, float, int64_t, int)>;
+using GameCreator = std::function<MonteCarloTreeGame*()>;
 
 class MonteCarloTreeFactory {
  public:
   // Create a factory instance of MonteCarloTree.
   static MonteCarloTreeFactory& GetInstance();
-  // Create a subclass of MonteCarloTreeNode based on input node_name.
-  // It will return the pointer of this instance.
-  MonteCarloTreeNodePtr CreateNode(const std::string& node_name, int action, float prior, float* init_reward,
-                                   int player, int64_t tree_handle, MonteCarloTreeNodePtr parent_node, int row,
-                                   int state_size);
+  // Create a subclass of MonteCarloTreeNode based on input node_name in the input memory, whose size is at least
+  // NodeSize(node_name). It will return the pointer of this instance.
+  MonteCarloTreeNodePtr CreateNode(const std::string& node_name, void* address, int action, float prior,
+                                   float* init_reward, int player, int64_t tree_handle,
+                                   MonteCarloTreeNodePtr parent_node, int row, int state_size);
+  // The size of the subclass of MonteCarloTreeNode of node_name, or 0 if it is not registered.
+  size_t NodeSize(const std::string& node_name);
   // Create a MonteCarloTree based on input tree_name.
-  // It will return the unique handle of this tree and its pointer.
+  // It will return the unique handle of this tree and its pointer. If the byte sizes of the global variables are
+  // given, the tree keeps a copy of them, so that it can outlive the inputs, such as across the calls of the graph.
   std::tuple<int64_t, MonteCarloTreePtr> CreateTree(const std::string& tree_name, const std::string& node_name,
                                                     int player, float max_utility, int state_size,
-                                                    std::vector<void*> input_global_variable);
+                                                    std::vector<void*> input_global_variable,
+                                                    const std::vector<size_t>& variable_size = {});
   // Insert the node_creator to a map (key: node_name, value: node_creator).
-  void RegisterNode(const std::string& node_name, NodeCreator&& node_creator);
+  void RegisterNode(const std::string& node_name, size_t node_size, NodeCreator&& node_creator);
   // Insert the tree_creator to a map (key: tree_name, value: tree_creator).
   void RegisterTree(const std::string& tree_name, TreeCreator&& tree_creator);
+  // Create a subclass of MonteCarloTreeGame based on input game_name.
+  // It will return the pointer of this instance.
+  MonteCarloTreeGamePtr CreateGame(const std::string& game_name);
+  // Insert the game_creator to a map (key: game_name, value: game_creator).
+  void RegisterGame(const std::string& game_name, GameCreator&& game_creator);
   // Get the tree instance by the unique handle.
   MonteCarloTreePtr GetTreeByHandle(int64_t handle);
   // Get the global variable by the unique handle.
@@ -65,16 +78,21 @@ class MonteCarloTreeFactory {
   ~MonteCarloTreeFactory() = default;
 
   std::map<std::string, NodeCreator> map_node_name_to_node_creator_;
+  std::map<std::string, size_t> map_node_name_to_node_size_;
   std::map<std::string, TreeCreator> map_tree_name_to_tree_creator_;
+  std::map<std::string, GameCreator> map_game_name_to_game_creator_;
   std::map<int64_t, MonteCarloTreePtr> map_handle_to_tree_ptr_;
   std::map<int64_t, std::vector<void*>> map_handle_to_tree_variable_;
+  std::map<int64_t, std::vector<std::vector<char>>> map_handle_to_tree_variable_data_;
   int64_t handle_ = kInvalidHandle;
+  // The trees may be created, used and destroyed by several threads.
+  std::shared_mutex mutex_;
 };
 
 class MonteCarloTreeNodeRegister {
  public:
-  MonteCarloTreeNodeRegister(const std::string& node_name, NodeCreator&& node_creator) {
-    MonteCarloTreeFactory::GetInstance().RegisterNode(node_name, std::move(node_creator));
+  MonteCarloTreeNodeRegister(const std::string& node_name, size_t node_size, NodeCreator&& node_creator) {
+    MonteCarloTreeFactory::GetInstance().RegisterNode(node_name, node_size, std::move(node_creator));
   }
 };
 
@@ -85,15 +103,24 @@ class MonteCarloTreeRegister {
   }
 };
 
+class MonteCarloTreeGameRegister {
+ public:
+  MonteCarloTreeGameRegister(const std::string& game_name, GameCreator&& game_creator) {
+    MonteCarloTreeFactory::GetInstance().RegisterGame(game_name, std::move(game_creator));
+  }
+};
+
 // Helper registration macro for NODECLASS
 // When user inherits the base class of MonteCarloTreeNode, user can register the class by NAME.
 // Then user can pass the NAME in python side to create derived class in C++ side.
-#define MS_REG_NODE(NAME, NODECLASS)                                                                           \
-  static_assert(std::is_base_of<MonteCarloTreeNode, NODECLASS>::value, " must be base of MonteCarloTreeNode"); \
-  static const MonteCarloTreeNodeRegister montecarlo_##NAME##_node_reg(                                        \
-      #NAME, [](std::string name, int action, float prior, float* reward, int player, int64_t tree_handle,     \
-                MonteCarloTreeNodePtr parent_node, int row, int state_size) {                                  \
-        return new NODECLASS(name, action, prior, reward, player, tree_handle, parent_node, row, state_size);  \
+#define MS_REG_NODE(NAME, NODECLASS)                                                                                \
+  static_assert(std::is_base_of<MonteCarloTreeNode, NODECLASS>::value, " must be base of MonteCarloTreeNode");      \
+  static const MonteCarloTreeNodeRegister montecarlo_##NAME##_node_reg(                                             \
+      #NAME, sizeof(NODECLASS),                                                                                     \
+      [](void* address, std::string name, int action, float prior, float* reward, int player, int64_t tree_handle, \
+         MonteCarloTreeNodePtr parent_node, int row, int state_size) {                                              \
+        return new (address) NODECLASS(name, action, prior, reward, player, tree_handle, parent_node, row,          \
+                                       state_size);                                                                 \
       });
 
 // Helper registration macro for TREECLASS
@@ -106,4 +133,11 @@ class MonteCarloTreeRegister {
         return new TREECLASS(root, max_utility, tree_handle, state_size);                              \
       });
 
+// Helper registration macro for GAMECLASS
+// When user inherits the base class of MonteCarloTreeGame, user can register the class by NAME.
+// Then user can pass the NAME in python side to search the tree in C++ side with this game.
+#define MS_REG_GAME(NAME, GAMECLASS)                                                                           \
+  static_assert(std::is_base_of<MonteCarloTreeGame, GAMECLASS>::value, " must be base of MonteCarloTreeGame"); \
+  static const MonteCarloTreeGameRegister montecarlo_##NAME##_game_reg(#NAME, []() { return new GAMECLASS(); });
+
 #endif  // MINDSPORE_RL_UTILS_MCTS_MCTS_FACTORY_H_
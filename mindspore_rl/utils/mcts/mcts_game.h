@@ -0,0 +1,47 @@
+/**
+ * Copyright 2022 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#ifndef MINDSPORE_RL_UTILS_MCTS_MCTS_GAME_H_
+#define MINDSPORE_RL_UTILS_MCTS_MCTS_GAME_H_
+
+#include <memory>
+
+class MonteCarloTreeGame {
+ public:
+  // The base class of the games which are simulated in C++, so that the whole search runs in the tree without
+  // returning to python, and it can be run by several threads. The state is the flattened float state which is
+  // saved in the nodes, the same as the one of the environment in python side.
+  MonteCarloTreeGame() = default;
+  virtual ~MonteCarloTreeGame() = default;
+
+  // Write the rewards of all the players of the state, and return whether the state is terminal.
+  virtual bool Evaluate(const float *state, float *reward) const = 0;
+
+  // Write the state after the player to move performs the action in the input state.
+  virtual void Step(const float *state, int action, float *new_state) const = 0;
+
+  // Write the legal actions of the state, which are padded by -1 to num_action(), and return the player to move.
+  virtual int LegalAction(const float *state, int *legal_action) const = 0;
+
+  // The max number of legal actions of a state.
+  virtual int num_action() const = 0;
+
+  // The number of players, which is the length of the rewards.
+  virtual int num_player() const = 0;
+};
+using MonteCarloTreeGamePtr = std::shared_ptr<MonteCarloTreeGame>;
+
+#endif  // MINDSPORE_RL_UTILS_MCTS_MCTS_GAME_H_
@@ -17,14 +17,62 @@
 #include <utils/mcts/mcts_factory.h>
 #include <utils/mcts/mcts_tree.h>
 #include <utils/mcts/mcts_tree_node.h>
+#include <algorithm>
 #include <cstdint>
 #include <iostream>
+#include <string>
 
 constexpr int kErrorCode = 2;
 constexpr int kInputIndex = 3;
 
 std::map<int, std::string> map_node_enum_to_string = {{0, "Vanilla"}};
 std::map<int, std::string> map_tree_enum_to_string = {{0, "Common"}};
+std::map<int, std::string> map_game_enum_to_string = {{0, "TicTacToe"}};
+
+namespace {
+// The number of bytes of an input, whose dtype is such as "float32" or "bool".
+size_t InputSize(int ndim, const int64_t *shape, const std::string &dtype) {
+  size_t size = 1;
+  for (int i = 0; i < ndim; i++) {
+    size *= shape[i];
+  }
+  auto bits = dtype.find_first_of("0123456789");
+  return bits == std::string::npos ? size : size * std::stoi(dtype.substr(bits)) / 8;
+}
+
+// Find the registered names of the enumerates of tree and node, which are printed if they do not exist.
+bool FindTreeAndNodeName(int64_t tree_enum, int64_t node_enum, const std::string &op_name, std::string *tree_name,
+                         std::string *node_name) {
+  auto node_name_iter = map_node_enum_to_string.find(node_enum);
+  if (node_name_iter == map_node_enum_to_string.end()) {
+    std::ostringstream oss;
+    oss << "[Error]The input enum of node " << node_enum << " in " << op_name << " does not exist.\n";
+    oss << "Node register: [";
+    for (auto iter = map_node_enum_to_string.begin(); iter != map_node_enum_to_string.end(); iter++) {
+      oss << iter->first << " ";
+    }
+    oss << "]";
+    std::cout << oss.str() << std::endl;
+    return false;
+  }
+  *node_name = node_name_iter->second;
+
+  auto tree_name_iter = map_tree_enum_to_string.find(tree_enum);
+  if (tree_name_iter == map_tree_enum_to_string.end()) {
+    std::ostringstream oss;
+    oss << "[Error]The input enum of tree " << tree_enum << " in " << op_name << " does not exist.\n";
+    oss << "Tree register: [";
+    for (auto iter = map_tree_enum_to_string.begin(); iter != map_tree_enum_to_string.end(); iter++) {
+      oss << iter->first << " ";
+    }
+    oss << "]";
+    std::cout << oss.str() << std::endl;
+    return false;
+  }
+  *tree_name = tree_name_iter->second;
+  return true;
+}
+}  // namespace
 
 extern "C" int MctsCreation(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes, void *stream,
                             void *extra) {
@@ -43,46 +91,27 @@ extern "C" int MctsCreation(int nparam, void **params, int *ndims, int64_t **sha
   // The input of MctsCreation which starts from 4th will be treated as the global variable of the monte carlo tree. It
   // is shared by all the node in this monte carlo tree. These variable will be saved in a std::vector with void* type.
   // User can call MonteCarloTreeFactory::GetInstance().GetTreeVariableByHandle(tree_handle_) to obtain the variable
-  // vector and select the corresponding variable by index.
+  // vector and select the corresponding variable by index. The tree keeps a copy of them, so that the tree can be
+  // used after this op, such as by the searches of the following moves.
   std::vector<void *> input_global_variable;
+  std::vector<size_t> variable_size;
   for (int i = 5; i < nparam - 1; i++) {
     input_global_variable.push_back(params[i]);
+    variable_size.push_back(InputSize(ndims[i], shapes[i], dtypes[i]));
   }
   // Output value
   // The output value of MctsCreation is the unique handle of this new monte carlo tree.
   int64_t *output = static_cast<int64_t *>(params[nparam - 1]);
 
-  auto node_name_iter = map_node_enum_to_string.find(*node_enum);
-  if (node_name_iter == map_node_enum_to_string.end()) {
-    std::ostringstream oss;
-    oss << "[Error]The input enum of node " << *node_enum << " in MctsCreation does not exist.\n";
-    oss << "Node register: [";
-    for (auto iter = map_node_enum_to_string.begin(); iter != map_node_enum_to_string.end(); iter++) {
-      oss << iter->first << " ";
-    }
-    oss << "]";
-    std::cout << oss.str() << std::endl;
-    return kErrorCode;
-  }
-  auto node_name = node_name_iter->second;
-
-  auto tree_name_iter = map_tree_enum_to_string.find(*tree_enum);
-  if (tree_name_iter == map_tree_enum_to_string.end()) {
-    std::ostringstream oss;
-    oss << "[Error]The input enum of tree " << *tree_enum << " in MctsCreation does not exist.\n";
-    oss << "Tree register: [";
-    for (auto iter = map_tree_enum_to_string.begin(); iter != map_tree_enum_to_string.end(); iter++) {
-      oss << iter->first << " ";
-    }
-    oss << "]";
-    std::cout << oss.str() << std::endl;
+  std::string tree_name;
+  std::string node_name;
+  if (!FindTreeAndNodeName(*tree_enum, *node_enum, "MctsCreation", &tree_name, &node_name)) {
     return kErrorCode;
   }
-  auto tree_name = tree_name_iter->second;
   int64_t tree_handle;
   MonteCarloTreePtr tree;
   std::tie(tree_handle, tree) = MonteCarloTreeFactory::GetInstance().CreateTree(
-      tree_name, node_name, *player, *max_utility, *state_size, input_global_variable);
+      tree_name, node_name, *player, *max_utility, *state_size, input_global_variable, variable_size);
   if (tree == nullptr) {
     return kErrorCode;
   }
@@ -90,6 +119,59 @@ extern "C" int MctsCreation(int nparam, void **params, int *ndims, int64_t **sha
   return 0;
 }
 
+extern "C" int MctsBatchCreation(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes,
+                                 void *stream, void *extra) {
+  // Input value
+  // MctsBatchCreation creates B trees, one for each game of a batched environment. It has 6 compulsory input values:
+  // 1. The tree enumerate
+  // 2. The node enumerate
+  // 3. Which player does each root belong to, in shape (B,)
+  // 4. The max utility of this game
+  // 5. Number of element of state
+  // 6. The states of the roots, in shape (B, ...)
+  int64_t *tree_enum = static_cast<int64_t *>(params[0]);
+  int64_t *node_enum = static_cast<int64_t *>(params[1]);
+  int *player = static_cast<int *>(params[2]);
+  float *max_utility = static_cast<float *>(params[3]);
+  int *state_size = static_cast<int *>(params[4]);
+  float *root_state = static_cast<float *>(params[5]);
+  // The inputs which start from 6th are the global variables of the trees, the same as MctsCreation. Each tree keeps
+  // a copy of them.
+  std::vector<void *> input_global_variable;
+  std::vector<size_t> variable_size;
+  for (int i = 6; i < nparam - 1; i++) {
+    input_global_variable.push_back(params[i]);
+    variable_size.push_back(InputSize(ndims[i], shapes[i], dtypes[i]));
+  }
+  // Output value
+  // The unique handles of the new trees, in shape (B,).
+  int64_t *output = static_cast<int64_t *>(params[nparam - 1]);
+
+  std::string tree_name;
+  std::string node_name;
+  if (!FindTreeAndNodeName(*tree_enum, *node_enum, "MctsBatchCreation", &tree_name, &node_name)) {
+    return kErrorCode;
+  }
+  int batch_size = shapes[2][0];
+  for (int i = 0; i < batch_size; i++) {
+    int64_t tree_handle;
+    MonteCarloTreePtr tree;
+    std::tie(tree_handle, tree) = MonteCarloTreeFactory::GetInstance().CreateTree(
+        tree_name, node_name, player[i], *max_utility, *state_size, input_global_variable, variable_size);
+    if (tree == nullptr) {
+      // Destroy the trees which are created, since their handles are not returned.
+      for (int j = 0; j < i; j++) {
+        MonteCarloTreeFactory::GetInstance().DeleteTree(output[j]);
+        MonteCarloTreeFactory::GetInstance().DeleteTreeVariable(output[j]);
+      }
+      return kErrorCode;
+    }
+    tree->root()->set_state(root_state + i * (*state_size), *state_size);
+    output[i] = tree_handle;
+  }
+  return 0;
+}
+
 extern "C" int MctsSelection(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes, void *stream,
                              void *extra) {
   // Input value
@@ -100,9 +182,8 @@ extern "C" int MctsSelection(int nparam, void **params, int *ndims, int64_t **sh
   int *max_action = static_cast<int *>(params[1]);
   // Output value
   // It has two output value:
-  // 1. The handle of visited path, but its a dummy handle. There is no map to represent the mapping between handle
-  //    and visited path. The visited path is saved in tree. This dummy handle is more like an dummy object that
-  //    user can operate in python side.
+  // 1. The handle of visited path. The visited path is saved in tree until it is backpropagated, so several
+  //    selections can be in flight at the same time. The other ops use this handle to access the visited path.
   // 2. If the max_action is given, it will return a Tensor which is combined by actions of each node in visited path.
   //    Moreover, the Tensor will be filled with -1, if its length does not reach the max_action value.
   //    If the max_action is NOT given, it will only return the last action in visited path.
@@ -120,12 +201,13 @@ extern "C" int MctsSelection(int nparam, void **params, int *ndims, int64_t **sh
     size_of_action = 1;
   }
   std::vector<int> action_list(size_of_action, -1);
-  auto ret = tree->Selection(&action_list, *max_action);
+  int64_t path_handle;
+  auto ret = tree->Selection(&action_list, *max_action, &path_handle);
   if (!ret) {
     return kErrorCode;
   }
-  visited_path_handle[0] = tree->placeholder_handle();
-  out_path_length[0] = tree->visited_path().size();
+  visited_path_handle[0] = path_handle;
+  out_path_length[0] = tree->visited_path(path_handle).size();
   for (int i = 0; i < size_of_action; i++) {
     out_action[i] = action_list[i];
   }
@@ -138,12 +220,13 @@ extern "C" int MctsExpansion(int nparam, void **params, int *ndims, int64_t **sh
   // MctsExpansion has 6 input values:
   // 1. tree_handle is the unique tree handle.
   // 2. The node enumerate
-  // 3. A dummy handle, it is not used.
+  // 3. The handle of the visited path whose last node is expanded.
   // 4. action is a Tensor that is used to create the node
   // 5. prior is a Tensor that states for probability, which has the same length as action.
   // 6. Which player does these nodes belong to
   int64_t *tree_handle = static_cast<int64_t *>(params[0]);
   int64_t *node_enum = static_cast<int64_t *>(params[1]);
+  int64_t *path_handle = static_cast<int64_t *>(params[2]);
   int *action = static_cast<int *>(params[3]);
   float *init_reward = static_cast<float *>(params[4]);
   float *prior = static_cast<float *>(params[5]);
@@ -169,8 +252,8 @@ extern "C" int MctsExpansion(int nparam, void **params, int *ndims, int64_t **sh
   if (tree == nullptr) {
     return kErrorCode;
   }
-  output[0] =
-      tree->Expansion(node_name, action, prior, init_reward, shapes[kInputIndex][0], *player, tree->state_size());
+  output[0] = tree->Expansion(*path_handle, node_name, action, prior, init_reward, shapes[kInputIndex][0], *player,
+                              tree->state_size());
   return 0;
 }
 
@@ -179,9 +262,10 @@ extern "C" int MctsBackpropagation(int nparam, void **params, int *ndims, int64_
   // Input value
   // MctsBackpropagation has 3 input values:
   // 1. tree_handle is the unique tree handle.
-  // 2. A dummy handle, it is not used.
+  // 2. The handle of the visited path to update.
   // 3. Returns that obtains from simulation is used to update all the nodes in visited path.
   int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  int64_t *path_handle = static_cast<int64_t *>(params[1]);
   float *returns = static_cast<float *>(params[2]);
   // Output value
   // Whether backpropagation executes successfully.
@@ -190,24 +274,27 @@ extern "C" int MctsBackpropagation(int nparam, void **params, int *ndims, int64_
   if (tree == nullptr) {
     return kErrorCode;
   }
-  output[0] = tree->Backpropagation(returns);
+  output[0] = tree->Backpropagation(*path_handle, returns);
   return 0;
 }
 
 extern "C" int BestAction(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes, void *stream,
                           void *extra) {
   // Input value
-  // Tree_handle is the unique tree handle.
+  // Tree_handle is the unique tree handle, or the handles of B trees in shape (B,).
   int64_t *tree_handle = static_cast<int64_t *>(params[0]);
   // Output value
-  // Return the best action.
+  // Return the best action of each tree, it is -1 if the root of the tree is not expanded.
   int *output = static_cast<int *>(params[1]);
 
-  auto tree = MonteCarloTreeFactory::GetInstance().GetTreeByHandle(*tree_handle);
-  if (tree == nullptr) {
-    return kErrorCode;
+  int num_tree = ndims[0] == 0 ? 1 : shapes[0][0];
+  for (int i = 0; i < num_tree; i++) {
+    auto tree = MonteCarloTreeFactory::GetInstance().GetTreeByHandle(tree_handle[i]);
+    if (tree == nullptr) {
+      return kErrorCode;
+    }
+    output[i] = tree->BestAction();
   }
-  output[0] = tree->BestAction();
   return 0;
 }
 
@@ -216,10 +303,11 @@ extern "C" int UpdateOutcome(int nparam, void **params, int *ndims, int64_t **sh
   // Input value
   // UpdateOutcome has 4 input values:
   // 1. tree_handle is the unique tree handle.
-  // 2. A dummy handle, it is not used.
+  // 2. The handle of the visited path.
   // 3. The outcome of terminal state.
   // 4. Which node in visited path does user need to update.
   int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  int64_t *path_handle = static_cast<int64_t *>(params[1]);
   int *index_ptr = static_cast<int *>(params[2]);
   float *outcome = static_cast<float *>(params[3]);
   // Output value
@@ -237,9 +325,9 @@ extern "C" int UpdateOutcome(int nparam, void **params, int *ndims, int64_t **sh
   }
   int index = *index_ptr;
   if (index < 0) {
-    index += tree->visited_path().size();
+    index += tree->visited_path(*path_handle).size();
   }
-  tree->UpdateOutcome(return_value, index);
+  tree->UpdateOutcome(*path_handle, return_value, index);
   output[0] = true;
   return 0;
 }
@@ -249,10 +337,11 @@ extern "C" int UpdateTerminal(int nparam, void **params, int *ndims, int64_t **s
   // Input value
   // UpdateTerminal has 4 input values:
   // 1. tree_handle is the unique tree handle.
-  // 2. A dummy handle, it is not used.
+  // 2. The handle of the visited path.
   // 3. The terminal state.
   // 4. Which node in visited path does user need to update.
   int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  int64_t *path_handle = static_cast<int64_t *>(params[1]);
   int *index_ptr = static_cast<int *>(params[2]);
   bool *terminal = static_cast<bool *>(params[3]);
   // Output value
@@ -265,9 +354,9 @@ extern "C" int UpdateTerminal(int nparam, void **params, int *ndims, int64_t **s
   }
   int index = *index_ptr;
   if (index < 0) {
-    index += tree->visited_path().size();
+    index += tree->visited_path(*path_handle).size();
   }
-  tree->UpdateTerminal(*terminal, index);
+  tree->UpdateTerminal(*path_handle, *terminal, index);
   output[0] = true;
   return 0;
 }
@@ -277,10 +366,11 @@ extern "C" int UpdateState(int nparam, void **params, int *ndims, int64_t **shap
   // Input value
   // UpdateState has 4 input values:
   // 1. tree_handle is the unique tree handle.
-  // 2. A dummy handle, it is not used.
+  // 2. The handle of the visited path.
   // 3. State of environment
   // 4. Which node in visited path does user need to update.
   int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  int64_t *path_handle = static_cast<int64_t *>(params[1]);
   int *index_ptr = static_cast<int *>(params[2]);
   float *state = static_cast<float *>(params[3]);
   // Output value
@@ -293,9 +383,9 @@ extern "C" int UpdateState(int nparam, void **params, int *ndims, int64_t **shap
   }
   int index = *index_ptr;
   if (index < 0) {
-    index += tree->visited_path().size();
+    index += tree->visited_path(*path_handle).size();
   }
-  tree->UpdateState(state, index);
+  tree->UpdateState(*path_handle, state, index);
   output[0] = true;
   return 0;
 }
@@ -326,9 +416,10 @@ extern "C" int GetState(int nparam, void **params, int *ndims, int64_t **shapes,
   // Input value
   // GetState has 3 input values:
   // 1. tree_handle is the unique tree handle.
-  // 2. A dummy handle, it is not used.
+  // 2. The handle of the visited path.
   // 4. Which node in visited path does user need to get.
   int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  int64_t *path_handle = static_cast<int64_t *>(params[1]);
   int *index_ptr = static_cast<int *>(params[2]);
   // Output value
   // The state of the node that user specifies
@@ -340,29 +431,212 @@ extern "C" int GetState(int nparam, void **params, int *ndims, int64_t **shapes,
   }
   int index = *index_ptr;
   if (index < 0) {
-    index += tree->visited_path().size();
+    index += tree->visited_path(*path_handle).size();
   }
-  auto output_state = tree->GetState(index);
+  auto output_state = tree->GetState(*path_handle, index);
   for (int i = 0; i < tree->state_size(); i++) {
     output[i] = output_state[i];
   }
   return 0;
 }
 
-extern "C" int DestroyTree(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes, void *stream,
-                           void *extra) {
+extern "C" int MctsParallelSearch(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes,
+                                  void *stream, void *extra) {
+  // Input value
+  // MctsParallelSearch has 5 input values:
+  // 1. tree_handle is the unique tree handle, whose root state is updated.
+  // 2. The node enumerate
+  // 3. The game enumerate, the game is simulated in C++.
+  // 4. The number of threads which search the tree concurrently.
+  // 5. The max iteration of the search.
+  int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  int64_t *node_enum = static_cast<int64_t *>(params[1]);
+  int64_t *game_enum = static_cast<int64_t *>(params[2]);
+  int *num_threads = static_cast<int *>(params[3]);
+  int *max_iteration = static_cast<int *>(params[4]);
+  // Output value
+  // Return the best action.
+  int *output = static_cast<int *>(params[5]);
+
+  auto node_name_iter = map_node_enum_to_string.find(*node_enum);
+  auto game_name_iter = map_game_enum_to_string.find(*game_enum);
+  if (node_name_iter == map_node_enum_to_string.end() || game_name_iter == map_game_enum_to_string.end()) {
+    std::cout << "[Error]The input enum of node " << *node_enum << " or game " << *game_enum
+              << " in MctsParallelSearch does not exist." << std::endl;
+    return kErrorCode;
+  }
+  auto tree = MonteCarloTreeFactory::GetInstance().GetTreeByHandle(*tree_handle);
+  auto game = MonteCarloTreeFactory::GetInstance().CreateGame(game_name_iter->second);
+  if (tree == nullptr || game == nullptr) {
+    return kErrorCode;
+  }
+  if (!tree->ParallelSearch(node_name_iter->second, *game, *num_threads, *max_iteration)) {
+    return kErrorCode;
+  }
+  output[0] = tree->BestAction();
+  return 0;
+}
+
+extern "C" int MctsBatchSelection(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes,
+                                  void *stream, void *extra) {
+  // Input value
+  // The handles of the trees to select, whose length is the batch size B. A tree handle can be repeated to select
+  // several leaves of the same tree, which are spread over the tree by the virtual loss.
+  int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  // Output value
+  // It has three output values:
+  // 1. The handles of the visited paths.
+  // 2. The last action of each visited path, it is -1 if the visited path only contains the root.
+  // 3. The state where the last action is performed, i.e. the state of the second last node of each visited path,
+  //    or the root state if the visited path only contains the root.
+  int64_t *visited_path_handle = static_cast<int64_t *>(params[1]);
+  int *out_action = static_cast<int *>(params[2]);
+  float *out_state = static_cast<float *>(params[3]);
+
+  int batch_size = shapes[0][0];
+  std::vector<int> action_list(1, -1);
+  for (int i = 0; i < batch_size; i++) {
+    auto tree = MonteCarloTreeFactory::GetInstance().GetTreeByHandle(tree_handle[i]);
+    if (tree == nullptr) {
+      return kErrorCode;
+    }
+    int64_t path_handle;
+    action_list[0] = -1;
+    if (!tree->Selection(&action_list, -1, &path_handle)) {
+      return kErrorCode;
+    }
+    auto &visited_path = tree->visited_path(path_handle);
+    auto state = visited_path[visited_path.size() > 1 ? visited_path.size() - 2 : 0]->state();
+    visited_path_handle[i] = path_handle;
+    out_action[i] = action_list[0];
+    std::copy(state, state + tree->state_size(), out_state + i * tree->state_size());
+  }
+  return 0;
+}
+
+extern "C" int MctsBatchUpdate(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes,
+                               void *stream, void *extra) {
+  // Input value
+  // MctsBatchUpdate finishes the iterations of the visited paths returned by MctsBatchSelection. It has 10 input
+  // values, whose first dimension is the batch size B:
+  // 1. The handles of the trees.
+  // 2. The node enumerate
+  // 3. The handles of the visited paths.
+  // 4. The states of the last nodes of the visited paths.
+  // 5. The rewards of the states.
+  // 6. Whether the states are terminal. The terminal nodes are updated by the outcome, and the others are expanded.
+  // 7. The legal actions of the states, which are used to create the nodes.
+  // 8. The priors of the legal actions.
+  // 9. The players who move in the states.
+  // 10. The returns which are used to backpropagate the visited paths.
+  int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  int64_t *node_enum = static_cast<int64_t *>(params[1]);
+  int64_t *path_handle = static_cast<int64_t *>(params[2]);
+  float *state = static_cast<float *>(params[3]);
+  float *reward = static_cast<float *>(params[4]);
+  bool *terminal = static_cast<bool *>(params[5]);
+  int *action = static_cast<int *>(params[6]);
+  float *prior = static_cast<float *>(params[7]);
+  int *player = static_cast<int *>(params[8]);
+  float *returns = static_cast<float *>(params[9]);
+  // Output value
+  // Whether the update executes successfully.
+  bool *output = static_cast<bool *>(params[10]);
+
+  auto node_name_iter = map_node_enum_to_string.find(*node_enum);
+  if (node_name_iter == map_node_enum_to_string.end()) {
+    std::cout << "[Error]The input enum of node " << *node_enum << " in MctsBatchUpdate does not exist." << std::endl;
+    return kErrorCode;
+  }
+  int batch_size = shapes[0][0];
+  int num_player = shapes[4][1];
+  int num_action = shapes[6][1];
+  for (int i = 0; i < batch_size; i++) {
+    auto tree = MonteCarloTreeFactory::GetInstance().GetTreeByHandle(tree_handle[i]);
+    if (tree == nullptr) {
+      return kErrorCode;
+    }
+    int index = tree->visited_path(path_handle[i]).size() - 1;
+    float *reward_i = reward + i * num_player;
+    tree->UpdateState(path_handle[i], state + i * tree->state_size(), index);
+    if (terminal[i]) {
+      tree->UpdateOutcome(path_handle[i], std::vector<float>(reward_i, reward_i + num_player), index);
+      tree->UpdateTerminal(path_handle[i], true, index);
+    } else if (!tree->Expansion(path_handle[i], node_name_iter->second, action + i * num_action,
+                                prior + i * num_action, reward_i, num_action, player[i], tree->state_size())) {
+      return kErrorCode;
+    }
+    if (!tree->Backpropagation(path_handle[i], returns + i * num_player)) {
+      return kErrorCode;
+    }
+  }
+  output[0] = true;
+  return 0;
+}
+
+extern "C" int MctsAdvanceRoot(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes,
+                               void *stream, void *extra) {
+  // Input value
+  // MctsAdvanceRoot has 4 input values:
+  // 1. tree_handle is the unique tree handle.
+  // 2. The node enumerate, which is used to create a new root if the child of the action does not exist.
+  // 3. The action which is played in the root state.
+  // 4. The player who moves in the new root state.
+  int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  int64_t *node_enum = static_cast<int64_t *>(params[1]);
+  int *action = static_cast<int *>(params[2]);
+  int *player = static_cast<int *>(params[3]);
+  // Output value
+  // Whether the root is advanced successfully.
+  bool *output = static_cast<bool *>(params[4]);
+
+  auto node_name_iter = map_node_enum_to_string.find(*node_enum);
+  if (node_name_iter == map_node_enum_to_string.end()) {
+    std::cout << "[Error]The input enum of node " << *node_enum << " in MctsAdvanceRoot does not exist." << std::endl;
+    return kErrorCode;
+  }
+  auto tree = MonteCarloTreeFactory::GetInstance().GetTreeByHandle(*tree_handle);
+  if (tree == nullptr) {
+    return kErrorCode;
+  }
+  output[0] = tree->AdvanceRoot(node_name_iter->second, *action, *player);
+  return 0;
+}
+
+extern "C" int MctsTreeMemory(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes,
+                              void *stream, void *extra) {
   // Input value
   // Tree_handle is the unique tree handle.
   int64_t *tree_handle = static_cast<int64_t *>(params[0]);
   // Output value
-  // Whether the destroy executes successfully.
-  bool *output = static_cast<bool *>(params[1]);
+  // The number of nodes of the tree, and the bytes of its arena.
+  int64_t *output = static_cast<int64_t *>(params[1]);
   auto tree = MonteCarloTreeFactory::GetInstance().GetTreeByHandle(*tree_handle);
   if (tree == nullptr) {
     return kErrorCode;
   }
-  MonteCarloTreeFactory::GetInstance().DeleteTree(*tree_handle);
-  MonteCarloTreeFactory::GetInstance().DeleteTreeVariable(*tree_handle);
+  output[0] = tree->num_nodes();
+  output[1] = tree->arena_bytes();
+  return 0;
+}
+
+extern "C" int DestroyTree(int nparam, void **params, int *ndims, int64_t **shapes, const char **dtypes, void *stream,
+                           void *extra) {
+  // Input value
+  // Tree_handle is the unique tree handle, or the handles of B trees in shape (B,).
+  int64_t *tree_handle = static_cast<int64_t *>(params[0]);
+  // Output value
+  // Whether the destroy executes successfully.
+  bool *output = static_cast<bool *>(params[1]);
+  int num_tree = ndims[0] == 0 ? 1 : shapes[0][0];
+  for (int i = 0; i < num_tree; i++) {
+    auto tree = MonteCarloTreeFactory::GetInstance().GetTreeByHandle(tree_handle[i]);
+    if (tree == nullptr) {
+      return kErrorCode;
+    }
+    MonteCarloTreeFactory::GetInstance().DeleteTree(tree_handle[i]);
+    MonteCarloTreeFactory::GetInstance().DeleteTreeVariable(tree_handle[i]);
+  }
 
   output[0] = true;
   return 0;
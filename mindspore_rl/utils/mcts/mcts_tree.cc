@@ -16,66 +16,166 @@
 
 #include "utils/mcts/mcts_tree.h"
 #include <algorithm>
+#include <atomic>
+#include <iostream>
+#include <thread>
 #include "utils/mcts/mcts_factory.h"
 #include "utils/mcts/mcts_tree_node.h"
 
-bool MonteCarloTree::Selection(std::vector<int>* action_list, int max_action) {
-  visited_path_.clear();
-  visited_path_.emplace_back(root_);
+MonteCarloTree::~MonteCarloTree() {
+  if (root_ != nullptr) {
+    ReleaseSubtree(root_);
+  }
+}
+
+bool MonteCarloTree::CreateRoot(const std::string& node_name, int player) {
+  std::unique_lock<std::shared_mutex> lock(tree_mutex_);
+  auto root = CreateNode(node_name, 0, 0.0, nullptr, player, nullptr, 0);
+  if (root == nullptr) {
+    return false;
+  }
+  if (root_ != nullptr) {
+    ReleaseSubtree(root_);
+  }
+  root_ = root;
+  return true;
+}
+
+MonteCarloTreeNodePtr MonteCarloTree::CreateNode(const std::string& node_name, int action, float prior,
+                                                 float* init_reward, int player, MonteCarloTreeNodePtr parent_node,
+                                                 int row) {
+  auto node_size = MonteCarloTreeFactory::GetInstance().NodeSize(node_name);
+  if (node_size == 0) {
+    std::cout << "[Error]The input node name " << node_name << " in CreateNode does not exist." << std::endl;
+    return nullptr;
+  }
+  auto address = arena_.AllocateNode(node_size);
+  if (address == nullptr) {
+    return nullptr;
+  }
+  auto node = MonteCarloTreeFactory::GetInstance().CreateNode(node_name, address, action, prior, init_reward, player,
+                                                              tree_handle_, parent_node, row, state_size_);
+  if (node == nullptr) {
+    arena_.FreeNode(address);
+    return nullptr;
+  }
+  node->set_state_buffer(arena_.AllocateState());
+  node->set_global_variable(&global_variable_);
+  num_nodes_++;
+  return node;
+}
+
+void MonteCarloTree::ReleaseSubtree(MonteCarloTreeNodePtr node, MonteCarloTreeNodePtr kept_node) {
+  std::vector<MonteCarloTreeNodePtr> nodes(1, node);
+  while (!nodes.empty()) {
+    auto current_node = nodes.back();
+    nodes.pop_back();
+    auto children = current_node->children();
+    for (auto child : children) {
+      if (child != kept_node) {
+        nodes.emplace_back(child);
+      }
+    }
+    if (!children.empty()) {
+      arena_.FreeChildren(children.begin(), children.size());
+    }
+    arena_.FreeState(current_node->state());
+    current_node->~MonteCarloTreeNode();
+    arena_.FreeNode(current_node);
+    num_nodes_--;
+  }
+}
+
+bool MonteCarloTree::Selection(std::vector<int>* action_list, int max_action, int64_t* path_handle) {
+  std::vector<MonteCarloTreeNodePtr> visited_path;
+  visited_path.emplace_back(root_);
   MonteCarloTreeNodePtr current_node = root_;
   // Create a max length action to avoid dynamic shape
   int i = 0;
   MonteCarloTreeNodePtr selected_child = nullptr;
-  while (!current_node->IsLeafNode()) {
-    selected_child = current_node->SelectChild();
-    if (selected_child == nullptr) {
-      return false;
+  {
+    std::shared_lock<std::shared_mutex> lock(tree_mutex_);
+    while (!current_node->IsLeafNode()) {
+      selected_child = current_node->SelectChild();
+      if (selected_child == nullptr) {
+        return false;
+      }
+      if (max_action != -1) {
+        (*action_list)[i] = selected_child->action();
+        i++;
+      }
+      visited_path.emplace_back(selected_child);
+      current_node = selected_child;
     }
-    if (max_action != -1) {
-      (*action_list)[i] = selected_child->action();
-      i++;
+    // The virtual loss is added after the path is selected, so a single search selects as if there is no virtual
+    // loss, while the concurrent selections see the pending path.
+    for (auto& node : visited_path) {
+      node->AddVirtualLoss(1);
     }
-    visited_path_.emplace_back(selected_child);
-    current_node = selected_child;
   }
   // If max_action is -1, which means that the Selection will only return the last action.
   if (max_action == -1 && selected_child != nullptr) {
     (*action_list)[0] = selected_child->action();
   }
+  std::lock_guard<std::mutex> lock(path_mutex_);
   placeholder_handle_++;
+  *path_handle = placeholder_handle_;
+  visited_paths_.emplace(placeholder_handle_, std::move(visited_path));
   return true;
 }
 
-bool MonteCarloTree::Expansion(std::string node_name, int* action, float* prior, float* init_reward, int num_action,
-                               int player, int state_size) {
+bool MonteCarloTree::Expansion(int64_t path_handle, std::string node_name, int* action, float* prior,
+                               float* init_reward, int num_action, int player, int state_size) {
   // Expand the last node of visited_path.
-  auto leaf_node = visited_path_.at(visited_path_.size() - 1);
+  auto leaf_node = visited_path(path_handle).back();
+  std::unique_lock<std::shared_mutex> lock(tree_mutex_);
+  int num_children = std::count_if(action, action + num_action, [](int action_i) { return action_i != -1; });
+  if (!leaf_node->IsLeafNode() || num_children == 0) {
+    return true;
+  }
+  // The children are created together, so they are contiguous in the arena unless the freed nodes are reused.
+  auto children = arena_.AllocateChildren(num_children);
+  int index = 0;
   for (int i = 0; i < num_action; i++) {
     auto action_i = action[i];
     if (action_i != -1) {
       auto prior_i = prior[i];
-      auto child_node = MonteCarloTreeFactory::GetInstance().CreateNode(
-          node_name, action_i, prior_i, init_reward, player, tree_handle_, leaf_node, leaf_node->row() + 1, state_size);
-      leaf_node->AddChild(child_node);
+      auto child_node =
+          CreateNode(node_name, action_i, prior_i, init_reward, player, leaf_node, leaf_node->row() + 1);
+      if (child_node == nullptr) {
+        for (int j = 0; j < index; j++) {
+          ReleaseSubtree(children[j]);
+        }
+        arena_.FreeChildren(children, num_children);
+        return false;
+      }
+      children[index++] = child_node;
     }
   }
+  leaf_node->set_children(children, num_children);
   return true;
 }
 
-bool MonteCarloTree::Backpropagation(float* returns) {
+bool MonteCarloTree::Backpropagation(int64_t path_handle, float* returns) {
   // Reverse the visited path, update from the bottom to the top.
-  std::reverse(visited_path_.begin(), visited_path_.end());
-  auto leaf_node = visited_path_[0];
+  auto visited_path = this->visited_path(path_handle);
+  std::reverse(visited_path.begin(), visited_path.end());
+  auto leaf_node = visited_path[0];
   bool solved = false;
   // If the leaf node is terminal, which means that this branch is solved.
   if (leaf_node->terminal()) {
     solved = true;
   }
-  // For each node in visited path, call the Update() to update the value.
+  // For each node in visited path, call the Update() to update the value and remove the virtual loss.
   // If current branch is solved, backprop the best outcome from the bottom to top.
-  for (auto& node : visited_path_) {
+  for (auto& node : visited_path) {
     node->Update(returns);
-    if (solved && !node->IsLeafNode()) {
+    node->AddVirtualLoss(-1);
+    if (!solved) {
+      continue;
+    }
+    std::unique_lock<std::shared_mutex> lock(tree_mutex_);
+    if (!node->IsLeafNode()) {
       MonteCarloTreeNodePtr best = nullptr;
       bool all_solved = true;
       for (const auto& child : node->children()) {
@@ -92,10 +192,131 @@ bool MonteCarloTree::Backpropagation(float* returns) {
       }
     }
   }
+  std::lock_guard<std::mutex> lock(path_mutex_);
+  visited_paths_.erase(path_handle);
   return true;
 }
 
+bool MonteCarloTree::ParallelSearch(const std::string& node_name, const MonteCarloTreeGame& game, int num_threads,
+                                    int max_iteration) {
+  std::atomic<int> iteration(0);
+  std::atomic<bool> success(true);
+  auto search = [&](int thread_id) {
+    std::mt19937 generator(tree_handle_ * num_threads + thread_id);
+    while (success && iteration.fetch_add(1) < max_iteration) {
+      if (!SearchOnce(node_name, game, &generator)) {
+        success = false;
+      }
+    }
+  };
+  std::vector<std::thread> threads;
+  for (int i = 1; i < num_threads; i++) {
+    threads.emplace_back(search, i);
+  }
+  search(0);
+  for (auto& thread : threads) {
+    thread.join();
+  }
+  return success;
+}
+
+bool MonteCarloTree::SearchOnce(const std::string& node_name, const MonteCarloTreeGame& game,
+                                std::mt19937* generator) {
+  // 1. Select a leaf, and play the action of the leaf in the state of its parent.
+  std::vector<int> last_action(1, -1);
+  int64_t path_handle;
+  if (!Selection(&last_action, -1, &path_handle)) {
+    return false;
+  }
+  auto& path = visited_path(path_handle);
+  std::vector<float> new_state(state_size_);
+  {
+    // The state of a leaf is written by UpdateState of the paths which select it, so it is read under the lock.
+    std::shared_lock<std::shared_mutex> lock(tree_mutex_);
+    if (path.size() > 1) {
+      game.Step(path[path.size() - 2]->state(), last_action[0], new_state.data());
+    } else {
+      std::copy(root_->state(), root_->state() + state_size_, new_state.begin());
+    }
+  }
+  std::vector<float> reward(game.num_player());
+  bool done = game.Evaluate(new_state.data(), reward.data());
+  UpdateState(path_handle, new_state.data(), path.size() - 1);
+
+  // 2. Expand the leaf by the legal actions with the uniform prior, or save the outcome of the terminal leaf.
+  std::vector<int> legal_action(game.num_action());
+  int player = game.LegalAction(new_state.data(), legal_action.data());
+  if (!done) {
+    int num_legal = std::count_if(legal_action.begin(), legal_action.end(), [](int action) { return action != -1; });
+    std::vector<float> prior(legal_action.size(), 1.0 / num_legal);
+    if (!Expansion(path_handle, node_name, legal_action.data(), prior.data(), reward.data(), legal_action.size(),
+                   player, state_size_)) {
+      return false;
+    }
+  } else {
+    UpdateOutcome(path_handle, reward, path.size() - 1);
+    UpdateTerminal(path_handle, true, path.size() - 1);
+  }
+
+  // 3. Play randomly to the end to obtain the returns.
+  std::vector<float> returns(reward);
+  std::vector<float> next_state(state_size_);
+  while (!done) {
+    game.LegalAction(new_state.data(), legal_action.data());
+    auto last = std::remove(legal_action.begin(), legal_action.end(), -1);
+    std::uniform_int_distribution<int> distribution(0, std::distance(legal_action.begin(), last) - 1);
+    game.Step(new_state.data(), legal_action[distribution(*generator)], next_state.data());
+    new_state.swap(next_state);
+    done = game.Evaluate(new_state.data(), returns.data());
+  }
+  return Backpropagation(path_handle, returns.data());
+}
+
 int MonteCarloTree::BestAction() {
+  std::shared_lock<std::shared_mutex> lock(tree_mutex_);
+  if (root_->IsLeafNode()) {
+    return -1;
+  }
   auto best_child_node = root_->BestAction();
   return best_child_node->action();
 }
+
+bool MonteCarloTree::AdvanceRoot(const std::string& node_name, int action, int player) {
+  std::unique_lock<std::shared_mutex> lock(tree_mutex_);
+  MonteCarloTreeNodePtr new_root = nullptr;
+  for (auto child : root_->children()) {
+    if (child->action() == action) {
+      new_root = child;
+    }
+  }
+  if (new_root == nullptr) {
+    new_root = CreateNode(node_name, action, 0.0, nullptr, player, nullptr, root_->row() + 1);
+    if (new_root == nullptr) {
+      return false;
+    }
+  }
+  ReleaseSubtree(root_, new_root);
+  new_root->set_parent(nullptr);
+  root_ = new_root;
+  return true;
+}
+
+void MonteCarloTree::UpdateState(int64_t path_handle, float* input_state, int index) {
+  auto node = visited_path(path_handle)[index];
+  std::unique_lock<std::shared_mutex> lock(tree_mutex_);
+  // The state of an expanded node is set already, and its children read it without the lock.
+  if (node->IsLeafNode()) {
+    node->set_state(input_state, state_size_);
+  }
+}
+
+void MonteCarloTree::UpdateOutcome(int64_t path_handle, std::vector<float> input_return, int index) {
+  auto node = visited_path(path_handle)[index];
+  std::unique_lock<std::shared_mutex> lock(tree_mutex_);
+  node->set_outcome(input_return);
+}
+
+std::vector<MonteCarloTreeNodePtr>& MonteCarloTree::visited_path(int64_t path_handle) {
+  std::lock_guard<std::mutex> lock(path_mutex_);
+  return visited_paths_.at(path_handle);
+}
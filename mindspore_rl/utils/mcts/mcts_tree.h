@@ -17,54 +17,100 @@
 #ifndef MINDSPORE_RL_UTILS_MCTS_MCTS_TREE_H_
 #define MINDSPORE_RL_UTILS_MCTS_MCTS_TREE_H_
 
+#include <map>
 #include <memory>
+#include <mutex>
+#include <random>
+#include <shared_mutex>
 #include <string>
 #include <tuple>
 #include <vector>
+#include "utils/mcts/mcts_arena.h"
+#include "utils/mcts/mcts_game.h"
 #include "utils/mcts/mcts_tree_node.h"
 
 class MonteCarloTree {
  public:
+  // The root can be nullptr, then it is created by CreateRoot. All the nodes are created in the arena of the tree,
+  // and they are released with the tree.
   MonteCarloTree(MonteCarloTreeNodePtr root, float max_utility, int64_t tree_handle, int state_size)
-      : root_(root), max_utility_(max_utility), tree_handle_(tree_handle), state_size_(state_size) {}
-  ~MonteCarloTree() = default;
+      : max_utility_(max_utility),
+        tree_handle_(tree_handle),
+        state_size_(state_size),
+        root_(root),
+        arena_(state_size) {}
+  virtual ~MonteCarloTree();
+
+  // Create the root of the player, which replaces the current root and its subtree.
+  bool CreateRoot(const std::string &node_name, int player);
 
   // The Selection phase of monte carlo tree search, it will continue selecting child node based on selection
-  // policy (like UCT) until leaf node.
-  bool Selection(std::vector<int> *action_list, int max_action);
+  // policy (like UCT) until leaf node. The visited path is saved with a new handle, so that several selections can
+  // be in flight at the same time, and a virtual loss is added to each node of the path until it is backpropagated.
+  bool Selection(std::vector<int> *action_list, int max_action, int64_t *path_handle);
 
   // The Expansion phase of monte carlo tree search, it will create the child node based on input action and prior
-  // for last node in visited path.
-  bool Expansion(std::string node_name, int *action, float *prior, float *init_reward, int num_action, int player,
-                 int state_size);
+  // for last node in visited path. A leaf which is already expanded by another path is not expanded again.
+  bool Expansion(int64_t path_handle, std::string node_name, int *action, float *prior, float *init_reward,
+                 int num_action, int player, int state_size);
 
   // The Backpropagation phase of monte carlo tree search, it will update the value in each visited node according to
-  // the input returns (obtained in simulation).
-  bool Backpropagation(float *returns);
+  // the input returns (obtained in simulation). The virtual loss and the visited path are removed.
+  bool Backpropagation(int64_t path_handle, float *returns);
+
+  // Search the tree from the root by num_threads threads until max_iteration iterations, which simulates the game
+  // in C++. The concurrent selections are spread over the tree by the virtual loss.
+  bool ParallelSearch(const std::string &node_name, const MonteCarloTreeGame &game, int num_threads,
+                      int max_iteration);
 
-  // Select the best action of root
+  // Select the best action of root, it is -1 if the root is not expanded, such as a terminal root.
   int BestAction();
 
-  void UpdateState(float *input_state, int index) { visited_path_[index]->set_state(input_state, state_size_); }
-  float *GetState(int index) { return visited_path_[index]->state(); }
+  // Advance the root to the child of the action, so that the next search starts from the statistics of its subtree.
+  // The siblings and their subtrees are freed. If the child does not exist, a new root of the player is created.
+  bool AdvanceRoot(const std::string &node_name, int action, int player);
+
+  void UpdateState(int64_t path_handle, float *input_state, int index);
+  float *GetState(int64_t path_handle, int index) { return visited_path(path_handle)[index]->state(); }
 
-  void UpdateOutcome(std::vector<float> input_return, int index) { visited_path_[index]->set_outcome(input_return); }
-  void UpdateTerminal(bool is_terminal, int index) { visited_path_[index]->set_terminal(is_terminal); }
+  void UpdateOutcome(int64_t path_handle, std::vector<float> input_return, int index);
+  void UpdateTerminal(int64_t path_handle, bool is_terminal, int index) {
+    visited_path(path_handle)[index]->set_terminal(is_terminal);
+  }
 
-  int64_t placeholder_handle() { return placeholder_handle_; }
-  std::vector<MonteCarloTreeNodePtr> visited_path() { return visited_path_; }
+  // The visited path of the handle returned by Selection. It is only valid until the path is backpropagated.
+  std::vector<MonteCarloTreeNodePtr> &visited_path(int64_t path_handle);
   int state_size() { return state_size_; }
   MonteCarloTreeNodePtr root() { return root_; }
+  // The global variables of the tree, which are set before the root is created and passed to all the nodes.
+  void set_global_variable(const std::vector<void *> &global_variable) { global_variable_ = global_variable; }
+  // The number of nodes and the bytes of the arena, which includes the freed memory to reuse.
+  int64_t num_nodes() { return num_nodes_; }
+  size_t arena_bytes() { return arena_.bytes(); }
 
  private:
   float max_utility_;  // The max utility of game, which is used in backpropagation.
 
+  // One iteration of ParallelSearch, in which the simulation plays randomly by the random number generator.
+  bool SearchOnce(const std::string &node_name, const MonteCarloTreeGame &game, std::mt19937 *generator);
+
+  // Create a node in the arena, and allocate its state.
+  MonteCarloTreeNodePtr CreateNode(const std::string &node_name, int action, float prior, float *init_reward,
+                                   int player, MonteCarloTreeNodePtr parent_node, int row);
+  // Destroy the node and its subtree except the kept node, and free their memory to the arena.
+  void ReleaseSubtree(MonteCarloTreeNodePtr node, MonteCarloTreeNodePtr kept_node = nullptr);
+
  protected:
-  int64_t tree_handle_;                              // The tree handle which is used to create the node.
-  int state_size_;                                   // Number of element of state
-  int64_t placeholder_handle_ = -1;                  // A dummy handle.
-  MonteCarloTreeNodePtr root_;                       // The ptr of root node.
-  std::vector<MonteCarloTreeNodePtr> visited_path_;  // The visited path which is obtained in Selection().
+  int64_t tree_handle_;              // The tree handle which is used to create the node.
+  int state_size_;                   // Number of element of state
+  int64_t placeholder_handle_ = -1;  // The handle of the last visited path.
+  MonteCarloTreeNodePtr root_;       // The ptr of root node.
+  MonteCarloTreeArena arena_;        // The memory of the nodes.
+  int64_t num_nodes_ = 0;            // The number of nodes in the arena.
+  std::shared_mutex tree_mutex_;     // Selections share it, while the children and outcomes are changed alone.
+  std::mutex path_mutex_;            // It guards the visited paths and their handle.
+  std::map<int64_t, std::vector<MonteCarloTreeNodePtr>> visited_paths_;  // The visited paths in flight.
+  std::vector<void *> global_variable_;  // The global variables of the tree, which the nodes point to.
 };
 using MonteCarloTreePtr = std::shared_ptr<MonteCarloTree>;
 
@@ -18,24 +18,26 @@
 #include <algorithm>
 
 MonteCarloTreeNodePtr MonteCarloTreeNode::SelectChild() {
-  std::vector<float> selection_value;
   // For each child, use selection policy to calculate corresponding value,
-  // then choose the largest one.
-  for (auto &child : children_) {
+  // then choose the first one of the largest value.
+  MonteCarloTreeNodePtr selected_child = nullptr;
+  float max_value = 0;
+  for (auto child : children()) {
     float uct_value;
-    bool ret = child->SelectionPolicy(&uct_value);
-    selection_value.emplace_back(uct_value);
-    if (!ret) {
+    if (!child->SelectionPolicy(&uct_value)) {
       return nullptr;
     }
+    if (selected_child == nullptr || uct_value > max_value) {
+      selected_child = child;
+      max_value = uct_value;
+    }
   }
-  int64_t max_position = std::distance(std::begin(selection_value),
-                                       std::max_element(std::begin(selection_value), std::end(selection_value)));
-  return children_[max_position];
+  return selected_child;
 }
 
 MonteCarloTreeNodePtr MonteCarloTreeNode::BestAction() const {
-  return *std::max_element(children_.begin(), children_.end(),
+  auto nodes = children();
+  return *std::max_element(nodes.begin(), nodes.end(),
                            [](const MonteCarloTreeNodePtr node_a, const MonteCarloTreeNodePtr node_b) {
                              return node_a->BestActionPolicy(node_b);
                            });
@@ -17,30 +17,49 @@
 #ifndef MINDSPORE_RL_UTILS_MCTS_MCTS_TREE_NODE_H_
 #define MINDSPORE_RL_UTILS_MCTS_MCTS_TREE_NODE_H_
 
+#include <atomic>
 #include <iostream>
-#include <memory>
 #include <sstream>
 #include <string>
 #include <vector>
 
+class MonteCarloTreeNode;
+using MonteCarloTreeNodePtr = MonteCarloTreeNode *;
+
+// The children of a node, which is a view of the array of the children in the arena of the tree.
+class MonteCarloTreeNodeChildren {
+ public:
+  MonteCarloTreeNodeChildren(MonteCarloTreeNodePtr *data, int size) : data_(data), size_(size) {}
+
+  MonteCarloTreeNodePtr *begin() const { return data_; }
+  MonteCarloTreeNodePtr *end() const { return data_ + size_; }
+  MonteCarloTreeNodePtr operator[](int index) const { return data_[index]; }
+  int size() const { return size_; }
+  bool empty() const { return size_ == 0; }
+
+ private:
+  MonteCarloTreeNodePtr *data_;
+  int size_;
+};
+
 class MonteCarloTreeNode {
  public:
-  // The base class of MonteCarloTreeNode.
-  MonteCarloTreeNode(std::string name, int action, float prior, float *init_reward, int player, int64_t tree_handle,
-                     std::shared_ptr<MonteCarloTreeNode> parent_node, int row, int state_size)
-      : name_(name),
+  // The base class of MonteCarloTreeNode. The nodes are created in the arena of their tree, which also holds their
+  // states and children, and they are destroyed with the tree.
+  MonteCarloTreeNode(const std::string &name, int action, float prior, float *init_reward, int player,
+                     int64_t tree_handle, MonteCarloTreeNodePtr parent_node, int row, int state_size)
+      : state_(nullptr),
+        terminal_(false),
         action_(action),
+        row_(row),
         prior_(prior),
         player_(player),
-        row_(row),
-        total_reward_(0),
         explore_count_(0),
-        terminal_(false),
+        total_reward_(0),
+        virtual_loss_(0),
         tree_handle_(tree_handle),
         parent_(parent_node) {
-    if (state_size > 0) {
-      state_ = reinterpret_cast<float *>(malloc(sizeof(float) * state_size));
-    } else {
+    if (state_size <= 0) {
       std::cout << "The state size is smaller than 0, please check" << std::endl;
     }
   }
@@ -48,7 +67,7 @@ class MonteCarloTreeNode {
   virtual ~MonteCarloTreeNode() = default;
 
   // It will select the child whose value of SelectionPolicy is the highest.
-  std::shared_ptr<MonteCarloTreeNode> SelectChild();
+  MonteCarloTreeNodePtr SelectChild();
 
   // The virtual function of SelectionPolicy. In this function, user needs to implement the rule to select
   // child node, such as UCT(UCB) function, RAVE, AMAF, etc.
@@ -59,19 +78,28 @@ class MonteCarloTreeNode {
   virtual bool Update(float *returns) = 0;
 
   // After the whole tree finished, use BestAction to obtain the best action for the root.
-  std::shared_ptr<MonteCarloTreeNode> BestAction() const;
+  MonteCarloTreeNodePtr BestAction() const;
 
   // The policy to choose BestAction
   // The default policy is that:
   // 1. First compare the outcome of two nodes
   // 2. If both of them does not have outcome (or same), then compare the explore_count_
   // 3. If they have the same explore_count_, then compare the total_reward_
-  virtual bool BestActionPolicy(std::shared_ptr<MonteCarloTreeNode> child_node) const;
+  virtual bool BestActionPolicy(MonteCarloTreeNodePtr child_node) const;
 
-  bool IsLeafNode() { return children_.empty(); }
-  void AddChild(std::shared_ptr<MonteCarloTreeNode> child) { children_.emplace_back(child); }
-  std::vector<std::shared_ptr<MonteCarloTreeNode>> children() { return children_; }
+  bool IsLeafNode() { return num_children_ == 0; }
+  // The children are allocated by the tree, which also frees them.
+  void set_children(MonteCarloTreeNodePtr *children, int num_children) {
+    children_ = children;
+    num_children_ = num_children;
+  }
+  MonteCarloTreeNodeChildren children() const { return MonteCarloTreeNodeChildren(children_, num_children_); }
+  void set_parent(MonteCarloTreeNodePtr parent_node) { parent_ = parent_node; }
+  // The global variables are kept by the tree, so the nodes read them without the lock of the factory.
+  void set_global_variable(const std::vector<void *> *global_variable) { global_variable_ = global_variable; }
 
+  // The state is allocated by the tree, which also frees it.
+  void set_state_buffer(float *state) { state_ = state; }
   void set_state(float *input_state, int state_size) {
     for (int i = 0; i < state_size; i++) {
       state_[i] = input_state[i];
@@ -82,8 +110,13 @@ class MonteCarloTreeNode {
   void set_terminal(bool done) { terminal_ = done; }
   bool terminal() { return terminal_; }
 
+  // The virtual loss is added to the nodes of a path when it is selected, and removed when it is backpropagated,
+  // so that the concurrent selections treat the pending paths as lost and spread over the tree.
+  void AddVirtualLoss(int num) { virtual_loss_ += num; }
+  int virtual_loss() { return virtual_loss_; }
+
   void set_outcome(std::vector<float> new_outcome) { outcome_ = new_outcome; }
-  std::vector<float> outcome() { return outcome_; }
+  const std::vector<float> &outcome() { return outcome_; }
 
   int action() { return action_; }
   int row() { return row_; }
@@ -93,29 +126,38 @@ class MonteCarloTreeNode {
 
   std::string DebugString() {
     std::ostringstream oss;
-    oss << tree_handle_ << "_" << name_ << "_row_" << row_ << "_player_" << player_;
+    oss << tree_handle_ << "_row_" << row_ << "_player_" << player_;
     oss << "_action_" << action_ << "_terminal_" << terminal_;
     return oss.str();
   }
 
  private:
-  std::string name_;     // The name of this node.
-  float *state_;         // The state current node states for.
-  bool terminal_;        // Whether current node is terminal node.
-  int action_;           // The action that transfers from parent node to current node.
-  int row_;              // Which row this node belongs to (for DEBUG).
+  float *state_;                // The state current node states for.
+  std::atomic<bool> terminal_;  // Whether current node is terminal node.
+  int action_;                  // The action that transfers from parent node to current node.
+  int row_;                     // Which row this node belongs to (for DEBUG).
 
  protected:
-  float prior_;          // P(a|s), the probability that choose this node in parent node.
-  int player_;           // This node belongs to which player.
-  int explore_count_;    // Number of times that current node is visited.
-  float total_reward_;   // The total reward of current node.
-  int64_t tree_handle_;  // Current node belongs to which tree.
-
-  std::vector<float> outcome_;                                 // The outcome of terminal node.
-  std::shared_ptr<MonteCarloTreeNode> parent_;                 // Parent node.
-  std::vector<std::shared_ptr<MonteCarloTreeNode>> children_;  // All child node.
+  float prior_;                      // P(a|s), the probability that choose this node in parent node.
+  int player_;                       // This node belongs to which player.
+  std::atomic<int> explore_count_;   // Number of times that current node is visited.
+  std::atomic<float> total_reward_;  // The total reward of current node.
+  std::atomic<int> virtual_loss_;    // Number of the selected paths through current node not backpropagated.
+  int num_children_ = 0;             // Number of child node.
+  int64_t tree_handle_;              // Current node belongs to which tree.
+
+  std::vector<float> outcome_;                   // The outcome of terminal node.
+  MonteCarloTreeNodePtr parent_;                 // Parent node.
+  MonteCarloTreeNodePtr *children_ = nullptr;    // All child node, which are contiguous in the arena of the tree.
+  // The global variables of the tree, such as the UCT const.
+  const std::vector<void *> *global_variable_ = nullptr;
+
+  // Add the reward to total_reward_, which may be updated by several threads.
+  void AddReward(float reward) {
+    float expected = total_reward_.load();
+    while (!total_reward_.compare_exchange_weak(expected, expected + reward)) {
+    }
+  }
 };
-using MonteCarloTreeNodePtr = std::shared_ptr<MonteCarloTreeNode>;
 
 #endif  // MINDSPORE_RL_UTILS_MCTS_MCTS_TREE_NODE_H_
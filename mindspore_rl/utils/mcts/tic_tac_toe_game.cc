@@ -0,0 +1,63 @@
+/**
+ * Copyright 2022 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include <utils/mcts/tic_tac_toe_game.h>
+
+namespace {
+// The cells of the rows, columns and diagonals of the flattened board.
+constexpr int kNumLine = 8;
+constexpr int kLines[kNumLine][3] = {{0, 1, 2}, {3, 4, 5}, {6, 7, 8}, {0, 3, 6},
+                                     {1, 4, 7}, {2, 5, 8}, {0, 4, 8}, {2, 4, 6}};
+constexpr float kLineOfThree = 3;
+}  // namespace
+
+bool TicTacToeGame::Evaluate(const float *state, float *reward) const {
+  reward[0] = 0;
+  reward[1] = 0;
+  for (int i = 0; i < kNumLine; i++) {
+    float line_sum = state[kLines[i][0]] + state[kLines[i][1]] + state[kLines[i][2]];
+    if (line_sum == kLineOfThree || line_sum == -kLineOfThree) {
+      reward[0] = line_sum > 0 ? 1 : -1;
+      reward[1] = -reward[0];
+      return true;
+    }
+  }
+  for (int i = 0; i < kNumCell; i++) {
+    if (state[i] == 0) {
+      return false;
+    }
+  }
+  return true;
+}
+
+void TicTacToeGame::Step(const float *state, int action, float *new_state) const {
+  float mark_sum = 0;
+  for (int i = 0; i < kNumCell; i++) {
+    new_state[i] = state[i];
+    mark_sum += state[i];
+  }
+  // Player one has made as many moves as player two if it is the turn of player one.
+  new_state[action] = (mark_sum == 0 ? 1 : -1);
+}
+
+int TicTacToeGame::LegalAction(const float *state, int *legal_action) const {
+  float mark_sum = 0;
+  for (int i = 0; i < kNumCell; i++) {
+    legal_action[i] = (state[i] == 0 ? i : -1);
+    mark_sum += state[i];
+  }
+  return mark_sum == 0 ? 0 : 1;
+}
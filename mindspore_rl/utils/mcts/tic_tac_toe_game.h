@@ -0,0 +1,39 @@
+/**
+ * Copyright 2022 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#ifndef MINDSPORE_RL_UTILS_MCTS_TIC_TAC_TOE_GAME_H_
+#define MINDSPORE_RL_UTILS_MCTS_TIC_TAC_TOE_GAME_H_
+
+#include <utils/mcts/mcts_factory.h>
+#include <utils/mcts/mcts_game.h>
+
+// The Tic-Tac-Toe of TicTacToeEnvironment. The state is the 3x3 board, where the marks of player one are 1 and
+// the ones of player two are -1, and player one moves first.
+class TicTacToeGame : public MonteCarloTreeGame {
+ public:
+  bool Evaluate(const float *state, float *reward) const override;
+  void Step(const float *state, int action, float *new_state) const override;
+  int LegalAction(const float *state, int *legal_action) const override;
+  int num_action() const override { return kNumCell; }
+  int num_player() const override { return kNumPlayer; }
+
+ private:
+  static constexpr int kNumCell = 9;
+  static constexpr int kNumPlayer = 2;
+};
+MS_REG_GAME(TicTacToe, TicTacToeGame);
+
+#endif  // MINDSPORE_RL_UTILS_MCTS_TIC_TAC_TOE_GAME_H_
@@ -24,24 +24,27 @@ bool VanillaTreeNode::SelectionPolicy(float* uct_value) const {
     *uct_value = outcome_[player_];
     return true;
   }
-  if (explore_count_ == 0) {
+  // Each pending path through this node is counted as a visit which loses one.
+  int virtual_loss = virtual_loss_;
+  int visit_count = explore_count_ + virtual_loss;
+  if (visit_count == 0) {
     *uct_value = std::numeric_limits<float>::infinity();
     return true;
   }
 
-  auto global_variable_vector = MonteCarloTreeFactory::GetInstance().GetTreeVariableByHandle(tree_handle_);
-  if (global_variable_vector.empty()) {
+  if (global_variable_ == nullptr || global_variable_->empty()) {
     std::cout << "[Error]Please input a constant value for UCT calculation" << std::endl;
     return false;
   }
-  auto uct_ptr = static_cast<float*>(global_variable_vector[0]);
-  *uct_value =
-      total_reward_ / explore_count_ + (*uct_ptr) * std::sqrt(std::log(parent_->explore_count()) / explore_count_);
+  auto uct_ptr = static_cast<float*>((*global_variable_)[0]);
+  int parent_visit_count = parent_->explore_count() + parent_->virtual_loss();
+  *uct_value = (total_reward_ - virtual_loss) / visit_count +
+               (*uct_ptr) * std::sqrt(std::log(parent_visit_count) / visit_count);
   return true;
 }
 
 bool VanillaTreeNode::Update(float* values) {
-  total_reward_ += values[player_];
+  AddReward(values[player_]);
   explore_count_ += 1;
   return true;
 }
@@ -0,0 +1,87 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for the vectorized classic control environments.
+'''
+
+import pytest
+import numpy as np
+from mindspore import Tensor
+from mindspore_rl.environment import GymEnvironment, MsEnvironment
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+@pytest.mark.parametrize('name, gym_name', [('CartPole', 'CartPole-v0'), ('Pendulum', 'Pendulum-v1'),
+                                            ('MountainCar', 'MountainCar-v0'), ('Acrobot', 'Acrobot-v1')])
+def test_classic_control_spaces(name, gym_name):
+    '''
+    Feature: Test the spaces of the vectorized classic control environments.
+    Description: Create the environment by the MindSpore registry and the Gym environment of the same game.
+    Expectation: the same spaces with the batch shape.
+    '''
+
+    num_envs = 16
+    env = MsEnvironment({'name': name, 'environment_num': num_envs})
+    gym_env = GymEnvironment({'name': gym_name})
+    for space, gym_space in [(env.observation_space, gym_env.observation_space),
+                             (env.action_space, gym_env.action_space),
+                             (env.reward_space, gym_env.reward_space),
+                             (env.done_space, gym_env.done_space)]:
+        assert space.shape == (num_envs,) + gym_space.shape
+        assert space.np_dtype == gym_space.np_dtype
+        assert np.allclose(space.boundary[0], gym_space.boundary[0])
+        assert np.allclose(space.boundary[1], gym_space.boundary[1])
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_cartpole():
+    '''
+    Feature: Test the vectorized CartPole environment.
+    Description: Push all the carts to one side for the whole episodes.
+    Expectation: the episodes finish before the time limit, and the finished environments are reset.
+    '''
+
+    num_envs = 1024
+    env = MsEnvironment({'name': 'CartPole', 'environment_num': num_envs, 'seed': 1})
+    state = env.reset().asnumpy()
+    assert state.shape == (num_envs, 4)
+    assert np.all(np.abs(state) <= 0.05)
+    action = Tensor(np.ones((num_envs,), np.int32))
+    finished = np.zeros((num_envs,), np.bool_)
+    for _ in range(100):
+        state, reward, done = env.step(action)
+        done = done.asnumpy().reshape(-1)
+        assert np.all(reward.asnumpy() == 1)
+        assert np.all(np.abs(state.asnumpy()[done]) <= 0.05)
+        finished |= done
+    assert np.all(finished)
+
+
+if __name__ == "__main__":
+    test_classic_control_spaces('CartPole', 'CartPole-v0')
+    test_classic_control_spaces('Pendulum', 'Pendulum-v1')
+    test_classic_control_spaces('MountainCar', 'MountainCar-v0')
+    test_classic_control_spaces('Acrobot', 'Acrobot-v1')
+    test_cartpole()
@@ -0,0 +1,71 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for CompressedReplayBuffer.
+'''
+
+import pytest
+import numpy as np
+import mindspore
+from mindspore import Tensor
+from mindspore_rl.core import CompressedReplayBuffer
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_compressed_replay_buffer():
+    '''
+    Feature: Test replay buffer with deduplicated observations.
+    Description: Insert stacked frames of several episodes more than the capacity, then get items.
+    Expectation: the states and new states are rebuilt as they are inserted.
+    '''
+
+    capacity = 7
+    batch_size = 4
+    shapes = [(4, 2), (1,), (1,), (4, 2)]
+    types = [mindspore.uint8, mindspore.int32, mindspore.float32, mindspore.uint8]
+    replay_buffer = CompressedReplayBuffer(batch_size, capacity, shapes, types, frame_stack=4,
+                                           compression='uint8', seed=1)
+
+    inserted = []
+    step = 0
+    for episode_length in [5, 3, 6]:
+        state = np.stack([np.full((2,), 100 + step, np.uint8)] * 4)
+        for _ in range(episode_length):
+            new_state = np.concatenate([state[1:], np.full((1, 2), step + 1, np.uint8)])
+            exp = [state, np.array([step], np.int32), np.array([step], np.float32), new_state]
+            replay_buffer.insert([Tensor(data) for data in exp])
+            inserted.append(exp)
+            state = new_state
+            step += 1
+    assert replay_buffer.full()
+
+    for index in range(capacity):
+        expected = inserted[len(inserted) - capacity + index]
+        for data, expected_data in zip(replay_buffer.get_item(Tensor(index, mindspore.int32)), expected):
+            assert np.array_equal(data.asnumpy(), expected_data)
+
+    states, actions, rewards, new_states = replay_buffer.sample()
+    assert states.shape == (batch_size, 4, 2)
+    assert np.allclose(actions.asnumpy(), rewards.asnumpy())
+    assert np.array_equal(states.asnumpy()[:, 1:], new_states.asnumpy()[:, :-1])
+
+
+if __name__ == "__main__":
+    test_compressed_replay_buffer()
@@ -0,0 +1,74 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for EpisodeReplayBuffer.
+'''
+
+import pytest
+import numpy as np
+import mindspore
+from mindspore import Tensor
+from mindspore_rl.core import EpisodeReplayBuffer
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_episode_replay_buffer():
+    '''
+    Feature: Test episode replay buffer.
+    Description: Insert episodes with different lengths, then sample windows with burn-in.
+    Expectation: the windows are contiguous steps of an episode and the padding is masked.
+    '''
+
+    capacity = 3
+    batch_size = 16
+    seq_len, burn_in = 4, 2
+    shapes = [(2,), (1,)]
+    types = [mindspore.float32, mindspore.int32]
+    replay_buffer = EpisodeReplayBuffer(batch_size, capacity, shapes, types, max_episode_length=10,
+                                        seq_len=seq_len, burn_in=burn_in, seed=1)
+
+    # The step number starts from 1 in each episode, so 0 stands for the padding.
+    for episode, length in enumerate([3, 10, 7, 5]):
+        for step in range(length):
+            replay_buffer.insert([Tensor(np.full((2,), episode), mindspore.float32),
+                                  Tensor([step + 1], mindspore.int32)])
+        assert replay_buffer.end_episode()
+    assert replay_buffer.full()
+    assert not replay_buffer.end_episode()
+
+    # The first episode is replaced, the oldest one has 10 steps.
+    _, steps, mask = replay_buffer.get_item(Tensor(0, mindspore.int32))
+    assert np.array_equal(steps.asnumpy()[:, 0], np.arange(1, 11))
+    assert mask.asnumpy().sum() == 10
+
+    states, steps, mask = replay_buffer.sample()
+    assert states.shape == (batch_size, burn_in + seq_len, 2)
+    assert mask.shape == (batch_size, burn_in + seq_len, 1)
+    states, steps, mask = states.asnumpy(), steps.asnumpy()[..., 0], mask.asnumpy()[..., 0]
+    assert np.array_equal(mask, steps > 0)
+    for window_states, window_steps, window_mask in zip(states, steps, mask):
+        valid = window_steps[window_mask > 0]
+        assert np.array_equal(valid, np.arange(valid[0], valid[0] + len(valid)))
+        assert np.all(window_states[window_mask > 0] == window_states[window_mask > 0][0])
+        assert np.all(window_mask[burn_in:] > 0)
+
+
+if __name__ == "__main__":
+    test_episode_replay_buffer()
@@ -0,0 +1,82 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for GymEnvironment.
+'''
+
+import pytest
+import numpy as np
+from mindspore import Tensor
+from mindspore_rl.environment import GymEnvironment
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_action_repeat():
+    '''
+    Feature: Test the action repeat of GymEnvironment.
+    Description: Step once with the action repeated 3 times, and step 3 times without repeat.
+    Expectation: the same state, and the reward is the sum of the rewards.
+    '''
+
+    env = GymEnvironment({'name': 'CartPole-v0', 'seed': 42})
+    repeat_env = GymEnvironment({'name': 'CartPole-v0', 'seed': 42, 'action_repeat': 3})
+    assert np.allclose(env.reset().asnumpy(), repeat_env.reset().asnumpy())
+    action = Tensor(np.array(1, np.int32))
+    for _ in range(3):
+        state, _, _ = env.step(action)
+    repeat_state, repeat_reward, done = repeat_env.step(action)
+    assert np.allclose(state.asnumpy(), repeat_state.asnumpy())
+    assert repeat_reward.asnumpy()[0] == 3
+    assert not done.asnumpy()[0]
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_rollout():
+    '''
+    Feature: Test the multi-step rollout of GymEnvironment.
+    Description: Run 100 steps in one call by a NumPy MLP policy.
+    Expectation: the stacked transitions are chained, and the finished episodes are reset.
+    '''
+
+    steps = 100
+    env = GymEnvironment({'name': 'CartPole-v0', 'seed': 42, 'rollout_steps': steps,
+                          'rollout_policy': {'layer_sizes': [4, 16, 2], 'seed': 42}})
+    num_params = 4 * 16 + 16 + 16 * 2 + 2
+    policy_params = Tensor(np.random.default_rng(42).normal(0, 0.1, num_params).astype(np.float32))
+    states, actions, rewards, dones, next_states = [x.asnumpy() for x in env.rollout(policy_params)]
+    assert states.shape == (steps, 4) and next_states.shape == (steps, 4)
+    assert actions.shape == (steps,) and rewards.shape == (steps, 1) and dones.shape == (steps, 1)
+    assert np.all((actions == 0) | (actions == 1))
+    assert np.any(dones)
+    dones = dones.reshape(-1)
+    # The next state is the state of the next step, unless the episode finishes.
+    assert np.allclose(next_states[:-1][~dones[:-1]], states[1:][~dones[:-1]])
+    # The initial states of CartPole are sampled in [-0.05, 0.05].
+    assert np.all(np.abs(states[1:][dones[:-1]]) <= 0.05)
+
+
+if __name__ == "__main__":
+    test_action_repeat()
+    test_rollout()
@@ -0,0 +1,202 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for MCTS.
+'''
+
+import pytest
+import numpy as np
+import mindspore as ms
+from mindspore import context
+from mindspore import Tensor
+from mindspore_rl.environment import TicTacToeEnvironment, BatchTicTacToeEnvironment
+from mindspore_rl.utils.mcts import MCTS, VanillaFunc, BatchVanillaFunc, RandomRolloutFunc
+from mindspore_rl.utils.mcts.mcts import VANILLA, COMMON, TIC_TAC_TOE
+
+
+def create_env(moves):
+    '''Create the Tic-Tac-Toe which plays the moves.'''
+    env = TicTacToeEnvironment(None)
+    env.reset()
+    for move in moves:
+        env.step(Tensor([move], ms.int32))
+    return env
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+@pytest.mark.parametrize('num_threads', [1, 4])
+def test_parallel_search(num_threads):
+    '''
+    Feature: Test the tree-parallel search of MCTS.
+    Description: Search the boards where player one can win at once, or has to block player two.
+    Expectation: the winning action and the blocking action.
+    '''
+
+    context.set_context(mode=context.GRAPH_MODE, device_target='CPU')
+    uct = Tensor(2.0, ms.float32)
+    for moves, expected in [([0, 3, 1, 4], 2), ([0, 3, 6, 4], 5)]:
+        env = create_env(moves)
+        mcts = MCTS(env, COMMON, VANILLA, -1, 2000, env.observation_space.shape, VanillaFunc(env),
+                    TIC_TAC_TOE, num_threads)
+        action = mcts.mcts_parallel_search(uct)
+        assert np.all(action.asnumpy() == expected)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_random_rollout_search():
+    '''
+    Feature: Test the MCTS whose simulation is the random rollout of the batched Tic-Tac-Toe.
+    Description: Search the boards where player one can win at once, or has to block player two.
+    Expectation: the winning action and the blocking action.
+    '''
+
+    context.set_context(mode=context.GRAPH_MODE, device_target='CPU')
+    uct = Tensor(2.0, ms.float32)
+    for moves, expected in [([0, 3, 1, 4], 2), ([0, 3, 6, 4], 5)]:
+        env = create_env(moves)
+        rollout_env = BatchTicTacToeEnvironment({'environment_num': 1, 'seed': 1})
+        mcts = MCTS(env, COMMON, VANILLA, -1, 2000, env.observation_space.shape, RandomRolloutFunc(rollout_env))
+        action = mcts.mcts_search(uct)
+        assert np.all(action.asnumpy() == expected)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_batch_search():
+    '''
+    Feature: Test the batched leaf evaluation of MCTS.
+    Description: Search the boards by evaluating 8 leaves in each iteration with the batched Tic-Tac-Toe.
+    Expectation: the winning action and the blocking action.
+    '''
+
+    context.set_context(mode=context.GRAPH_MODE, device_target='CPU')
+    uct = Tensor(2.0, ms.float32)
+    for moves, expected in [([0, 3, 1, 4], 2), ([0, 3, 6, 4], 5)]:
+        env = create_env(moves)
+        batch_env = BatchTicTacToeEnvironment({'environment_num': 8, 'seed': 1})
+        mcts = MCTS(env, COMMON, VANILLA, -1, 2000, env.observation_space.shape, BatchVanillaFunc(batch_env),
+                    batch_env=batch_env)
+        action = mcts.mcts_batch_search(uct)
+        assert np.all(action.asnumpy() == expected)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_subtree_reuse():
+    '''
+    Feature: Test the subtree reuse of MCTS.
+    Description: Search a tree, advance its root by the moves of both players, and search the subtree again.
+    Expectation: the winning action of the subtree.
+    '''
+
+    context.set_context(mode=context.GRAPH_MODE, device_target='CPU')
+    uct = Tensor(2.0, ms.float32)
+    env = create_env([0, 3])
+    mcts = MCTS(env, COMMON, VANILLA, -1, 1000, env.observation_space.shape, VanillaFunc(env))
+    tree_handle = mcts.create_tree(uct)
+    mcts.search_tree(tree_handle)
+    for move in [1, 4]:
+        env.step(Tensor([move], ms.int32))
+        assert mcts.advance_root(tree_handle, Tensor([move], ms.int32)).asnumpy().all()
+    action = mcts.search_tree(tree_handle)
+    mcts.release_tree(tree_handle)
+    assert np.all(action.asnumpy() == 2)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_tree_memory():
+    '''
+    Feature: Test the memory of the MCTS tree.
+    Description: Search the empty board, and advance the root by a move.
+    Expectation: the nodes of the search and of the kept subtree are counted, and each node takes a few hundred bytes.
+    '''
+
+    context.set_context(mode=context.GRAPH_MODE, device_target='CPU')
+    uct = Tensor(2.0, ms.float32)
+    env = create_env([])
+    mcts = MCTS(env, COMMON, VANILLA, -1, 2000, env.observation_space.shape, VanillaFunc(env), TIC_TAC_TOE, 1)
+    tree_handle = mcts.create_tree(uct)
+    mcts.search_tree(tree_handle)
+    num_nodes, num_bytes = mcts.tree_memory(tree_handle).asnumpy().tolist()
+    assert num_nodes > 2000
+    assert num_bytes < 512 * num_nodes
+    env.step(Tensor([4], ms.int32))
+    assert mcts.advance_root(tree_handle, Tensor([4], ms.int32)).asnumpy().all()
+    num_subtree_nodes, subtree_bytes = mcts.tree_memory(tree_handle).asnumpy().tolist()
+    mcts.release_tree(tree_handle)
+    assert 0 < num_subtree_nodes < num_nodes
+    assert subtree_bytes == num_bytes
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_multi_root_search():
+    '''
+    Feature: Test the multi-root batched search of MCTS.
+    Description: Search a tree for each game of the batched Tic-Tac-Toe in lockstep, one of which is over.
+    Expectation: the winning action, the blocking action, -1 for the game which is over, and the games are restored.
+    '''
+
+    context.set_context(mode=context.GRAPH_MODE, device_target='CPU')
+    uct = Tensor(2.0, ms.float32)
+    env = create_env([])
+    batch_env = BatchTicTacToeEnvironment({'environment_num': 3, 'seed': 1})
+    batch_env.reset()
+    # The games play [0, 3, 1, 4], [0, 3, 6, 4] and [0, 3, 1, 4, 2], where -1 is not played.
+    for moves in [[0, 0, 0], [3, 3, 3], [1, 6, 1], [4, 4, 4], [-1, -1, 2]]:
+        batch_env.step(Tensor(moves, ms.int32).reshape((3, 1)))
+    boards = batch_env.save().asnumpy()
+    mcts = MCTS(env, COMMON, VANILLA, -1, 1000, env.observation_space.shape, BatchVanillaFunc(batch_env),
+                batch_env=batch_env)
+    action = mcts.mcts_multi_root_search(uct)
+    assert np.all(action.asnumpy() == [2, 5, -1])
+    assert np.all(batch_env.save().asnumpy() == boards)
+
+
+if __name__ == "__main__":
+    test_parallel_search(1)
+    test_parallel_search(4)
+    test_random_rollout_search()
+    test_batch_search()
+    test_subtree_reuse()
+    test_tree_memory()
+    test_multi_root_search()
@@ -0,0 +1,71 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for MmapReplayBuffer.
+'''
+
+import tempfile
+import pytest
+import numpy as np
+import mindspore
+from mindspore import Tensor
+from mindspore_rl.core import MmapReplayBuffer
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_mmap_replay_buffer(tmp_path):
+    '''
+    Feature: Test memory-mapped replay buffer.
+    Description: Insert more elements than the capacity, then sample and get items.
+    Expectation: success.
+    '''
+
+    capacity = 10
+    batch_size = 8
+    shapes = [(4,), (1,)]
+    types = [mindspore.float32, mindspore.int32]
+    replay_buffer = MmapReplayBuffer(batch_size, capacity, shapes, types, directory=str(tmp_path),
+                                     hot_size=3, seed=1)
+    assert not replay_buffer.full()
+
+    # Insert 23 elements, the hot window is flushed several times and the buffer wraps around.
+    for i in range(23):
+        replay_buffer.insert([Tensor(np.full((4,), i), mindspore.float32), Tensor([i], mindspore.int32)])
+    assert replay_buffer.full()
+    assert replay_buffer.size().asnumpy() == capacity
+
+    # The oldest element is 13 and the latest one is 22.
+    for index in range(capacity):
+        state, action = replay_buffer.get_item(Tensor(index, mindspore.int32))
+        assert action.asnumpy()[0] == 13 + index
+        assert np.allclose(state.asnumpy(), 13 + index)
+
+    states, actions = replay_buffer.sample()
+    assert states.shape == (batch_size, 4)
+    assert np.all(actions.asnumpy() >= 13)
+    assert np.allclose(states.asnumpy()[:, 0], actions.asnumpy()[:, 0])
+
+    replay_buffer.reset()
+    assert replay_buffer.size().asnumpy() == 0
+    replay_buffer.destroy()
+
+
+if __name__ == "__main__":
+    test_mmap_replay_buffer(tempfile.mkdtemp())
@@ -0,0 +1,329 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for MultiEnvironmentWrapper.
+'''
+
+import pytest
+import numpy as np
+from mindspore import Tensor
+from mindspore_rl.environment import GymEnvironment, MultiEnvironmentWrapper, EnvironmentFactory, EnvironmentPool
+
+
+def create_wrapper(num_envs, num_proc, transport, num_ready=None, auto_reset=False):
+    '''Create the wrapper of the CartPole environments with fixed seeds.'''
+    envs = [GymEnvironment({'name': 'CartPole-v0', 'seed': 42}, i) for i in range(num_envs)]
+    return MultiEnvironmentWrapper(envs, num_proc, transport, num_ready, auto_reset, auto_reset)
+
+
+class UnpicklableEnvironment(GymEnvironment):
+    '''The GymEnvironment which can not be pickled, so it can not be moved to another process.'''
+
+    def __reduce__(self):
+        raise TypeError("UnpicklableEnvironment can not be pickled")
+
+
+def close_wrapper(wrapper):
+    '''Terminate the environment processes.'''
+    for env_proc in wrapper.mpe_env_procs:
+        env_proc.terminate()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_shared_memory_transport():
+    '''
+    Feature: Test the shared memory transport of MultiEnvironmentWrapper.
+    Description: Step the same environments by the queue and the shared memory transports.
+    Expectation: the same observations, rewards and dones.
+    '''
+
+    num_envs = 8
+    queue_wrapper = create_wrapper(num_envs, 4, 'queue')
+    shared_wrapper = create_wrapper(num_envs, 4, 'shared_memory')
+    assert np.allclose(queue_wrapper.reset().asnumpy(), shared_wrapper.reset().asnumpy())
+    for step in range(10):
+        action = Tensor(np.full((num_envs,), step % 2, np.int32))
+        for expected, actual in zip(queue_wrapper.step(action), shared_wrapper.step(action)):
+            assert np.allclose(expected.asnumpy(), actual.asnumpy())
+    close_wrapper(queue_wrapper)
+    close_wrapper(shared_wrapper)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_async_stepping():
+    '''
+    Feature: Test the asynchronous stepping of MultiEnvironmentWrapper.
+    Description: Receive the first ready environments and send their actions repeatedly.
+    Expectation: the environments are returned by process, and every environment is stepped.
+    '''
+
+    num_envs = 8
+    num_ready = 4
+    wrapper = create_wrapper(num_envs, 4, 'shared_memory', num_ready)
+    initial_state = wrapper.reset().asnumpy()
+
+    # All the environments are ready after reset, and returned with zero rewards.
+    received = []
+    for _ in range(num_envs // num_ready):
+        state, reward, _, env_id = wrapper.recv()
+        env_id = env_id.asnumpy()
+        assert np.allclose(state.asnumpy(), initial_state[env_id])
+        assert np.all(reward.asnumpy() == 0)
+        received.extend(env_id)
+        wrapper.send(Tensor(np.zeros((num_ready,), np.int32)), Tensor(env_id))
+    assert sorted(received) == list(range(num_envs))
+
+    steps = np.zeros((num_envs,), np.int32)
+    for _ in range(10):
+        _, reward, _, env_id = wrapper.recv()
+        env_id = env_id.asnumpy()
+        assert len(np.unique(env_id)) == num_ready
+        assert np.all(env_id[::2] % 2 == 0) and np.all(env_id[1::2] == env_id[::2] + 1)
+        assert reward.shape == (num_ready, 1)
+        steps[env_id] += 1
+        wrapper.send(Tensor(np.zeros((num_ready,), np.int32)), Tensor(env_id))
+    assert steps.sum() == 10 * num_ready
+
+    # The steps in flight are dropped by reset.
+    wrapper.reset()
+    _, reward, _, _ = wrapper.recv()
+    assert np.all(reward.asnumpy() == 0)
+    close_wrapper(wrapper)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+@pytest.mark.parametrize('transport', ['queue', 'shared_memory'])
+def test_auto_reset(transport):
+    '''
+    Feature: Test the automatic reset of MultiEnvironmentWrapper.
+    Description: Push the carts to one side until the episodes finish, without calling reset.
+    Expectation: the finished environments return new initial states and the terminal states.
+    '''
+
+    num_envs = 4
+    wrapper = create_wrapper(num_envs, 2, transport, auto_reset=True)
+    wrapper.reset()
+    action = Tensor(np.zeros((num_envs,), np.int32))
+    finished = np.zeros((num_envs,), np.bool_)
+    for _ in range(50):
+        state, _, done, terminal_state = wrapper.step(action)
+        done = done.asnumpy().reshape(-1)
+        state, terminal_state = state.asnumpy(), terminal_state.asnumpy()
+        # The initial states of CartPole are sampled in [-0.05, 0.05].
+        assert np.all(np.abs(state[done]) <= 0.05)
+        assert np.allclose(state[~done], terminal_state[~done])
+        finished |= done
+    assert np.all(finished)
+    close_wrapper(wrapper)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+@pytest.mark.parametrize('transport', ['queue', 'shared_memory'])
+def test_rebalance(transport):
+    '''
+    Feature: Test the scheduling of the environments over the processes of MultiEnvironmentWrapper.
+    Description: Spread 7 environments over 3 processes, rebalance them in the middle of the episodes.
+    Expectation: the same results as a single process, and every process keeps at least one environment.
+    '''
+
+    num_envs = 7
+    expected_wrapper = create_wrapper(num_envs, 1, 'queue')
+    wrapper = create_wrapper(num_envs, 3, transport)
+    assert wrapper.process_stats()['env_num'] == [3, 2, 2]
+    assert np.allclose(expected_wrapper.reset().asnumpy(), wrapper.reset().asnumpy())
+    for step in range(10):
+        action = Tensor(np.full((num_envs,), step % 2, np.int32))
+        for expected, actual in zip(expected_wrapper.step(action), wrapper.step(action)):
+            assert np.allclose(expected.asnumpy(), actual.asnumpy())
+        if step == 4:
+            assert wrapper.process_stats()['steps'] == [5, 5, 5]
+            env_nums = wrapper.rebalance(tolerance=0)
+            assert sum(env_nums) == num_envs and min(env_nums) >= 1
+            assert wrapper.process_stats()['steps'] == [0, 0, 0]
+    close_wrapper(wrapper)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_rebalance_unpicklable():
+    '''
+    Feature: Test the rebalance of MultiEnvironmentWrapper with the environments which can not be pickled.
+    Description: Rebalance 7 environments over 3 processes, where the environments 2 and 3 at the boundary of
+        the first two processes can not be pickled.
+    Expectation: the boundary is kept, and the same results as a single process after the rebalances.
+    '''
+
+    num_envs = 7
+    expected_wrapper = create_wrapper(num_envs, 1, 'queue')
+    envs = [(UnpicklableEnvironment if i in (2, 3) else GymEnvironment)({'name': 'CartPole-v0', 'seed': 42}, i)
+            for i in range(num_envs)]
+    wrapper = MultiEnvironmentWrapper(envs, 3, 'shared_memory', start_method='fork')
+    assert np.allclose(expected_wrapper.reset().asnumpy(), wrapper.reset().asnumpy())
+    for step in range(15):
+        action = Tensor(np.full((num_envs,), step % 2, np.int32))
+        for expected, actual in zip(expected_wrapper.step(action), wrapper.step(action)):
+            assert np.allclose(expected.asnumpy(), actual.asnumpy())
+        if step % 5 == 4:
+            env_nums = wrapper.rebalance(tolerance=0)
+            assert sum(env_nums) == num_envs and env_nums[0] == 3
+            assert wrapper.process_stats()['steps'] == [0, 0, 0]
+    close_wrapper(wrapper)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_environment_factory():
+    '''
+    Feature: Test the environment factories of MultiEnvironmentWrapper.
+    Description: Create the environments in the processes started by spawn at the first reset.
+    Expectation: the processes are not started before the reset, and the same results as the instances.
+    '''
+
+    num_envs = 4
+    expected_wrapper = create_wrapper(num_envs, 2, 'queue')
+    factories = [EnvironmentFactory(GymEnvironment, {'name': 'CartPole-v0', 'seed': 42}, i) for i in range(num_envs)]
+    wrapper = MultiEnvironmentWrapper(factories, 2, start_method='spawn', lazy=True)
+    assert not wrapper.mpe_env_procs
+    assert np.allclose(expected_wrapper.reset().asnumpy(), wrapper.reset().asnumpy())
+    assert len(wrapper.mpe_env_procs) == 2
+    for step in range(10):
+        action = Tensor(np.full((num_envs,), step % 2, np.int32))
+        for expected, actual in zip(expected_wrapper.step(action), wrapper.step(action)):
+            assert np.allclose(expected.asnumpy(), actual.asnumpy())
+    close_wrapper(expected_wrapper)
+    close_wrapper(wrapper)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_environment_pool():
+    '''
+    Feature: Test the reuse of the batch environments by EnvironmentPool.
+    Description: Acquire the batch environment of the same key again after releasing it.
+    Expectation: the processes are reused, reseeded to the initial states of a new batch environment, and
+        terminated when the pool is closed. The seed of a batch environment which is not started is kept.
+    '''
+
+    num_envs = 4
+    with EnvironmentPool() as pool:
+        wrapper = pool.acquire('cartpole', lambda: create_wrapper(num_envs, 2, 'shared_memory'), 42)
+        initial_state = wrapper.reset().asnumpy().copy()
+        wrapper.step(Tensor(np.ones((num_envs,), np.int32)))
+        pool.release(wrapper)
+        env_procs = list(wrapper.mpe_env_procs)
+        reused_wrapper = pool.acquire('cartpole', lambda: create_wrapper(num_envs, 2, 'shared_memory'), 42)
+        assert reused_wrapper is wrapper and len(pool) == 1
+        assert reused_wrapper.mpe_env_procs == env_procs
+        assert np.allclose(reused_wrapper.reset().asnumpy(), initial_state)
+        # The batch environment in use is not shared.
+        other_wrapper = pool.acquire('cartpole', lambda: create_wrapper(num_envs, 2, 'shared_memory'), 42)
+        assert other_wrapper is not wrapper and len(pool) == 2
+    assert not any(env_proc.is_alive() for env_proc in env_procs)
+
+    # The batch environment which is reseeded before its processes start uses the seed when they start.
+    factories = [EnvironmentFactory(GymEnvironment, {'name': 'CartPole-v0', 'seed': 7}, i) for i in range(num_envs)]
+    lazy_wrapper = MultiEnvironmentWrapper(factories, 2, lazy=True)
+    lazy_wrapper.reseed(42)
+    assert np.allclose(lazy_wrapper.reset().asnumpy(), initial_state)
+    close_wrapper(lazy_wrapper)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+@pytest.mark.parametrize('transport', ['queue', 'shared_memory'])
+def test_environment_stats(transport):
+    '''
+    Feature: Test the latency instrumentation of MultiEnvironmentWrapper.
+    Description: Step the instrumented environments, and summarize the latency histograms.
+    Expectation: the same results as the environments without instrumentation, every step and reset is
+        recorded, and the histograms are cleared.
+    '''
+
+    num_envs = 4
+    num_steps = 5
+    envs = [GymEnvironment({'name': 'CartPole-v0', 'seed': 42}, i) for i in range(num_envs)]
+    wrapper = MultiEnvironmentWrapper(envs, 2, transport, instrument=True)
+    expected_wrapper = create_wrapper(num_envs, 2, transport)
+    assert np.allclose(wrapper.reset().asnumpy(), expected_wrapper.reset().asnumpy())
+    for _ in range(num_steps):
+        action = Tensor(np.ones((num_envs,), np.int32))
+        for expected, actual in zip(expected_wrapper.step(action), wrapper.step(action)):
+            assert np.allclose(expected.asnumpy(), actual.asnumpy())
+
+    counts, total = wrapper.env_stats.histogram('step')
+    assert np.all(counts.sum(axis=1) == num_steps) and np.all(total > 0)
+    assert np.all(wrapper.env_stats.histogram('reset')[0].sum(axis=1) == 1)
+    # Each process waits for the reset and every step.
+    assert np.all(wrapper.env_stats.histogram('wait')[0].sum(axis=1) == num_steps + 1)
+    serialize_counts = wrapper.env_stats.histogram('serialize')[0].sum(axis=1)
+    assert np.all(serialize_counts == (num_steps + 1 if transport == 'queue' else 0))
+    stats = wrapper.environment_stats(clear=True)
+    assert stats['env_steps'] == num_envs * num_steps and stats['env_steps_per_sec'] > 0
+    assert 0 < stats['step_latency_p50'] <= stats['step_latency_p99']
+    assert 0 <= stats['straggler_env'] < num_envs
+    assert stats['straggler_process'] == stats['straggler_env'] // 2
+    assert wrapper.environment_stats()['env_steps'] == 0
+    close_wrapper(expected_wrapper)
+    close_wrapper(wrapper)
+
+
+if __name__ == "__main__":
+    test_shared_memory_transport()
+    test_async_stepping()
+    test_auto_reset('queue')
+    test_auto_reset('shared_memory')
+    test_rebalance('queue')
+    test_rebalance('shared_memory')
+    test_rebalance_unpicklable()
+    test_environment_factory()
+    test_environment_pool()
+    test_environment_stats('queue')
+    test_environment_stats('shared_memory')
@@ -0,0 +1,117 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for NStepReplayBuffer.
+'''
+
+import pytest
+import numpy as np
+import mindspore
+from mindspore import Tensor
+from mindspore_rl.core import NStepReplayBuffer, PriorityReplayBuffer
+
+
+def _insert_episodes(replay_buffer, dones):
+    '''Insert transitions whose state, action and reward are the step number.'''
+    for step, done in enumerate(dones):
+        replay_buffer.insert([Tensor([step], mindspore.float32), Tensor([step], mindspore.int32),
+                              Tensor([step], mindspore.float32), Tensor([step + 1], mindspore.float32),
+                              Tensor([done], mindspore.bool_)])
+
+
+def _expected(dones, n_step, gamma):
+    '''Compute the N-step transitions by definition.'''
+    expected = []
+    for step in range(len(dones)):
+        reward, discount, last = 0., 1., step
+        for k in range(n_step):
+            if step + k >= len(dones):
+                return expected
+            reward += discount * (step + k)
+            discount *= gamma
+            last = step + k
+            if dones[last]:
+                discount = 0.
+                break
+        expected.append((step, reward, last + 1, dones[last], discount))
+    return expected
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_nstep_replay_buffer():
+    '''
+    Feature: Test N-step return replay buffer.
+    Description: Insert two episodes with the ReplayBuffer backend.
+    Expectation: the N-step rewards, bootstrap states and discounts are correct.
+    '''
+
+    n_step, gamma = 3, 0.5
+    shapes = [(1,), (1,), (1,), (1,), (1,)]
+    types = [mindspore.float32, mindspore.int32, mindspore.float32, mindspore.float32, mindspore.bool_]
+    replay_buffer = NStepReplayBuffer(4, 100, shapes, types, n_step=n_step, gamma=gamma)
+    dones = [False, False, False, False, True, False, True, False, False, False]
+    _insert_episodes(replay_buffer, dones)
+
+    expected = _expected(dones, n_step, gamma)
+    assert replay_buffer.size() == len(expected)
+    for index, (state, reward, next_state, done, discount) in enumerate(expected):
+        element = replay_buffer.get_item(Tensor(index, mindspore.int32))
+        assert element[0].asnumpy()[0] == state
+        assert element[1].asnumpy()[0] == state
+        assert np.isclose(element[2].asnumpy()[0], reward)
+        assert element[3].asnumpy()[0] == next_state
+        assert element[4].asnumpy()[0] == done
+        assert np.isclose(element[5].asnumpy()[0], discount)
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_nstep_priority_replay_buffer():
+    '''
+    Feature: Test N-step return replay buffer with priority backend.
+    Description: Insert an episode with the PriorityReplayBuffer backend, then sample.
+    Expectation: the sampled transitions are N-step transitions.
+    '''
+
+    n_step, gamma = 2, 0.5
+    shapes = [(1,), (1,), (1,), (1,), (1,)]
+    types = [mindspore.float32, mindspore.int32, mindspore.float32, mindspore.float32, mindspore.bool_]
+    replay_buffer = NStepReplayBuffer(8, 100, shapes, types, n_step=n_step, gamma=gamma,
+                                      backend=PriorityReplayBuffer, backend_params={'alpha': 1., 'beta': 1.})
+    dones = [False] * 5 + [True]
+    _insert_episodes(replay_buffer, dones)
+
+    expected = {state: item for state, *item in _expected(dones, n_step, gamma)}
+    _, _, states, _, rewards, next_states, _, discounts = replay_buffer.sample()
+    for state, reward, next_state, discount in zip(states.asnumpy(), rewards.asnumpy(), next_states.asnumpy(),
+                                                   discounts.asnumpy()):
+        expected_reward, expected_next_state, _, expected_discount = expected[int(state[0])]
+        assert np.isclose(reward[0], expected_reward)
+        assert next_state[0] == expected_next_state
+        assert np.isclose(discount[0], expected_discount)
+
+
+if __name__ == "__main__":
+    test_nstep_replay_buffer()
+    test_nstep_priority_replay_buffer()
@@ -0,0 +1,65 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for PrefetchSampler.
+'''
+
+import pytest
+import numpy as np
+import mindspore
+from mindspore import Tensor
+from mindspore_rl.core import MmapReplayBuffer, PrefetchSampler
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_prefetch_sampler():
+    '''
+    Feature: Test background prefetching sampler.
+    Description: Insert and sample alternately, then reset the buffer.
+    Expectation: the sampled batches have the right shape, are sampled at most max_staleness insertions ago,
+                 and no batch sampled before reset is output.
+    '''
+
+    batch_size = 16
+    capacity = 8
+    max_staleness = 8
+    replay_buffer = MmapReplayBuffer(batch_size, capacity, [(1,)], [mindspore.int32], hot_size=64, seed=1)
+    sampler = PrefetchSampler(replay_buffer, size=4, max_staleness=max_staleness)
+
+    for i in range(100):
+        replay_buffer.insert([Tensor([i], mindspore.int32)])
+    for i in range(100, 200):
+        replay_buffer.insert([Tensor([i], mindspore.int32)])
+        (data,) = sampler.sample()
+        assert data.shape == (batch_size, 1)
+        # The buffer keeps the last `capacity` of the increasing elements, so a batch sampled at most
+        # `max_staleness` insertions ago only has the elements inserted after i - max_staleness - capacity.
+        data = data.asnumpy()
+        assert np.all(data <= i)
+        assert np.all(data > i - max_staleness - capacity)
+
+    # The batches sampled before reset are dropped.
+    replay_buffer.reset()
+    replay_buffer.insert([Tensor([1000], mindspore.int32)])
+    (data,) = sampler.sample()
+    assert np.all(data.asnumpy() == 1000)
+    sampler.close()
+    replay_buffer.destroy()
+
+
+if __name__ == "__main__":
+    test_prefetch_sampler()
@@ -0,0 +1,76 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for ReplayBuffer.
+'''
+
+import pytest
+import numpy as np
+import mindspore
+from mindspore import Tensor
+from mindspore_rl.core import ReplayBuffer
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_replay_buffer_insert_batch():
+    '''
+    Feature: Test replay buffer batched insertion.
+    Description: Insert several batches which wrap around the capacity.
+    Expectation: success.
+    '''
+
+    capacity = 5
+    shapes = [(2,), (1,)]
+    types = [mindspore.float32, mindspore.int32]
+    replay_buffer = ReplayBuffer(2, capacity, shapes, types)
+
+    def batch(start, n):
+        state = Tensor(np.arange(start, start + n).reshape(-1, 1).repeat(2, axis=1), mindspore.float32)
+        action = Tensor(np.arange(start, start + n).reshape(-1, 1), mindspore.int32)
+        return [state, action]
+
+    # Fill 3 slots, the buffer is not full yet.
+    replay_buffer.insert_batch(batch(0, 3), 3)
+    assert replay_buffer.count.asnumpy() == 3
+    assert replay_buffer.head.asnumpy() == 0
+
+    # Insert 4 more elements, 2 of them overwrite the oldest ones.
+    replay_buffer.insert_batch(batch(3, 4), 4)
+    assert replay_buffer.count.asnumpy() == capacity
+    assert replay_buffer.head.asnumpy() == 2
+    expect = np.array([5, 6, 2, 3, 4])
+    assert np.allclose(replay_buffer.buffer[1].asnumpy().reshape(-1), expect)
+    assert np.allclose(replay_buffer.buffer[0].asnumpy()[:, 0], expect)
+
+    # The batched insertion should be interchangeable with the single insertion.
+    single = ReplayBuffer(2, capacity, shapes, types)
+    for i in range(7):
+        single.insert([Tensor(np.full((2,), i), mindspore.float32), Tensor(np.full((1,), i), mindspore.int32)])
+    assert np.allclose(single.buffer[1].asnumpy().reshape(-1), expect)
+    assert single.head.asnumpy() == replay_buffer.head.asnumpy()
+
+    states, actions = replay_buffer.sample()
+    assert states.shape == (2, 2)
+    assert actions.shape == (2, 1)
+    assert np.all(np.isin(actions.asnumpy(), expect))
+
+
+if __name__ == "__main__":
+    test_replay_buffer_insert_batch()
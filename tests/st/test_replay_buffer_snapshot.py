@@ -0,0 +1,98 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for the snapshot and restore of replay buffers.
+'''
+
+import pathlib
+import tempfile
+import pytest
+import numpy as np
+import mindspore
+from mindspore import Tensor
+from mindspore_rl.core import ReplayBuffer, HostPriorityReplayBuffer
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_replay_buffer_snapshot(tmp_path):
+    '''
+    Feature: Test the snapshot of replay buffer.
+    Description: Save a wrapped around replay buffer in background and restore it into a new buffer.
+    Expectation: success.
+    '''
+
+    capacity = 10
+    shapes = [(4,), (1,)]
+    types = [mindspore.float32, mindspore.int32]
+    replay_buffer = ReplayBuffer(4, capacity, shapes, types)
+    for i in range(13):
+        replay_buffer.insert([Tensor(np.full((4,), i), mindspore.float32), Tensor([i], mindspore.int32)])
+    writer = replay_buffer.snapshot(str(tmp_path / 'replay_buffer'), chunk_size=3, background=True)
+    writer.join()
+
+    restored = ReplayBuffer(4, capacity, shapes, types)
+    restored.restore(str(tmp_path / 'replay_buffer'))
+    assert restored.count.asnumpy() == replay_buffer.count.asnumpy()
+    assert restored.head.asnumpy() == replay_buffer.head.asnumpy()
+    for column, expected in zip(restored.buffer, replay_buffer.buffer):
+        assert np.array_equal(column.asnumpy(), expected.asnumpy())
+
+    with pytest.raises(ValueError):
+        ReplayBuffer(4, capacity + 1, shapes, types).restore(str(tmp_path / 'replay_buffer'))
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_host_priority_replay_buffer_snapshot(tmp_path):
+    '''
+    Feature: Test the snapshot of host priority replay buffer.
+    Description: Save the transitions and priorities, and restore them into a new buffer.
+    Expectation: success.
+    '''
+
+    capacity = 10
+    shapes = [(4,), (1,)]
+    types = [mindspore.float32, mindspore.int32]
+    replay_buffer = HostPriorityReplayBuffer(0.6, 0.4, capacity, 4, shapes, types, seed0=0, seed1=1)
+    for i in range(13):
+        replay_buffer.push(Tensor(np.full((4,), i), mindspore.float32), Tensor([i], mindspore.int32))
+    replay_buffer.update_priorities(Tensor([1, 2, 3, 4], mindspore.int64),
+                                    Tensor([5., 1., 2., 3.], mindspore.float32))
+    replay_buffer.snapshot(str(tmp_path / 'replay_buffer'), chunk_size=3)
+
+    restored = HostPriorityReplayBuffer(0.6, 0.4, capacity, 4, shapes, types, seed0=0, seed1=1)
+    restored.restore(str(tmp_path / 'replay_buffer'))
+    indices = np.arange(capacity)
+    assert np.allclose(restored.sum_tree.get(indices), replay_buffer.sum_tree.get(indices))
+    assert np.isclose(restored.min_tree.root, replay_buffer.min_tree.root)
+
+    expected = replay_buffer.sample()
+    actual = restored.sample()
+    for x, y in zip(expected, actual):
+        assert np.allclose(x.asnumpy(), y.asnumpy())
+
+
+if __name__ == "__main__":
+    test_replay_buffer_snapshot(pathlib.Path(tempfile.mkdtemp()))
+    test_host_priority_replay_buffer_snapshot(pathlib.Path(tempfile.mkdtemp()))
@@ -0,0 +1,117 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for SharedReplayBuffer.
+'''
+
+import multiprocessing
+import pytest
+import numpy as np
+import mindspore
+from mindspore import Tensor
+from mindspore_rl.core import SharedReplayBuffer
+
+
+def actor(writer, num):
+    '''Write `num` elements tagged with the shard to the shard.'''
+    for i in range(num):
+        writer.insert(np.full((3,), writer.shard * 1000 + i, np.float32), np.array([writer.shard], np.int32))
+    writer.close()
+
+
+def counting_actor(writer, num):
+    '''Write `num` elements whose columns are both the index of the element.'''
+    for i in range(num):
+        writer.insert(np.full((64,), i, np.float32), np.array([i], np.int32))
+    writer.close()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_shared_replay_buffer():
+    '''
+    Feature: Test shared memory sharded replay buffer.
+    Description: Write the shards from actor processes, then sample and get items in the learner.
+    Expectation: success.
+    '''
+
+    num_shards = 4
+    batch_size = 64
+    replay_buffer = SharedReplayBuffer(batch_size, 40, [(3,), (1,)], [mindspore.float32, mindspore.int32],
+                                       num_shards=num_shards, seed=1)
+    actors = [multiprocessing.Process(target=actor, args=(replay_buffer.writer(i), 5 + 10 * i))
+              for i in range(num_shards)]
+    for process in actors:
+        process.start()
+    for process in actors:
+        process.join()
+
+    # The shards 1, 2 and 3 are full, and their slots which are going to be overwritten are excluded.
+    assert np.all(replay_buffer.shard_sizes() == [5, 9, 9, 9])
+    assert replay_buffer.size().asnumpy() == 32
+    assert not replay_buffer.full()
+
+    states, shards = replay_buffer.sample()
+    assert states.shape == (batch_size, 3)
+    assert np.all(states.asnumpy()[:, 0] // 1000 == shards.asnumpy()[:, 0])
+
+    # The items are ordered by shard, and from the oldest to the latest in a shard.
+    state, shard = replay_buffer.get_item(Tensor(5, mindspore.int32))
+    assert shard.asnumpy()[0] == 1
+    assert np.allclose(state.asnumpy(), 1006)
+
+    replay_buffer.reset()
+    assert replay_buffer.size().asnumpy() == 0
+    replay_buffer.destroy()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_shared_replay_buffer_concurrent_write():
+    '''
+    Feature: Test sampling the shared memory replay buffer while an actor keeps writing.
+    Description: Sample a small shard which is overwritten many times during the sampling.
+    Expectation: the columns of each sampled element belong to the same element, and the capacity which is not
+                 a multiple of num_shards is rejected.
+    '''
+
+    with pytest.raises(ValueError):
+        SharedReplayBuffer(4, 10, [(1,)], [mindspore.int32], num_shards=3)
+
+    batch_size = 256
+    replay_buffer = SharedReplayBuffer(batch_size, 16, [(64,), (1,)], [mindspore.float32, mindspore.int32],
+                                       seed=1)
+    process = multiprocessing.Process(target=counting_actor, args=(replay_buffer.writer(0), 200000))
+    process.start()
+    while replay_buffer.size().asnumpy() == 0:
+        pass
+    while process.is_alive():
+        states, indices = replay_buffer.sample()
+        assert np.all(states.asnumpy() == indices.asnumpy())
+    process.join()
+    replay_buffer.destroy()
+
+
+if __name__ == "__main__":
+    test_shared_replay_buffer()
+    test_shared_replay_buffer_concurrent_write()
@@ -0,0 +1,87 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+'''
+Test case for BatchTicTacToeEnvironment.
+'''
+
+import pytest
+import numpy as np
+from mindspore import Tensor
+from mindspore_rl.environment import TicTacToeEnvironment, BatchTicTacToeEnvironment
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_batch_tic_tac_toe():
+    '''
+    Feature: Test the batched Tic-Tac-Toe.
+    Description: Play the same random moves in the batched games and in the single games.
+    Expectation: the same legal actions, current players, boards, rewards and dones.
+    '''
+
+    num_games = 32
+    batch_env = BatchTicTacToeEnvironment({'environment_num': num_games})
+    envs = [TicTacToeEnvironment(None) for _ in range(num_games)]
+    batch_env.reset()
+    rng = np.random.default_rng(42)
+    for _ in range(9):
+        legal_action = batch_env.legal_action().asnumpy()
+        current_player = batch_env.current_player().asnumpy()
+        action = np.array([rng.choice(legal[legal >= 0]) if np.any(legal >= 0) else 0
+                           for legal in legal_action], np.int32)
+        state, reward, done = [x.asnumpy() for x in batch_env.step(Tensor(action[:, None]))]
+        for i, env in enumerate(envs):
+            if env.is_terminal().asnumpy()[0]:
+                continue
+            assert np.all(env.legal_action().asnumpy() == legal_action[i])
+            assert env.current_player().asnumpy() == current_player[i]
+            expected_state, expected_reward, expected_done = env.step(Tensor(action[i:i + 1]))
+            assert np.all(expected_state.asnumpy() == state[i])
+            assert np.all(expected_reward.asnumpy() == reward[i])
+            assert expected_done.asnumpy()[0] == done[i, 0]
+    assert np.all(done)
+    assert np.all(batch_env.is_terminal().asnumpy())
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_gpu_training
+@pytest.mark.platform_x86_ascend_training
+@pytest.mark.platform_arm_ascend_training
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_random_rollout():
+    '''
+    Feature: Test the random rollout of the batched Tic-Tac-Toe.
+    Description: Play 10000 games from the empty boards by the uniform random players.
+    Expectation: the first player wins about 58.5% of the games, and 12.7% are draws.
+    '''
+
+    num_games = 10000
+    batch_env = BatchTicTacToeEnvironment({'environment_num': num_games, 'seed': 42})
+    reward = batch_env.random_rollout(batch_env.reset()).asnumpy()
+    assert abs(np.mean(reward[:, 0] == 1) - 0.585) < 0.03
+    assert abs(np.mean(reward[:, 0] == 0) - 0.127) < 0.03
+    assert np.all(reward[:, 0] == -reward[:, 1])
+    # The boards of the environment are not changed.
+    assert np.all(batch_env.save().asnumpy() == 0)
+
+
+if __name__ == "__main__":
+    test_batch_tic_tac_toe()
+    test_random_rollout()